@@ -29,6 +29,8 @@ async def build_index(
     memory_profile: bool = False,
     callbacks: list[WorkflowCallbacks] | None = None,
     progress_logger: ProgressLogger | None = None,
+    resume: bool = False,
+    retry_failed: bool = False,
 ) -> list[PipelineRunResult]:
     """Run the pipeline with the given configuration.
 
@@ -44,6 +46,10 @@ async def build_index(
         A list of callbacks to register.
     progress_logger : ProgressLogger | None default=None
         The progress logger.
+    resume : bool default=False
+        Skip workflows whose outputs were already produced by a previous run with the same inputs and configuration.
+    retry_failed : bool default=False
+        Resume a previous run, re-running the workflows that left failed rows in the `failed_rows` table.
 
     Returns
     -------
@@ -73,6 +79,8 @@ async def build_index(
         callbacks=callbacks,
         logger=progress_logger,
         is_update_run=is_update_run,
+        resume=resume,
+        retry_failed=retry_failed,
     ):
         outputs.append(output)
         if progress_logger:
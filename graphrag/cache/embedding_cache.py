@@ -0,0 +1,96 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'EmbeddingCache' model."""
+
+import asyncio
+from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from typing import Any, TypeVar
+
+import numpy as np
+
+from graphrag.cache.pipeline_cache import PipelineCache
+
+EMBEDDING_CACHE_NAMESPACE = "embeddings"
+"""The child cache holding one vector per embedded text."""
+
+T = TypeVar("T")
+
+
+class EmbeddingCache:
+    """A content-addressed cache of text embeddings, keyed by model and text.
+
+    Each text is cached on its own, under a hash of the model, deployment, API base
+    and dimensions and of the text with its whitespace normalized, so a lookup hits
+    no matter how the text was batched when it was embedded, or whether it was
+    embedded while indexing or querying. Lookups and writes run `batch_size` texts
+    at a time.
+    """
+
+    def __init__(
+        self,
+        cache: PipelineCache,
+        model: str,
+        deployment_name: str | None = None,
+        api_base: str | None = None,
+        dimensions: int | None = None,
+        batch_size: int = 16,
+    ):
+        self._cache = cache.child(EMBEDDING_CACHE_NAMESPACE)
+        self._prefix = "\n".join([
+            model,
+            deployment_name or "",
+            api_base or "",
+            str(dimensions or ""),
+        ])
+        self._batch_size = batch_size
+
+    def key(self, text: str) -> str:
+        """Get the cache key of a text."""
+        normalized = " ".join(text.split())
+        return sha256(f"{self._prefix}\n{normalized}".encode()).hexdigest()
+
+    async def get(self, texts: list[str]) -> list[list[float] | None]:
+        """Get the cached embedding of each text, or None."""
+        results: list[list[float] | None] = []
+        for start in range(0, len(texts), self._batch_size):
+            results.extend(
+                await asyncio.gather(*[
+                    self._cache.get(self.key(text))
+                    for text in texts[start : start + self._batch_size]
+                ])
+            )
+        return results
+
+    async def set(self, texts: list[str], embeddings: list[Any]) -> None:
+        """Cache the embedding of each text."""
+        entries = [
+            (text, embedding)
+            for text, embedding in zip(texts, embeddings, strict=True)
+            if embedding is not None and len(embedding) > 0
+        ]
+        for start in range(0, len(entries), self._batch_size):
+            await asyncio.gather(*[
+                self._cache.set(self.key(text), np.asarray(embedding).tolist())
+                for text, embedding in entries[start : start + self._batch_size]
+            ])
+
+    def get_sync(self, texts: list[str]) -> list[list[float] | None]:
+        """Get the cached embedding of each text from synchronous code."""
+        return _run_sync(self.get(texts))
+
+    def set_sync(self, texts: list[str], embeddings: list[Any]) -> None:
+        """Cache the embedding of each text from synchronous code."""
+        _run_sync(self.set(texts, embeddings))
+
+
+def _run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    # called from a running event loop, run the lookup in a loop of its own
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
 from graphrag.config.enums import CacheType
@@ -18,6 +19,8 @@ if TYPE_CHECKING:
 from graphrag.cache.json_pipeline_cache import JsonPipelineCache
 from graphrag.cache.memory_pipeline_cache import InMemoryCache
 from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.cache.sqlite_pipeline_cache import create_sqlite_cache
+from graphrag.cache.tiered_pipeline_cache import TieredPipelineCache
 
 
 class CacheFactory:
@@ -40,7 +43,23 @@ class CacheFactory:
     def create_cache(
         cls, cache_type: CacheType | str | None, root_dir: str, kwargs: dict
     ) -> PipelineCache:
-        """Create or get a cache from the provided type."""
+        """Create or get a cache from the provided type.
+
+        When `memory_max_bytes` is set, persistent caches are fronted by a bounded
+        in-memory LRU tier.
+        """
+        cache = cls._create_persistent_cache(cache_type, root_dir, kwargs)
+        memory_max_bytes = kwargs.get("memory_max_bytes")
+        if memory_max_bytes and not isinstance(
+            cache, InMemoryCache | NoopPipelineCache
+        ):
+            return TieredPipelineCache(cache, memory_max_bytes)
+        return cache
+
+    @classmethod
+    def _create_persistent_cache(
+        cls, cache_type: CacheType | str | None, root_dir: str, kwargs: dict
+    ) -> PipelineCache:
         if not cache_type:
             return NoopPipelineCache()
         match cache_type:
@@ -56,6 +75,8 @@ class CacheFactory:
                 return JsonPipelineCache(create_blob_storage(**kwargs))
             case CacheType.cosmosdb:
                 return JsonPipelineCache(create_cosmosdb_storage(**kwargs))
+            case CacheType.sqlite:
+                return create_sqlite_cache(Path(root_dir) / kwargs["base_dir"])
             case _:
                 if cache_type in cls.cache_types:
                     return cls.cache_types[cache_type](**kwargs)
@@ -63,3 +63,11 @@ class JsonPipelineCache(PipelineCache):
     def child(self, name: str) -> "JsonPipelineCache":
         """Child method definition."""
         return JsonPipelineCache(self._storage.child(name), encoding=self._encoding)
+
+    def keys(self) -> list[str]:
+        """Keys method definition."""
+        return self._storage.keys()
+
+    def size(self) -> int | None:
+        """Size method definition."""
+        return self._storage.size()
@@ -14,9 +14,9 @@ class InMemoryCache(PipelineCache):
     _cache: dict[str, Any]
     _name: str
 
-    def __init__(self, name: str | None = None):
+    def __init__(self, name: str | None = None, cache: dict[str, Any] | None = None):
         """Init method definition."""
-        self._cache = {}
+        self._cache = {} if cache is None else cache
         self._name = name or ""
 
     async def get(self, key: str) -> Any:
@@ -66,12 +66,24 @@ class InMemoryCache(PipelineCache):
         del self._cache[key]
 
     async def clear(self) -> None:
-        """Clear the storage."""
-        self._cache.clear()
+        """Clear the storage, including the entries of child caches."""
+        if not self._name:
+            self._cache.clear()
+            return
+        for key in [key for key in self._cache if key.startswith(self._name)]:
+            del self._cache[key]
 
     def child(self, name: str) -> PipelineCache:
-        """Create a sub cache with the given name."""
-        return InMemoryCache(name)
+        """Create a sub cache with the given name, sharing the entries of this cache."""
+        return InMemoryCache(f"{self._name}{name}/", self._cache)
+
+    def keys(self) -> list[str]:
+        """Return the keys in the cache, not including those of child caches."""
+        return [
+            key[len(self._name) :]
+            for key in self._cache
+            if key.startswith(self._name) and "/" not in key[len(self._name) :]
+        ]
 
     def _create_cache_key(self, key: str) -> str:
         """Create a cache key for the given key."""
@@ -63,3 +63,7 @@ class NoopPipelineCache(PipelineCache):
             - name - The name to create the sub cache with.
         """
         return self
+
+    def keys(self) -> list[str]:
+        """Return the keys in the cache."""
+        return []
@@ -65,3 +65,19 @@ class PipelineCache(metaclass=ABCMeta):
         Args:
             - name - The name to create the sub cache with.
         """
+
+    def keys(self) -> list[str]:
+        """Return the keys in the cache, not including those of child caches.
+
+        Caches that can not list their keys raise NotImplementedError, and do not
+        support `graphrag cache`.
+        """
+        msg = f"{type(self).__name__} does not support listing keys."
+        raise NotImplementedError(msg)
+
+    def size(self) -> int | None:
+        """Return the stored bytes of the entries in the cache, not including those of child caches.
+
+        Caches that can not tell without reading every entry return None.
+        """
+        return None
@@ -0,0 +1,239 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing 'SqlitePipelineCache' model."""
+
+import asyncio
+import atexit
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+from graphrag.cache.pipeline_cache import PipelineCache
+
+log = logging.getLogger(__name__)
+
+DATABASE_FILENAME = "cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID
+"""
+
+
+class SqliteCacheDatabase:
+    """A SQLite database file shared by a cache and its children.
+
+    The database runs in WAL mode. Writes are buffered and committed in batches of
+    `write_batch_size`; reads see the buffered writes, and whatever is left in the
+    buffer is committed when the process exits. The connection is shared across
+    threads, so the cache can query it off the event loop.
+    """
+
+    def __init__(self, path: str | Path, write_batch_size: int = 100):
+        self.path = Path(path)
+        self._write_batch_size = write_batch_size
+        # a pending value of None is a pending delete
+        self._pending: dict[tuple[str, str], str | None] = {}
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+        atexit.register(self.flush)
+
+    def get(self, namespace: str, key: str) -> str | None:
+        """Get a value, in a single lookup."""
+        with self._lock:
+            if (namespace, key) in self._pending:
+                return self._pending[namespace, key]
+            row = self._connection.execute(
+                "SELECT value FROM cache WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, namespace: str, key: str, value: str | None) -> bool:
+        """Buffer a write, or a delete when `value` is None.
+
+        Returns whether the buffer is full and should be flushed.
+        """
+        with self._lock:
+            self._pending[namespace, key] = value
+            return len(self._pending) >= self._write_batch_size
+
+    def clear(self, namespace: str) -> None:
+        """Delete every entry in a namespace, including its child namespaces."""
+        with self._lock:
+            self._flush()
+            self._connection.execute(
+                "DELETE FROM cache WHERE substr(namespace, 1, ?) = ?",
+                (len(namespace), namespace),
+            )
+            self._connection.commit()
+
+    def keys(self, namespace: str) -> list[str]:
+        """List the keys in a namespace, not including its child namespaces."""
+        with self._lock:
+            self._flush()
+            rows = self._connection.execute(
+                "SELECT key FROM cache WHERE namespace = ?", (namespace,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def size(self, namespace: str) -> int:
+        """Count the stored bytes of a namespace, not including its child namespaces."""
+        with self._lock:
+            self._flush()
+            (size,) = self._connection.execute(
+                "SELECT SUM(LENGTH(CAST(value AS BLOB))) FROM cache WHERE namespace = ?",
+                (namespace,),
+            ).fetchone()
+        return size or 0
+
+    def flush(self) -> None:
+        """Commit the buffered writes."""
+        with self._lock:
+            self._flush()
+
+    def import_json_cache(self, directory: Path, batch_size: int = 10_000) -> int:
+        """Import the entries of a `JsonPipelineCache` directory, keeping existing entries.
+
+        Child caches are subdirectories, so each file's directory becomes its namespace.
+        Entries are inserted and committed `batch_size` at a time.
+        """
+        rows = []
+        num_imported = 0
+        for path in directory.rglob("*"):
+            if not path.is_file() or path.name.startswith(self.path.name):
+                continue
+            try:
+                value = path.read_text(encoding="utf-8")
+                data = json.loads(value)
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                continue
+            if not isinstance(data, dict) or "result" not in data:
+                continue
+            parts = path.relative_to(directory).parts
+            rows.append(("".join(f"{part}/" for part in parts[:-1]), parts[-1], value))
+            if len(rows) >= batch_size:
+                self._insert(rows)
+                num_imported += len(rows)
+                rows = []
+        self._insert(rows)
+        return num_imported + len(rows)
+
+    def _insert(self, rows: list[tuple[str, str, str]]) -> None:
+        if not rows:
+            return
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO cache (namespace, key, value) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._connection.commit()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        writes = [(*k, v) for k, v in self._pending.items() if v is not None]
+        deletes = [k for k, v in self._pending.items() if v is None]
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO cache (namespace, key, value) VALUES (?, ?, ?)",
+            writes,
+        )
+        self._connection.executemany(
+            "DELETE FROM cache WHERE namespace = ? AND key = ?", deletes
+        )
+        self._connection.commit()
+        self._pending.clear()
+
+
+class SqlitePipelineCache(PipelineCache):
+    """Single-file SQLite pipeline cache class definition.
+
+    Entries are stored in the same JSON format as `JsonPipelineCache`, with child
+    caches as namespaces of one table instead of subdirectories.
+    """
+
+    _database: SqliteCacheDatabase
+    _namespace: str
+
+    def __init__(self, database: SqliteCacheDatabase, namespace: str = ""):
+        """Init method definition."""
+        self._database = database
+        self._namespace = namespace
+
+    async def get(self, key: str) -> Any:
+        """Get method definition."""
+        data = await asyncio.to_thread(self._database.get, self._namespace, key)
+        if data is None:
+            return None
+        try:
+            return json.loads(data).get("result")
+        except json.decoder.JSONDecodeError:
+            await self._write(key, None)
+            return None
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set method definition."""
+        if value is None:
+            return
+        data = {"result": value, **(debug_data or {})}
+        await self._write(key, json.dumps(data, ensure_ascii=False))
+
+    async def has(self, key: str) -> bool:
+        """Has method definition."""
+        data = await asyncio.to_thread(self._database.get, self._namespace, key)
+        return data is not None
+
+    async def delete(self, key: str) -> None:
+        """Delete method definition."""
+        await self._write(key, None)
+
+    async def clear(self) -> None:
+        """Clear method definition."""
+        self._database.clear(self._namespace)
+
+    def child(self, name: str) -> "SqlitePipelineCache":
+        """Child method definition."""
+        return SqlitePipelineCache(self._database, f"{self._namespace}{name}/")
+
+    def keys(self) -> list[str]:
+        """Keys method definition."""
+        return self._database.keys(self._namespace)
+
+    def size(self) -> int | None:
+        """Size method definition."""
+        return self._database.size(self._namespace)
+
+    async def _write(self, key: str, value: str | None) -> None:
+        if self._database.set(self._namespace, key, value):
+            # commit off the event loop
+            await asyncio.to_thread(self._database.flush)
+
+
+def create_sqlite_cache(base_dir: str | Path) -> SqlitePipelineCache:
+    """Create a SQLite cache in `base_dir`.
+
+    When the database is first created in a directory that already holds a JSON file
+    cache, its entries are imported, so switching cache types keeps the cache warm.
+    """
+    base_dir = Path(base_dir)
+    path = base_dir / DATABASE_FILENAME
+    is_new = not path.exists()
+    database = SqliteCacheDatabase(path)
+    if is_new and base_dir.is_dir():
+        num_imported = database.import_json_cache(base_dir)
+        if num_imported:
+            log.info("imported %d JSON cache entries into %s", num_imported, path)
+    return SqlitePipelineCache(database)
@@ -0,0 +1,156 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing 'TieredPipelineCache' model."""
+
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from graphrag.cache.pipeline_cache import PipelineCache
+
+
+@dataclass
+class MemoryTierStats:
+    """Counters for the memory tier of a `TieredPipelineCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    num_entries: int = 0
+    num_bytes: int = 0
+
+
+class LruMemoryTier:
+    """A least recently used store with a byte budget, shared by a cache and its children.
+
+    Entry sizes are estimated from their JSON encoding.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.stats = MemoryTierStats()
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        """Get a value and mark it as recently used, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def has(self, key: str) -> bool:
+        """Check if a value is held, without marking it as used."""
+        return key in self._entries
+
+    def set(self, key: str, value: Any) -> None:
+        """Hold a value, evicting the least recently used ones to stay within budget."""
+        self.delete(key)
+        size = len(json.dumps(value, ensure_ascii=False, default=str))
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (value, size)
+        self.stats.num_bytes += size
+        while self.stats.num_bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.stats.num_bytes -= evicted
+            self.stats.evictions += 1
+        self.stats.num_entries = len(self._entries)
+
+    def delete(self, key: str) -> None:
+        """Drop a value."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.stats.num_bytes -= entry[1]
+            self.stats.num_entries = len(self._entries)
+
+    def clear(self, prefix: str) -> None:
+        """Drop every value whose key starts with `prefix`."""
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            self.delete(key)
+
+
+class TieredPipelineCache(PipelineCache):
+    """A bounded in-memory LRU tier in front of a persistent pipeline cache.
+
+    Reads are served from memory when possible and fill it from the persistent cache
+    otherwise; writes go to both. Child caches share the memory tier, under their
+    own namespace.
+    """
+
+    _persistent: PipelineCache
+    _memory: LruMemoryTier
+    _namespace: str
+
+    def __init__(
+        self,
+        persistent: PipelineCache,
+        max_bytes: int | None = None,
+        memory: LruMemoryTier | None = None,
+        namespace: str = "",
+    ):
+        """Init method definition."""
+        if memory is None:
+            if max_bytes is None:
+                msg = "Either max_bytes or a shared memory tier is required."
+                raise ValueError(msg)
+            memory = LruMemoryTier(max_bytes)
+        self._persistent = persistent
+        self._memory = memory
+        self._namespace = namespace
+
+    @property
+    def stats(self) -> MemoryTierStats:
+        """The stats of the memory tier, shared with the child caches."""
+        return self._memory.stats
+
+    async def get(self, key: str) -> Any:
+        """Get method definition."""
+        value = self._memory.get(self._namespace + key)
+        if value is None:
+            value = await self._persistent.get(key)
+            if value is not None:
+                self._memory.set(self._namespace + key, value)
+        return value
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set method definition."""
+        await self._persistent.set(key, value, debug_data)
+        if value is not None:
+            self._memory.set(self._namespace + key, value)
+
+    async def has(self, key: str) -> bool:
+        """Has method definition."""
+        return self._memory.has(self._namespace + key) or await self._persistent.has(
+            key
+        )
+
+    async def delete(self, key: str) -> None:
+        """Delete method definition."""
+        self._memory.delete(self._namespace + key)
+        await self._persistent.delete(key)
+
+    async def clear(self) -> None:
+        """Clear method definition."""
+        self._memory.clear(self._namespace)
+        await self._persistent.clear()
+
+    def child(self, name: str) -> "TieredPipelineCache":
+        """Child method definition."""
+        return TieredPipelineCache(
+            self._persistent.child(name),
+            memory=self._memory,
+            namespace=f"{self._namespace}{name}/",
+        )
+
+    def keys(self) -> list[str]:
+        """Keys method definition."""
+        return self._persistent.keys()
+
+    def size(self) -> int | None:
+        """Size method definition."""
+        return self._persistent.size()
@@ -0,0 +1,239 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Cache usage records, statistics and garbage collection."""
+
+import dataclasses
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from graphrag.cache.embedding_cache import EMBEDDING_CACHE_NAMESPACE
+from graphrag.cache.pipeline_cache import PipelineCache
+
+CACHE_RUNS_NAMESPACE = "cache_runs"
+"""The child cache holding one usage record per pipeline run."""
+
+KNOWN_NAMESPACES = [
+    "extract_graph",
+    "extract_claims",
+    "summarize_descriptions",
+    "community_reporting",
+    "text_embedding",
+    EMBEDDING_CACHE_NAMESPACE,
+]
+"""The child caches written by the default workflows."""
+
+SHARED_NAMESPACES = [EMBEDDING_CACHE_NAMESPACE]
+"""The child caches that query-time embedders write to as well.
+
+Queries do not record their usage, so these are never pruned.
+"""
+
+
+@dataclass
+class NamespaceUsage:
+    """The reads and writes of one child cache during a run."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    keys: set[str] = field(default_factory=set)
+
+
+class CacheUsageRecorder(PipelineCache):
+    """Records the keys read and written through a cache and its children, by namespace.
+
+    Set `carry_forward` when the run skips workflows that completed in an earlier
+    run: their entries are still valid but are not touched, so the usage record of
+    the run also keeps the keys of the previous record.
+    """
+
+    cache: PipelineCache
+    usage: dict[str, NamespaceUsage]
+    carry_forward: bool = False
+
+    def __init__(
+        self,
+        cache: PipelineCache,
+        usage: dict[str, NamespaceUsage] | None = None,
+        namespace: str = "",
+    ):
+        """Init method definition."""
+        self.cache = cache
+        self.usage = {} if usage is None else usage
+        self._namespace = namespace
+
+    async def get(self, key: str) -> Any:
+        """Get method definition."""
+        value = await self.cache.get(key)
+        usage = self._touch(key)
+        if value is None:
+            usage.misses += 1
+        else:
+            usage.hits += 1
+        return value
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set method definition."""
+        await self.cache.set(key, value, debug_data)
+        self._touch(key).writes += 1
+
+    async def has(self, key: str) -> bool:
+        """Has method definition."""
+        found = await self.cache.has(key)
+        if found:
+            self._touch(key)
+        return found
+
+    async def delete(self, key: str) -> None:
+        """Delete method definition."""
+        await self.cache.delete(key)
+
+    async def clear(self) -> None:
+        """Clear method definition."""
+        await self.cache.clear()
+
+    def child(self, name: str) -> "CacheUsageRecorder":
+        """Child method definition."""
+        namespace = f"{self._namespace}/{name}" if self._namespace else name
+        return CacheUsageRecorder(self.cache.child(name), self.usage, namespace)
+
+    def keys(self) -> list[str]:
+        """Keys method definition."""
+        return self.cache.keys()
+
+    def size(self) -> int | None:
+        """Size method definition."""
+        return self.cache.size()
+
+    def _touch(self, key: str) -> NamespaceUsage:
+        usage = self.usage.setdefault(self._namespace, NamespaceUsage())
+        usage.keys.add(key)
+        return usage
+
+
+async def write_cache_usage(recorder: CacheUsageRecorder) -> None:
+    """Store the usage of a run in the cache itself, next to the entries it describes."""
+    if not recorder.usage and not recorder.carry_forward:
+        return
+    usage = dict(recorder.usage)
+    if recorder.carry_forward:
+        for previous in await load_cache_usage(recorder.cache, 1):
+            for namespace, previous_usage in previous["namespaces"].items():
+                carried = usage[namespace] = dataclasses.replace(
+                    usage.get(namespace, NamespaceUsage())
+                )
+                carried.keys = carried.keys | set(previous_usage.get("keys", []))
+    now = datetime.now(timezone.utc)
+    record = {
+        "time": now.isoformat(),
+        "namespaces": {
+            namespace: {
+                "hits": namespace_usage.hits,
+                "misses": namespace_usage.misses,
+                "writes": namespace_usage.writes,
+                "keys": sorted(namespace_usage.keys),
+            }
+            for namespace, namespace_usage in usage.items()
+        },
+    }
+    if recorder.carry_forward:
+        record["carried_forward"] = True
+    await recorder.cache.child(CACHE_RUNS_NAMESPACE).set(
+        now.strftime("%Y%m%dT%H%M%S%f"), record
+    )
+
+
+async def load_cache_usage(
+    cache: PipelineCache, num_runs: int | None = None
+) -> list[dict[str, Any]]:
+    """Load the usage records of the last `num_runs` runs (all by default), newest first."""
+    runs = cache.child(CACHE_RUNS_NAMESPACE)
+    keys = sorted(runs.keys(), reverse=True)[:num_runs]
+    records = [await runs.get(key) for key in keys]
+    return [record for record in records if record is not None]
+
+
+async def cache_stats(cache: PipelineCache) -> dict[str, dict[str, Any]]:
+    """Count the entries and their bytes in each child cache, with the hit rate of the last run.
+
+    Sizes come from the cache backend where it reports them, otherwise from the JSON
+    encoding of each value, which reads every entry.
+    """
+    runs = await load_cache_usage(cache)
+    last_run = runs[0]["namespaces"] if runs else {}
+    stats = {}
+    for namespace in _namespaces(runs):
+        child = _child(cache, namespace)
+        keys = child.keys()
+        num_bytes = child.size()
+        if num_bytes is None:
+            num_bytes = 0
+            for key in keys:
+                value = await child.get(key)
+                num_bytes += len(json.dumps(value, ensure_ascii=False, default=str))
+        usage = last_run.get(namespace, {})
+        lookups = usage.get("hits", 0) + usage.get("misses", 0)
+        stats[namespace] = {
+            "entries": len(keys),
+            "bytes": num_bytes,
+            "hits": usage.get("hits", 0),
+            "misses": usage.get("misses", 0),
+            "hit_rate": usage.get("hits", 0) / lookups if lookups else None,
+        }
+    return stats
+
+
+async def prune_cache(
+    cache: PipelineCache, keep_runs: int, dry_run: bool = False
+) -> dict[str, int]:
+    """Delete the entries of each child cache that none of the last `keep_runs` runs touched.
+
+    Runs that skip completed workflows carry the keys of the run before them forward
+    (see `CacheUsageRecorder`), so resumed runs do not expire those entries.
+
+    The `SHARED_NAMESPACES` are left alone. Returns the number of entries deleted (or that would be, with `dry_run`) per child cache.
+    """
+    runs = await load_cache_usage(cache, keep_runs)
+    if not runs:
+        msg = "No cache usage has been recorded yet, run the pipeline before pruning."
+        raise ValueError(msg)
+    pruned = {}
+    for namespace in _namespaces(await load_cache_usage(cache)):
+        if namespace in SHARED_NAMESPACES:
+            continue
+        touched = {
+            key
+            for run in runs
+            for key in run["namespaces"].get(namespace, {}).get("keys", [])
+        }
+        child = _child(cache, namespace)
+        stale = [key for key in child.keys() if key not in touched]  # noqa: SIM118
+        if not dry_run:
+            for key in stale:
+                await child.delete(key)
+        pruned[namespace] = len(stale)
+
+    # drop the usage records that fell out of the window as well
+    records = cache.child(CACHE_RUNS_NAMESPACE)
+    expired = sorted(records.keys(), reverse=True)[keep_runs:]
+    if not dry_run:
+        for key in expired:
+            await records.delete(key)
+    pruned[CACHE_RUNS_NAMESPACE] = len(expired)
+    return pruned
+
+
+def _namespaces(runs: list[dict[str, Any]]) -> list[str]:
+    recorded = {namespace for run in runs for namespace in run["namespaces"]}
+    # entries at the top level are not written by any workflow, leave them alone
+    recorded.discard("")
+    return KNOWN_NAMESPACES + sorted(recorded - set(KNOWN_NAMESPACES))
+
+
+def _child(cache: PipelineCache, namespace: str) -> PipelineCache:
+    for name in namespace.split("/"):
+        cache = cache.child(name)
+    return cache
@@ -25,6 +25,15 @@ class FileWorkflowCallbacks(NoopWorkflowCallbacks):
             Path(directory) / "logs.json", "a", encoding="utf-8", errors="strict"
         )
 
+    def workflow_stats(self, name: str, stats: dict[str, float]):
+        """Handle the performance stats of a finished workflow."""
+        self._out_stream.write(
+            json.dumps(
+                {"type": "stats", "data": name, "details": stats}, ensure_ascii=False
+            )
+            + "\n"
+        )
+
     def error(
         self,
         message: str,
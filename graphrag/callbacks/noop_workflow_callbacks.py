@@ -16,6 +16,9 @@ class NoopWorkflowCallbacks(WorkflowCallbacks):
     def workflow_end(self, name: str, instance: object) -> None:
         """Execute this callback when a workflow ends."""
 
+    def workflow_stats(self, name: str, stats: dict[str, float]) -> None:
+        """Execute this callback with the performance stats of a finished workflow."""
+
     def progress(self, progress: Progress) -> None:
         """Handle when progress occurs."""
 
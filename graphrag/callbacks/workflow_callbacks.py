@@ -23,6 +23,10 @@ class WorkflowCallbacks(Protocol):
         """Execute this callback when a workflow ends."""
         ...
 
+    def workflow_stats(self, name: str, stats: dict[str, float]) -> None:
+        """Execute this callback with the performance stats of a finished workflow."""
+        ...
+
     def progress(self, progress: Progress) -> None:
         """Handle when progress occurs."""
         ...
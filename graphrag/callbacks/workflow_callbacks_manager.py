@@ -32,6 +32,12 @@ class WorkflowCallbacksManager(WorkflowCallbacks):
             if hasattr(callback, "workflow_end"):
                 callback.workflow_end(name, instance)
 
+    def workflow_stats(self, name: str, stats: dict[str, float]) -> None:
+        """Execute this callback with the performance stats of a finished workflow."""
+        for callback in self._callbacks:
+            if hasattr(callback, "workflow_stats"):
+                callback.workflow_stats(name, stats)
+
     def progress(self, progress: Progress) -> None:
         """Handle when progress occurs."""
         for callback in self._callbacks:
@@ -0,0 +1,47 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""CLI implementation of the benchmark subcommand."""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+from graphrag.config.enums import IndexingMethod
+from graphrag.index.benchmark import (
+    create_benchmark_config,
+    format_report,
+    generate_corpus,
+    run_benchmark,
+)
+from graphrag.index.llm.simulated_llm import LLMSimulation
+from graphrag.logger.print_progress import PrintProgressLogger
+
+logger = PrintProgressLogger("")
+
+
+def benchmark_cli(
+    root_dir: Path | None,
+    num_documents: int,
+    simulation: LLMSimulation,
+    method: IndexingMethod,
+):
+    """Index a synthetic corpus against a simulated LLM service and report the LLM traffic of each workflow."""
+    if root_dir is None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _run(Path(temp_dir), num_documents, simulation, method)
+    else:
+        _run(root_dir, num_documents, simulation, method)
+
+
+def _run(
+    root_dir: Path,
+    num_documents: int,
+    simulation: LLMSimulation,
+    method: IndexingMethod,
+):
+    generate_corpus(root_dir / "input", num_documents, seed=simulation.seed)
+    config = create_benchmark_config(root_dir)
+    logger.info(f"Indexing {num_documents} documents in {root_dir}")  # noqa: G004
+    reports = asyncio.run(run_benchmark(config, simulation, method))
+    print(format_report(reports))  # noqa: T201
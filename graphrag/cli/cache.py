@@ -0,0 +1,58 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""CLI implementation of the cache subcommands."""
+
+import asyncio
+from pathlib import Path
+
+from graphrag.cache.factory import CacheFactory
+from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.cache.usage import cache_stats, prune_cache
+from graphrag.config.load_config import load_config
+from graphrag.logger.print_progress import PrintProgressLogger
+
+logger = PrintProgressLogger("")
+
+
+def cache_stats_cli(root_dir: Path, config_filepath: Path | None):
+    """Report the entries, bytes and last-run hit rate of each child cache."""
+    cache = _load_cache(root_dir, config_filepath)
+    stats = asyncio.run(cache_stats(cache))
+    print(f"{'namespace':<24}{'entries':>10}{'bytes':>14}{'last run hits':>16}")  # noqa: T201
+    for namespace, namespace_stats in stats.items():
+        hit_rate = namespace_stats["hit_rate"]
+        hits = (
+            "-" if hit_rate is None else f"{namespace_stats['hits']} ({hit_rate:.0%})"
+        )
+        print(  # noqa: T201
+            f"{namespace:<24}{namespace_stats['entries']:>10}{namespace_stats['bytes']:>14}{hits:>16}"
+        )
+
+
+def cache_prune_cli(
+    root_dir: Path, config_filepath: Path | None, keep_runs: int, dry_run: bool
+):
+    """Delete the cache entries not touched by the last `keep_runs` runs."""
+    cache = _load_cache(root_dir, config_filepath)
+    pruned = asyncio.run(prune_cache(cache, keep_runs, dry_run))
+    action = "Would delete" if dry_run else "Deleted"
+    for namespace, num_entries in pruned.items():
+        logger.info(f"{action} {num_entries} entries from {namespace}")  # noqa: G004
+    logger.success(f"{action} {sum(pruned.values())} cache entries.")
+
+
+def _load_cache(root_dir: Path, config_filepath: Path | None) -> PipelineCache:
+    config = load_config(root_dir, config_filepath)
+    cache_config = config.cache.model_dump()
+    cache = CacheFactory().create_cache(
+        cache_type=cache_config["type"],
+        root_dir=config.root_dir,
+        kwargs=cache_config,
+    )
+    try:
+        cache.keys()
+    except NotImplementedError as e:
+        msg = f"The {cache_config['type']} cache can not list its entries, the cache commands support file, sqlite and memory caches."
+        raise ValueError(msg) from e
+    return cache
@@ -72,6 +72,8 @@ def index_cli(
     dry_run: bool,
     skip_validation: bool,
     output_dir: Path | None,
+    resume: bool,
+    retry_failed: bool,
 ):
     """Run the pipeline with the given config."""
     cli_overrides = {}
@@ -89,6 +91,8 @@ def index_cli(
         logger=logger,
         dry_run=dry_run,
         skip_validation=skip_validation,
+        resume=resume,
+        retry_failed=retry_failed,
     )
 
 
@@ -141,6 +145,8 @@ def _run_index(
     logger,
     dry_run,
     skip_validation,
+    resume=False,
+    retry_failed=False,
 ):
     progress_logger = LoggerFactory().create_logger(logger)
     info, error, success = _logger(progress_logger)
@@ -178,6 +184,8 @@ def _run_index(
             method=method,
             memory_profile=memprofile,
             progress_logger=progress_logger,
+            resume=resume,
+            retry_failed=retry_failed,
         )
     )
     encountered_errors = any(
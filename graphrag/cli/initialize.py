@@ -12,7 +12,10 @@ from graphrag.prompts.index.community_report import (
 )
 from graphrag.prompts.index.extract_claims import EXTRACT_CLAIMS_PROMPT
 from graphrag.prompts.index.extract_graph import GRAPH_EXTRACTION_PROMPT
-from graphrag.prompts.index.summarize_descriptions import SUMMARIZE_PROMPT
+from graphrag.prompts.index.summarize_descriptions import (
+    BATCH_SUMMARIZE_PROMPT,
+    SUMMARIZE_PROMPT,
+)
 from graphrag.prompts.query.basic_search_system_prompt import BASIC_SEARCH_SYSTEM_PROMPT
 from graphrag.prompts.query.drift_search_system_prompt import (
     DRIFT_LOCAL_SYSTEM_PROMPT,
@@ -71,6 +74,7 @@ def initialize_project_at(path: Path, force: bool) -> None:
     prompts = {
         "extract_graph": GRAPH_EXTRACTION_PROMPT,
         "summarize_descriptions": SUMMARIZE_PROMPT,
+        "summarize_descriptions_batch": BATCH_SUMMARIZE_PROMPT,
         "extract_claims": EXTRACT_CLAIMS_PROMPT,
         "community_report": COMMUNITY_REPORT_PROMPT,
         "drift_search_system_prompt": DRIFT_LOCAL_SYSTEM_PROMPT,
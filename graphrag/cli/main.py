@@ -162,6 +162,18 @@ def _index_cli(
             resolve_path=True,
         ),
     ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            help="Resume a previous run, skipping workflows whose outputs are up to date with the current inputs and configuration."
+        ),
+    ] = False,
+    retry_failed: Annotated[
+        bool,
+        typer.Option(
+            help="Resume a previous run, re-running the workflows that skipped failed rows. Rows that succeeded before are served from the cache."
+        ),
+    ] = False,
 ):
     """Build a knowledge graph index."""
     from graphrag.cli.index import index_cli
@@ -177,6 +189,8 @@ def _index_cli(
         skip_validation=skip_validation,
         output_dir=output,
         method=method,
+        resume=resume,
+        retry_failed=retry_failed,
     )
 
 
@@ -469,3 +483,138 @@ def _query_cli(
             )
         case _:
             raise ValueError(INVALID_METHOD_ERROR)
+
+
+cache_app = typer.Typer(
+    help="Inspect and garbage collect the LLM cache.", no_args_is_help=True
+)
+app.add_typer(cache_app, name="cache")
+
+
+@cache_app.command("stats")
+def _cache_stats_cli(
+    config: Annotated[
+        Path | None,
+        typer.Option(
+            help="The configuration to use.", exists=True, file_okay=True, readable=True
+        ),
+    ] = None,
+    root: Annotated[
+        Path,
+        typer.Option(
+            help="The project root directory.",
+            exists=True,
+            dir_okay=True,
+            writable=True,
+            resolve_path=True,
+            autocompletion=path_autocomplete(
+                file_okay=False, dir_okay=True, writable=True, match_wildcard="*"
+            ),
+        ),
+    ] = Path(),  # set default to current directory
+):
+    """Report the entries and bytes in each cache namespace, with the hit rates of the last run."""
+    from graphrag.cli.cache import cache_stats_cli
+
+    cache_stats_cli(root_dir=root, config_filepath=config)
+
+
+@cache_app.command("prune")
+def _cache_prune_cli(
+    keep_runs: Annotated[
+        int,
+        typer.Option(
+            help="Keep the entries touched by this many of the most recent runs.",
+            min=1,
+        ),
+    ],
+    config: Annotated[
+        Path | None,
+        typer.Option(
+            help="The configuration to use.", exists=True, file_okay=True, readable=True
+        ),
+    ] = None,
+    root: Annotated[
+        Path,
+        typer.Option(
+            help="The project root directory.",
+            exists=True,
+            dir_okay=True,
+            writable=True,
+            resolve_path=True,
+            autocompletion=path_autocomplete(
+                file_okay=False, dir_okay=True, writable=True, match_wildcard="*"
+            ),
+        ),
+    ] = Path(),  # set default to current directory
+    dry_run: Annotated[
+        bool,
+        typer.Option(help="Report what would be deleted without deleting anything."),
+    ] = False,
+):
+    """Delete cache entries that were not used by the most recent runs."""
+    from graphrag.cli.cache import cache_prune_cli
+
+    cache_prune_cli(
+        root_dir=root, config_filepath=config, keep_runs=keep_runs, dry_run=dry_run
+    )
+
+
+@app.command("benchmark")
+def _benchmark_cli(
+    root: Annotated[
+        Path | None,
+        typer.Option(
+            help="The directory to write the synthetic project to. Defaults to a temporary directory.",
+            dir_okay=True,
+            writable=True,
+            resolve_path=True,
+        ),
+    ] = None,
+    documents: Annotated[
+        int, typer.Option(help="The number of synthetic documents to index.", min=1)
+    ] = 20,
+    latency: Annotated[
+        float,
+        typer.Option(help="The median latency of the simulated service, in seconds."),
+    ] = 1.0,
+    latency_sigma: Annotated[
+        float,
+        typer.Option(help="The spread of the log-normal latency distribution."),
+    ] = 0.5,
+    rpm: Annotated[
+        int,
+        typer.Option(help="The requests-per-minute quota of the service (0 is none)."),
+    ] = 0,
+    tpm: Annotated[
+        int,
+        typer.Option(help="The tokens-per-minute quota of the service (0 is none)."),
+    ] = 0,
+    error_rate: Annotated[
+        float,
+        typer.Option(help="The fraction of requests that fail with a server error."),
+    ] = 0.0,
+    method: Annotated[
+        IndexingMethod, typer.Option(help="The indexing method to use.")
+    ] = IndexingMethod.Standard,
+    seed: Annotated[
+        int, typer.Option(help="The seed of the corpus and the simulation.")
+    ] = 0,
+):
+    """Benchmark indexing throughput against a simulated LLM service."""
+    from graphrag.cli.benchmark import benchmark_cli
+    from graphrag.index.llm.simulated_llm import LLMSimulation
+
+    benchmark_cli(
+        root_dir=root,
+        num_documents=documents,
+        simulation=LLMSimulation(
+            latency_median=latency,
+            latency_sigma=latency_sigma,
+            requests_per_minute=rpm,
+            tokens_per_minute=tpm,
+            error_rate=error_rate,
+            seed=seed,
+        ),
+        method=method,
+    )
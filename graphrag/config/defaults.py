@@ -39,6 +39,12 @@ LLM_N = 1
 LLM_REQUEST_TIMEOUT = 180.0
 LLM_TOKENS_PER_MINUTE = 50_000
 LLM_REQUESTS_PER_MINUTE = 1_000
+LLM_RATE_LIMIT_STATE_PATH = None
+LLM_BATCH_BACKEND = None
+LLM_BATCH_DIR = "batch"
+LLM_BATCH_MAX_SIZE = 50_000
+LLM_BATCH_FLUSH_INTERVAL = 10.0
+LLM_BATCH_POLL_INTERVAL = 60.0
 LLM_MAX_RETRIES = 10
 LLM_MAX_RETRY_WAIT = 10.0
 LLM_PRESENCE_PENALTY = 0.0
@@ -47,6 +53,8 @@ LLM_CONCURRENT_REQUESTS = 25
 
 PARALLELIZATION_STAGGER = 0.3
 PARALLELIZATION_NUM_THREADS = 50
+CONCURRENT_WORKFLOWS = False
+LONGEST_FIRST = False
 
 #
 # Text embedding
@@ -61,6 +69,7 @@ EMBEDDING_MODEL_ID = DEFAULT_EMBEDDING_MODEL_ID
 # LLM response caching
 CACHE_TYPE = CacheType.file
 CACHE_BASE_DIR = "cache"
+CACHE_MEMORY_MAX_BYTES = None
 
 # Text chunking
 CHUNK_SIZE = 1200
@@ -78,6 +87,9 @@ EXTRACT_CLAIMS_MODEL_ID = DEFAULT_CHAT_MODEL_ID
 MAX_CLUSTER_SIZE = 10
 USE_LCC = True
 CLUSTER_GRAPH_SEED = 0xDEADBEEF
+CLUSTER_GRAPH_PER_COMPONENT = False
+CLUSTER_GRAPH_NUM_PROCESSES = None
+CLUSTER_GRAPH_INCREMENTAL = False
 
 # Community report summarization
 COMMUNITY_REPORT_MAX_LENGTH = 2000
@@ -87,10 +99,13 @@ COMMUNITY_REPORT_MODEL_ID = DEFAULT_CHAT_MODEL_ID
 # Graph extraction via LLM
 EXTRACT_GRAPH_ENTITY_TYPES = ["organization", "person", "geo", "event"]
 EXTRACT_GRAPH_MAX_GLEANINGS = 1
+EXTRACT_GRAPH_MAX_PACK_TOKENS = 0
 EXTRACT_GRAPH_MODEL_ID = DEFAULT_CHAT_MODEL_ID
 
 # Graph extraction via NLP
 NLP_NORMALIZE_EDGE_WEIGHTS = True
+NLP_ASYNC_MODE = AsyncType.Threaded
+NLP_NUM_PROCESSES = None
 NLP_EXTRACTOR_TYPE = NounPhraseExtractorType.RegexEnglish
 NLP_MAX_WORD_LENGTH = 15
 NLP_MODEL_NAME = "en_core_web_md"
@@ -128,10 +143,19 @@ REPORTING_TYPE = ReportingType.file
 REPORTING_BASE_DIR = "logs"
 SNAPSHOTS_GRAPHML = False
 SNAPSHOTS_EMBEDDINGS = False
+SNAPSHOTS_GRAPH = False
+STREAMING_ENABLED = False
+STREAMING_BATCH_DOCUMENTS = 1000
+STREAMING_BATCH_TOKENS = None
+
+FAULT_TOLERANCE_MAX_RETRIES = 0
+FAULT_TOLERANCE_RETRY_BACKOFF = 1.0
+FAULT_TOLERANCE_MAX_FAILURE_RATE = 0.0
 OUTPUT_BASE_DIR = "output"
 OUTPUT_DEFAULT_ID = "default_output"
 OUTPUT_TYPE = OutputType.file
 SUMMARIZE_DESCRIPTIONS_MAX_LENGTH = 500
+SUMMARIZE_DESCRIPTIONS_MAX_BATCH_TOKENS = 0
 SUMMARIZE_MODEL_ID = DEFAULT_CHAT_MODEL_ID
 UMAP_ENABLED = False
 UPDATE_OUTPUT_BASE_DIR = "update_output"
@@ -21,6 +21,8 @@ class CacheType(str, Enum):
     """The blob cache configuration type."""
     cosmosdb = "cosmosdb"
     """The cosmosdb cache configuration type"""
+    sqlite = "sqlite"
+    """The single-file SQLite cache configuration type."""
 
     def __repr__(self):
         """Get a string representation."""
@@ -124,11 +126,26 @@ class AuthType(str, Enum):
     AzureManagedIdentity = "azure_managed_identity"
 
 
+class BatchBackendType(str, Enum):
+    """The backend that runs batched LLM requests."""
+
+    provider = "provider"
+    """The batch endpoint of the OpenAI or Azure OpenAI service."""
+    file = "file"
+    """A local stand-in that exchanges JSONL files in a directory."""
+
+    def __repr__(self):
+        """Get a string representation."""
+        return f'"{self.value}"'
+
+
 class AsyncType(str, Enum):
     """Enum for the type of async to use."""
 
     AsyncIO = "asyncio"
     Threaded = "threaded"
+    Adaptive = "adaptive"
+    Process = "process"
 
 
 class ChunkStrategyType(str, Enum):
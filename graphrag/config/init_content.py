@@ -21,7 +21,7 @@ models:
     model_supports_json: true # recommended if this is available for your model.
     parallelization_num_threads: {defs.PARALLELIZATION_NUM_THREADS}
     parallelization_stagger: {defs.PARALLELIZATION_STAGGER}
-    async_mode: {defs.ASYNC_MODE.value} # or asyncio
+    async_mode: {defs.ASYNC_MODE.value} # or asyncio, adaptive
     # audience: "https://cognitiveservices.azure.com/.default"
     # api_base: https://<instance>.openai.azure.com
     # api_version: 2024-02-15-preview
@@ -34,7 +34,7 @@ models:
     model: {defs.EMBEDDING_MODEL}
     parallelization_num_threads: {defs.PARALLELIZATION_NUM_THREADS}
     parallelization_stagger: {defs.PARALLELIZATION_STAGGER}
-    async_mode: {defs.ASYNC_MODE.value} # or asyncio
+    async_mode: {defs.ASYNC_MODE.value} # or asyncio, adaptive
     # api_base: https://<instance>.openai.azure.com
     # api_version: 2024-02-15-preview
     # audience: "https://cognitiveservices.azure.com/.default"
@@ -99,6 +99,7 @@ extract_graph:
 summarize_descriptions:
   model_id: {defs.SUMMARIZE_MODEL_ID}
   prompt: "prompts/summarize_descriptions.txt"
+  batch_prompt: "prompts/summarize_descriptions_batch.txt"
   max_length: {defs.SUMMARIZE_DESCRIPTIONS_MAX_LENGTH}
 
 extract_graph_nlp:
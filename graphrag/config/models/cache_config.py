@@ -30,3 +30,7 @@ class CacheConfig(BaseModel):
     cosmosdb_account_url: str | None = Field(
         description="The cosmosdb account url to use.", default=None
     )
+    memory_max_bytes: int | None = Field(
+        description="The byte budget of an in-memory LRU tier in front of the cache, if any.",
+        default=defs.CACHE_MEMORY_MAX_BYTES,
+    )
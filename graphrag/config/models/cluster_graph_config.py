@@ -22,3 +22,15 @@ class ClusterGraphConfig(BaseModel):
         description="The seed to use for the clustering.",
         default=defs.CLUSTER_GRAPH_SEED,
     )
+    per_component: bool = Field(
+        description="Whether to cluster each connected component on its own, in a pool of worker processes.",
+        default=defs.CLUSTER_GRAPH_PER_COMPONENT,
+    )
+    num_processes: int | None = Field(
+        description="The number of worker processes to use when clustering per component. If None, will use one per CPU.",
+        default=defs.CLUSTER_GRAPH_NUM_PROCESSES,
+    )
+    incremental: bool = Field(
+        description="Whether update runs recluster only the communities touched by the new documents, and regenerate only their reports, instead of appending the communities of the new documents.",
+        default=defs.CLUSTER_GRAPH_INCREMENTAL,
+    )
@@ -25,6 +25,10 @@ class ExtractGraphConfig(BaseModel):
         description="The maximum number of entity gleanings to use.",
         default=defs.EXTRACT_GRAPH_MAX_GLEANINGS,
     )
+    max_pack_tokens: int = Field(
+        description="The token budget for packing consecutive text units into one extraction call (0 disables packing).",
+        default=defs.EXTRACT_GRAPH_MAX_PACK_TOKENS,
+    )
     strategy: dict | None = Field(
         description="Override the default entity extraction strategy", default=None
     )
@@ -55,5 +59,6 @@ class ExtractGraphConfig(BaseModel):
             if self.prompt
             else None,
             "max_gleanings": self.max_gleanings,
+            "max_pack_tokens": self.max_pack_tokens,
             "encoding_name": model_config.encoding_model,
         }
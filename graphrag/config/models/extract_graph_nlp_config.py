@@ -6,7 +6,7 @@
 from pydantic import BaseModel, Field
 
 import graphrag.config.defaults as defs
-from graphrag.config.enums import NounPhraseExtractorType
+from graphrag.config.enums import AsyncType, NounPhraseExtractorType
 
 
 class TextAnalyzerConfig(BaseModel):
@@ -64,3 +64,11 @@ class ExtractGraphNLPConfig(BaseModel):
     text_analyzer: TextAnalyzerConfig = Field(
         description="The text analyzer configuration.", default=TextAnalyzerConfig()
     )
+    async_mode: AsyncType = Field(
+        description="The async mode to use. Use `process` to extract noun phrases in a pool of worker processes.",
+        default=defs.NLP_ASYNC_MODE,
+    )
+    num_processes: int | None = Field(
+        description="The number of worker processes to use in `process` mode. If None, will use one per CPU.",
+        default=defs.NLP_NUM_PROCESSES,
+    )
@@ -0,0 +1,25 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Parameterization settings for the default configuration."""
+
+from pydantic import BaseModel, Field
+
+import graphrag.config.defaults as defs
+
+
+class FaultToleranceConfig(BaseModel):
+    """Configuration section for handling rows that fail in row-by-row transforms."""
+
+    max_retries: int = Field(
+        description="The number of times a failed row is retried.",
+        default=defs.FAULT_TOLERANCE_MAX_RETRIES,
+    )
+    retry_backoff: float = Field(
+        description="The delay before the first retry of a row, in seconds. It doubles with each retry.",
+        default=defs.FAULT_TOLERANCE_RETRY_BACKOFF,
+    )
+    max_failure_rate: float = Field(
+        description="The fraction of rows in a transform allowed to fail without failing the run.",
+        default=defs.FAULT_TOLERANCE_MAX_FAILURE_RATE,
+    )
@@ -20,6 +20,7 @@ from graphrag.config.models.embed_graph_config import EmbedGraphConfig
 from graphrag.config.models.extract_claims_config import ClaimExtractionConfig
 from graphrag.config.models.extract_graph_config import ExtractGraphConfig
 from graphrag.config.models.extract_graph_nlp_config import ExtractGraphNLPConfig
+from graphrag.config.models.fault_tolerance_config import FaultToleranceConfig
 from graphrag.config.models.global_search_config import GlobalSearchConfig
 from graphrag.config.models.input_config import InputConfig
 from graphrag.config.models.language_model_config import LanguageModelConfig
@@ -28,6 +29,7 @@ from graphrag.config.models.output_config import OutputConfig
 from graphrag.config.models.prune_graph_config import PruneGraphConfig
 from graphrag.config.models.reporting_config import ReportingConfig
 from graphrag.config.models.snapshots_config import SnapshotsConfig
+from graphrag.config.models.streaming_config import StreamingConfig
 from graphrag.config.models.summarize_descriptions_config import (
     SummarizeDescriptionsConfig,
 )
@@ -86,6 +88,11 @@ class GraphRagConfig(BaseModel):
         if defs.DEFAULT_EMBEDDING_MODEL_ID not in self.models:
             raise LanguageModelConfigMissingError(defs.DEFAULT_EMBEDDING_MODEL_ID)
 
+    def _validate_model_batch_dirs(self) -> None:
+        """Validate the batch directories of the models."""
+        for model in self.models.values():
+            model.batch_dir = str((Path(self.root_dir) / model.batch_dir).resolve())
+
     reporting: ReportingConfig = Field(
         description="The reporting configuration.", default=ReportingConfig()
     )
@@ -268,6 +275,30 @@ class GraphRagConfig(BaseModel):
     )
     """List of workflows to run, in execution order."""
 
+    concurrent_workflows: bool = Field(
+        description="Whether to run workflows that do not depend on each other's tables concurrently.",
+        default=defs.CONCURRENT_WORKFLOWS,
+    )
+    """Whether to run workflows that do not depend on each other's tables concurrently."""
+
+    longest_first: bool = Field(
+        description="Whether to start the most expensive rows of LLM workflows first.",
+        default=defs.LONGEST_FIRST,
+    )
+    """Whether to start the most expensive rows of LLM workflows first."""
+
+    streaming: StreamingConfig = Field(
+        description="The streaming micro-batch indexing configuration to use.",
+        default=StreamingConfig(),
+    )
+    """The streaming micro-batch indexing configuration to use."""
+
+    fault_tolerance: FaultToleranceConfig = Field(
+        description="The configuration for retrying and tolerating failed rows.",
+        default=FaultToleranceConfig(),
+    )
+    """The configuration for retrying and tolerating failed rows."""
+
     def _validate_vector_store_db_uri(self) -> None:
         """Validate the vector store configuration."""
         for store in self.vector_store.values():
@@ -330,6 +361,7 @@ class GraphRagConfig(BaseModel):
         """Validate the model configuration."""
         self._validate_root_dir()
         self._validate_models()
+        self._validate_model_batch_dirs()
         self._validate_reporting_base_dir()
         self._validate_output_base_dir()
         self._validate_multi_output_base_dirs()
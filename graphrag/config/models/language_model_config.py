@@ -7,7 +7,7 @@ import tiktoken
 from pydantic import BaseModel, Field, model_validator
 
 import graphrag.config.defaults as defs
-from graphrag.config.enums import AsyncType, AuthType, LLMType
+from graphrag.config.enums import AsyncType, AuthType, BatchBackendType, LLMType
 from graphrag.config.errors import (
     ApiKeyMissingError,
     AzureApiBaseMissingError,
@@ -199,6 +199,10 @@ class LanguageModelConfig(BaseModel):
         description="The number of requests per minute to use for the LLM service.",
         default=defs.LLM_REQUESTS_PER_MINUTE,
     )
+    rate_limit_state_path: str | None = Field(
+        description="A SQLite file holding the rate limit budgets, to share them with other processes using the same deployment.",
+        default=defs.LLM_RATE_LIMIT_STATE_PATH,
+    )
     max_retries: int = Field(
         description="The maximum number of retries to use for the LLM service.",
         default=defs.LLM_MAX_RETRIES,
@@ -229,6 +233,37 @@ class LanguageModelConfig(BaseModel):
     async_mode: AsyncType = Field(
         description="The async mode to use.", default=defs.ASYNC_MODE
     )
+    batch_backend: BatchBackendType | None = Field(
+        description="Submit chat requests as batch jobs through this backend, instead of one at a time.",
+        default=defs.LLM_BATCH_BACKEND,
+    )
+    batch_dir: str = Field(
+        description="The directory the file batch backend exchanges its JSONL jobs in.",
+        default=defs.LLM_BATCH_DIR,
+    )
+    batch_max_size: int = Field(
+        description="The maximum number of requests in a batch job.",
+        default=defs.LLM_BATCH_MAX_SIZE,
+    )
+    batch_flush_interval: float = Field(
+        description="The number of seconds without new requests after which the pending requests are submitted.",
+        default=defs.LLM_BATCH_FLUSH_INTERVAL,
+    )
+    batch_poll_interval: float = Field(
+        description="The number of seconds between checks on a running batch job.",
+        default=defs.LLM_BATCH_POLL_INTERVAL,
+    )
+
+    def num_threads(self) -> int:
+        """Return the number of rows or requests to keep in flight against this model.
+
+        Batched requests wait for their whole job, so a whole batch is kept in
+        flight instead of `parallelization_num_threads` requests; otherwise every
+        job would only hold as many requests as there are threads.
+        """
+        if self.batch_backend is not None:
+            return self.batch_max_size
+        return self.parallelization_num_threads
 
     def _validate_azure_settings(self) -> None:
         """Validate the Azure settings.
@@ -19,3 +19,7 @@ class SnapshotsConfig(BaseModel):
         description="A flag indicating whether to take snapshots of GraphML.",
         default=defs.SNAPSHOTS_GRAPHML,
     )
+    graph: bool = Field(
+        description="A flag indicating whether to save the entity graph, so later runs over the same relationships can load it instead of rebuilding it.",
+        default=defs.SNAPSHOTS_GRAPH,
+    )
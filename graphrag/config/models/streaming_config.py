@@ -0,0 +1,25 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Parameterization settings for the default configuration."""
+
+from pydantic import BaseModel, Field
+
+import graphrag.config.defaults as defs
+
+
+class StreamingConfig(BaseModel):
+    """Configuration section for streaming micro-batch indexing."""
+
+    enabled: bool = Field(
+        description="Whether to stream input documents through chunking and graph extraction in micro-batches.",
+        default=defs.STREAMING_ENABLED,
+    )
+    batch_documents: int = Field(
+        description="The maximum number of documents per micro-batch.",
+        default=defs.STREAMING_BATCH_DOCUMENTS,
+    )
+    batch_tokens: int | None = Field(
+        description="The maximum number of document tokens per micro-batch, if any.",
+        default=defs.STREAMING_BATCH_TOKENS,
+    )
@@ -17,10 +17,18 @@ class SummarizeDescriptionsConfig(BaseModel):
     prompt: str | None = Field(
         description="The description summarization prompt to use.", default=None
     )
+    batch_prompt: str | None = Field(
+        description="The prompt to use when summarizing several description lists in one call.",
+        default=None,
+    )
     max_length: int = Field(
         description="The description summarization maximum length.",
         default=defs.SUMMARIZE_DESCRIPTIONS_MAX_LENGTH,
     )
+    max_batch_tokens: int = Field(
+        description="The token budget for summarizing short description lists together in one call (0 disables batching).",
+        default=defs.SUMMARIZE_DESCRIPTIONS_MAX_BATCH_TOKENS,
+    )
     strategy: dict | None = Field(
         description="The override strategy to use.", default=None
     )
@@ -47,5 +55,11 @@ class SummarizeDescriptionsConfig(BaseModel):
             )
             if self.prompt
             else None,
+            "batch_summarize_prompt": (Path(root_dir) / self.batch_prompt).read_text(
+                encoding="utf-8"
+            )
+            if self.batch_prompt
+            else None,
             "max_summary_length": self.max_length,
+            "max_batch_tokens": self.max_batch_tokens,
         }
@@ -0,0 +1,292 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""End-to-end indexing benchmark against a simulated LLM service."""
+
+import random
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from graphrag.api.index import build_index
+from graphrag.cache.factory import CacheFactory
+from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.config.enums import IndexingMethod
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.llm.load_llm import (
+    _create_openai_chat_llm,
+    _create_openai_config,
+    _create_openai_embeddings_llm,
+    _create_rate_limiter,
+    _create_request_slots,
+    create_cache,
+)
+from graphrag.index.llm.manager import ChatLLMSingleton, EmbeddingsLLMSingleton
+from graphrag.index.llm.simulated_llm import (
+    LLMSimulation,
+    SimulatedClient,
+    SimulatedRequest,
+)
+
+CHAT_LLM_NAMES = [
+    "extract_graph",
+    "extract_claims",
+    "summarize_descriptions",
+    "community_reporting",
+]
+"""The chat LLMs loaded by the indexing workflows."""
+
+EMBEDDING_LLM_NAMES = ["text_embedding"]
+"""The embedding LLMs loaded by the indexing workflows."""
+
+_ENTITY_TYPES = ["PERSON", "ORGANIZATION", "GEO", "EVENT"]
+_FILLER = [
+    "the", "of", "and", "to", "in", "a", "is", "that", "for", "on", "with", "as",
+    "by", "at", "from", "was", "were", "report", "meeting", "agreement", "project",
+    "market", "council", "statement", "visit", "plan", "review",
+]  # fmt: skip
+
+_current_workflow: ContextVar[str | None] = ContextVar(
+    "current_benchmark_workflow", default=None
+)
+
+
+@dataclass
+class WorkflowReport:
+    """The LLM traffic of one workflow during a benchmark run."""
+
+    workflow: str
+    duration: float
+    """Wall-clock time of the workflow, in seconds."""
+    requests: int
+    """Requests received by the service, including failed ones."""
+    errors: int
+    """Requests that failed with a 429 or 500."""
+    throughput: float
+    """Successful requests per second."""
+    tokens_per_second: float
+    """Tokens of the successful requests per second."""
+    mean_in_flight: float
+    """The average number of requests being served at once."""
+    peak_in_flight: int
+    """The most requests served at once."""
+    utilization: float
+    """The mean number of requests in flight over the concurrency limit of the model."""
+    latency_p50: float
+    latency_p95: float
+    latency_p99: float
+
+
+def generate_corpus(
+    directory: Path,
+    num_documents: int = 20,
+    words_per_document: int = 1000,
+    num_entities: int = 200,
+    seed: int = 0,
+) -> None:
+    """Write a synthetic corpus of text files, mentioning entities named like `PERSON_12`.
+
+    Entity mentions follow a Zipf-like distribution, so a few entities are hubs that
+    show up in many documents, as in real corpora.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    entities = [
+        f"{_ENTITY_TYPES[i % len(_ENTITY_TYPES)]}_{i}" for i in range(num_entities)
+    ]
+    weights = [1 / (rank + 1) for rank in range(num_entities)]
+    directory.mkdir(parents=True, exist_ok=True)
+    for document in range(num_documents):
+        sentences = []
+        num_words = 0
+        while num_words < words_per_document:
+            words = rng.choices(_FILLER, k=rng.randint(8, 16))
+            for _ in range(rng.randint(1, 3)):
+                words.insert(
+                    rng.randrange(len(words)), rng.choices(entities, weights)[0]
+                )
+            sentence = " ".join(words)
+            sentences.append(sentence[0].upper() + sentence[1:] + ".")
+            num_words += len(words)
+        (directory / f"document_{document}.txt").write_text(
+            " ".join(sentences), encoding="utf-8"
+        )
+
+
+def create_benchmark_config(root_dir: Path) -> GraphRagConfig:
+    """Create the configuration of a benchmark project, with an in-memory cache so every run reaches the service."""
+    model = {"api_key": "simulated", "model": "gpt-4o", "encoding_model": "cl100k_base"}
+    return create_graphrag_config(
+        {
+            "models": {
+                "default_chat_model": {"type": "openai_chat", **model},
+                "default_embedding_model": {
+                    "type": "openai_embedding",
+                    **model,
+                    "model": "text-embedding-3-small",
+                },
+            },
+            "cache": {"type": "memory"},
+        },
+        root_dir=str(root_dir),
+    )
+
+
+async def run_benchmark(
+    config: GraphRagConfig,
+    simulation: LLMSimulation,
+    method: IndexingMethod = IndexingMethod.Standard,
+) -> list[WorkflowReport]:
+    """Index the input of `config` against the simulated service, reporting the LLM traffic of each workflow."""
+    client = SimulatedClient(simulation, tag=_current_workflow.get)
+    callbacks = _BenchmarkCallbacks()
+    cache_config = config.cache.model_dump()
+    cache = CacheFactory().create_cache(
+        cache_type=cache_config["type"],
+        root_dir=config.root_dir,
+        kwargs=cache_config,
+    )
+    # put back whatever the host had registered under the same names
+    chat_llms = dict(ChatLLMSingleton().llm_dict)
+    embedding_llms = dict(EmbeddingsLLMSingleton().llm_dict)
+    _register_simulated_llms(config, client, cache)
+    try:
+        results = await build_index(config, method, callbacks=[callbacks])
+    finally:
+        _restore_llms(ChatLLMSingleton().llm_dict, chat_llms, CHAT_LLM_NAMES)
+        _restore_llms(
+            EmbeddingsLLMSingleton().llm_dict, embedding_llms, EMBEDDING_LLM_NAMES
+        )
+    for result in results:
+        if result.errors:
+            raise result.errors[0]
+
+    reports = []
+    for workflow, (start, end) in callbacks.times.items():
+        model_id = _workflow_model_id(config, workflow)
+        limit = config.get_language_model_config(model_id).concurrent_requests
+        requests = [r for r in client.requests if r.tag == workflow]
+        reports.append(_report(workflow, end - start, requests, limit))
+    return reports
+
+
+def format_report(reports: list[WorkflowReport]) -> str:
+    """Format benchmark reports as a table."""
+    lines = [
+        f"{'workflow':<36}{'time':>8}{'reqs':>7}{'errs':>6}{'req/s':>8}{'tok/s':>9}{'in flight':>11}{'util':>6}{'p50':>7}{'p95':>7}{'p99':>7}"
+    ]
+    lines.extend(
+        f"{r.workflow:<36}{r.duration:>8.1f}{r.requests:>7}{r.errors:>6}{r.throughput:>8.2f}{r.tokens_per_second:>9.0f}{f'{r.mean_in_flight:.1f}/{r.peak_in_flight}':>11}{r.utilization:>6.0%}{r.latency_p50:>7.2f}{r.latency_p95:>7.2f}{r.latency_p99:>7.2f}"
+        for r in reports
+    )
+    return "\n".join(lines)
+
+
+class _BenchmarkCallbacks(NoopWorkflowCallbacks):
+    """Tags the requests made by each workflow and times the workflows."""
+
+    def __init__(self):
+        self.times: dict[str, tuple[float, float]] = {}
+
+    def workflow_start(self, name: str, instance: object) -> None:
+        # the workflow runs in the task that starts it, and in tasks it creates
+        _current_workflow.set(name)
+        self.times[name] = (time.monotonic(), time.monotonic())
+
+    def workflow_end(self, name: str, instance: object) -> None:
+        self.times[name] = (self.times[name][0], time.monotonic())
+
+
+def _register_simulated_llms(
+    config: GraphRagConfig, client: SimulatedClient, cache: PipelineCache
+) -> None:
+    """Load the workflow LLMs ahead of the pipeline, sending their requests to `client` and caching responses in `cache`."""
+    callbacks = NoopWorkflowCallbacks()
+
+    def on_error(error, stack=None, details=None):
+        callbacks.error("Error Invoking LLM", error, stack, details)
+
+    for name in CHAT_LLM_NAMES:
+        llm_config = config.get_language_model_config(_workflow_model_id(config, name))
+        ChatLLMSingleton().set_llm(
+            name,
+            _create_openai_chat_llm(
+                _create_openai_config(llm_config, False),
+                on_error,
+                create_cache(cache, name),  # type: ignore
+                _create_rate_limiter(llm_config),
+                _create_request_slots(llm_config),
+                client=client,
+            ),
+        )
+    for name in EMBEDDING_LLM_NAMES:
+        llm_config = config.get_language_model_config(config.embed_text.model_id)
+        EmbeddingsLLMSingleton().set_llm(
+            name,
+            _create_openai_embeddings_llm(
+                _create_openai_config(llm_config, False),
+                on_error,
+                create_cache(cache, name),  # type: ignore
+                _create_rate_limiter(llm_config),
+                _create_request_slots(llm_config),
+                client=client,
+            ),
+        )
+
+
+def _restore_llms(llms: dict, previous: dict, names: list[str]) -> None:
+    for name in names:
+        if name in previous:
+            llms[name] = previous[name]
+        else:
+            llms.pop(name, None)
+
+
+def _workflow_model_id(config: GraphRagConfig, name: str) -> str:
+    match name:
+        case "extract_graph":
+            return config.extract_graph.model_id
+        case "extract_claims" | "extract_covariates":
+            return config.extract_claims.model_id
+        case "summarize_descriptions":
+            return config.summarize_descriptions.model_id
+        case "community_reporting" | "create_community_reports":
+            return config.community_reports.model_id
+        case "generate_text_embeddings":
+            return config.embed_text.model_id
+        case _:
+            return config.extract_graph.model_id
+
+
+def _report(
+    workflow: str, duration: float, requests: list[SimulatedRequest], limit: int
+) -> WorkflowReport:
+    succeeded = [r for r in requests if r.status == 200]
+    latencies = np.array([r.end - r.start for r in succeeded] or [0.0])
+    busy = sum(r.end - r.start for r in requests)
+    events = sorted([(r.start, 1) for r in requests] + [(r.end, -1) for r in requests])
+    in_flight = peak = 0
+    for _, change in events:
+        in_flight += change
+        peak = max(peak, in_flight)
+    mean_in_flight = busy / duration if duration > 0 else 0.0
+    return WorkflowReport(
+        workflow=workflow,
+        duration=duration,
+        requests=len(requests),
+        errors=len(requests) - len(succeeded),
+        throughput=len(succeeded) / duration if duration > 0 else 0.0,
+        tokens_per_second=sum(r.tokens for r in succeeded) / duration
+        if duration > 0
+        else 0.0,
+        mean_in_flight=mean_in_flight,
+        peak_in_flight=peak,
+        utilization=mean_in_flight / limit if limit else 0.0,
+        latency_p50=float(np.percentile(latencies, 50)),
+        latency_p95=float(np.percentile(latencies, 95)),
+        latency_p99=float(np.percentile(latencies, 99)),
+    )
@@ -8,6 +8,8 @@ from dataclasses import dataclass as dc_dataclass
 from dataclasses import field
 
 from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.index.graph_registry import GraphRegistry
+from graphrag.index.table_registry import TableRegistry
 from graphrag.storage.pipeline_storage import PipelineStorage
 
 
@@ -25,7 +27,10 @@ class PipelineRunStats:
     """Float representing the input load time."""
 
     workflows: dict[str, dict[str, float]] = field(default_factory=dict)
-    """A dictionary of workflows."""
+    """Performance stats of each workflow, see `WorkflowStats`."""
+
+    memory_cache: dict[str, int] = field(default_factory=dict)
+    """Stats of the in-memory cache tier, if any, see `MemoryTierStats`."""
 
 
 @dc_dataclass
@@ -37,3 +42,7 @@ class PipelineRunContext:
     "Long-term storage for pipeline verbs to use. Items written here will be written to the storage provider."
     cache: PipelineCache
     "Cache instance for reading previous LLM responses."
+    tables: TableRegistry
+    "Tables written during this run, handed to later workflows in memory and persisted to storage."
+    graphs: GraphRegistry
+    "Entity graphs built during this run, shared by the workflows that read the same relationships."
@@ -8,8 +8,8 @@ from uuid import uuid4
 
 import pandas as pd
 
-from graphrag.index.operations.cluster_graph import cluster_graph
-from graphrag.index.operations.create_graph import create_graph
+from graphrag.index.operations.cluster_graph import Communities, cluster_graph
+from graphrag.index.utils.csr_graph import CSRGraph
 
 
 def create_communities(
@@ -18,17 +18,31 @@ def create_communities(
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
+    graph: CSRGraph | None = None,
+    per_component: bool = False,
+    num_processes: int | None = None,
 ) -> pd.DataFrame:
     """All the steps to transform final communities."""
-    graph = create_graph(relationships)
+    if graph is None:
+        graph = CSRGraph.from_edges(relationships)
 
     clusters = cluster_graph(
         graph,
         max_cluster_size,
         use_lcc,
         seed=seed,
+        per_component=per_component,
+        num_processes=num_processes,
     )
+    return create_communities_from_clusters(clusters, entities, relationships)
 
+
+def create_communities_from_clusters(
+    clusters: Communities,
+    entities: pd.DataFrame,
+    relationships: pd.DataFrame,
+) -> pd.DataFrame:
+    """Aggregate the entities, relationships and text units of each cluster into the communities table."""
     communities = pd.DataFrame(
         clusters, columns=pd.Index(["level", "community", "parent", "title"])
     ).explode("title")
@@ -35,6 +35,7 @@ async def create_community_reports(
     summarization_strategy: dict,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    longest_first: bool = False,
 ) -> pd.DataFrame:
     """All the steps to transform community reports."""
     nodes = explode_communities(communities, entities)
@@ -68,6 +69,7 @@ async def create_community_reports(
         max_input_length=max_input_length,
         async_mode=async_mode,
         num_threads=num_threads,
+        longest_first=longest_first,
     )
 
     return finalize_community_reports(community_reports, communities)
@@ -40,6 +40,7 @@ async def create_community_reports_text(
     summarization_strategy: dict,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    longest_first: bool = False,
 ) -> pd.DataFrame:
     """All the steps to transform community reports."""
     nodes = explode_communities(communities, entities)
@@ -65,6 +66,7 @@ async def create_community_reports_text(
         max_input_length=max_input_length,
         async_mode=async_mode,
         num_threads=num_threads,
+        longest_first=longest_first,
     )
 
     return finalize_community_reports(community_reports, communities)
@@ -25,6 +25,7 @@ async def extract_covariates(
     async_mode: AsyncType = AsyncType.AsyncIO,
     entity_types: list[str] | None = None,
     num_threads: int = 4,
+    longest_first: bool = False,
 ) -> pd.DataFrame:
     """All the steps to extract and format covariates."""
     # reassign the id because it will be overwritten in the output by a covariate one
@@ -40,6 +41,7 @@ async def extract_covariates(
         async_mode=async_mode,
         entity_types=entity_types,
         num_threads=num_threads,
+        longest_first=longest_first,
     )
     text_units.drop(columns=["text_unit_id"], inplace=True)  # don't pollute the global
     covariates["id"] = covariates["covariate_type"].apply(lambda _x: str(uuid4()))
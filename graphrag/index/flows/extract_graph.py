@@ -11,6 +11,7 @@ from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
 from graphrag.config.models.embed_graph_config import EmbedGraphConfig
+from graphrag.index.graph_registry import GraphRegistry
 from graphrag.index.operations.extract_graph.extract_graph import (
     extract_graph as extractor,
 )
@@ -31,8 +32,11 @@ async def extract_graph(
     entity_types: list[str] | None = None,
     summarization_strategy: dict[str, Any] | None = None,
     summarization_num_threads: int = 4,
+    summarization_async_mode: AsyncType = AsyncType.AsyncIO,
     embed_config: EmbedGraphConfig | None = None,
     layout_enabled: bool = False,
+    graphs: GraphRegistry | None = None,
+    longest_first: bool = False,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """All the steps to create the base entity graph."""
     # this returns a graph for each text unit, to be merged later
@@ -46,8 +50,36 @@ async def extract_graph(
         async_mode=extraction_async_mode,
         entity_types=entity_types,
         num_threads=extraction_num_threads,
+        longest_first=longest_first,
     )
 
+    return await summarize_graph(
+        extracted_entities=extracted_entities,
+        extracted_relationships=extracted_relationships,
+        callbacks=callbacks,
+        cache=cache,
+        summarization_strategy=summarization_strategy,
+        summarization_num_threads=summarization_num_threads,
+        summarization_async_mode=summarization_async_mode,
+        embed_config=embed_config,
+        layout_enabled=layout_enabled,
+        graphs=graphs,
+    )
+
+
+async def summarize_graph(
+    extracted_entities: pd.DataFrame,
+    extracted_relationships: pd.DataFrame,
+    callbacks: WorkflowCallbacks,
+    cache: PipelineCache,
+    summarization_strategy: dict[str, Any] | None = None,
+    summarization_num_threads: int = 4,
+    summarization_async_mode: AsyncType = AsyncType.AsyncIO,
+    embed_config: EmbedGraphConfig | None = None,
+    layout_enabled: bool = False,
+    graphs: GraphRegistry | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Summarize the merged descriptions of an extracted graph and finalize its tables."""
     if not _validate_data(extracted_entities):
         error_msg = "Entity Extraction failed. No entities detected during extraction."
         callbacks.error(error_msg)
@@ -67,6 +99,7 @@ async def extract_graph(
         cache=cache,
         strategy=summarization_strategy,
         num_threads=summarization_num_threads,
+        async_mode=summarization_async_mode,
     )
 
     relationships = extracted_relationships.drop(columns=["description"]).merge(
@@ -76,10 +109,11 @@ async def extract_graph(
     extracted_entities.drop(columns=["description"], inplace=True)
     entities = extracted_entities.merge(entity_summaries, on="title", how="left")
 
+    graph = (graphs or GraphRegistry()).get(relationships)
     final_entities = finalize_entities(
-        entities, relationships, callbacks, embed_config, layout_enabled
+        entities, relationships, callbacks, embed_config, layout_enabled, graph
     )
-    final_relationships = finalize_relationships(relationships)
+    final_relationships = finalize_relationships(relationships, graph)
     return (final_entities, final_relationships)
 
 
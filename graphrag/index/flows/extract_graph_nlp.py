@@ -9,6 +9,7 @@ from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.embed_graph_config import EmbedGraphConfig
 from graphrag.config.models.extract_graph_nlp_config import ExtractGraphNLPConfig
 from graphrag.config.models.prune_graph_config import PruneGraphConfig
+from graphrag.index.graph_registry import GraphRegistry
 from graphrag.index.operations.build_noun_graph.build_noun_graph import build_noun_graph
 from graphrag.index.operations.build_noun_graph.np_extractors.factory import (
     create_noun_phrase_extractor,
@@ -27,6 +28,7 @@ def extract_graph_nlp(
     pruning_config: PruneGraphConfig,
     embed_config: EmbedGraphConfig | None = None,
     layout_enabled: bool = False,
+    graphs: GraphRegistry | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """All the steps to create the base entity graph."""
     text_analyzer_config = extraction_config.text_analyzer
@@ -35,6 +37,8 @@ def extract_graph_nlp(
         text_units,
         text_analyzer=text_analyzer,
         normalize_edge_weights=extraction_config.normalize_edge_weights,
+        async_mode=extraction_config.async_mode,
+        num_processes=extraction_config.num_processes,
     )
 
     # create a temporary graph to prune, then turn it back into dataframes
@@ -66,8 +70,9 @@ def extract_graph_nlp(
 
     joined_edges["description"] = ""
 
+    graph = (graphs or GraphRegistry()).get(joined_edges)
     final_entities = finalize_entities(
-        joined_nodes, joined_edges, callbacks, embed_config, layout_enabled
+        joined_nodes, joined_edges, callbacks, embed_config, layout_enabled, graph
     )
-    final_relationships = finalize_relationships(joined_edges)
+    final_relationships = finalize_relationships(joined_edges, graph)
     return (final_entities, final_relationships)
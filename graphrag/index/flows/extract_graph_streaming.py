@@ -0,0 +1,152 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""All the steps to create the base entity graph from micro-batches of documents."""
+
+import logging
+from collections.abc import AsyncIterable
+from typing import Any
+
+import pandas as pd
+
+from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.config.enums import AsyncType
+from graphrag.config.models.chunking_config import ChunkingConfig
+from graphrag.config.models.embed_graph_config import EmbedGraphConfig
+from graphrag.index.flows.create_base_text_units import create_base_text_units
+from graphrag.index.flows.create_final_documents import create_final_documents
+from graphrag.index.flows.extract_graph import summarize_graph
+from graphrag.index.graph_registry import GraphRegistry
+from graphrag.index.operations.extract_graph.extract_graph import (
+    extract_graph as extractor,
+)
+from graphrag.index.table_spill import TableSpill
+from graphrag.storage.pipeline_storage import PipelineStorage
+
+log = logging.getLogger(__name__)
+
+
+async def extract_graph_streaming(
+    batches: AsyncIterable[pd.DataFrame],
+    storage: PipelineStorage,
+    callbacks: WorkflowCallbacks,
+    cache: PipelineCache,
+    chunks: ChunkingConfig,
+    metadata: list[str] | None = None,
+    extraction_strategy: dict[str, Any] | None = None,
+    extraction_num_threads: int = 4,
+    extraction_async_mode: AsyncType = AsyncType.AsyncIO,
+    entity_types: list[str] | None = None,
+    summarization_strategy: dict[str, Any] | None = None,
+    summarization_num_threads: int = 4,
+    summarization_async_mode: AsyncType = AsyncType.AsyncIO,
+    embed_config: EmbedGraphConfig | None = None,
+    layout_enabled: bool = False,
+    graphs: GraphRegistry | None = None,
+    longest_first: bool = False,
+) -> tuple[TableSpill, TableSpill, pd.DataFrame, pd.DataFrame]:
+    """All the steps to create the base entity graph from micro-batches of documents.
+
+    Each batch is chunked and run through graph extraction on its own. The documents,
+    text units and the entities and relationships extracted from each batch are
+    spilled to `storage`, and the partial aggregates are merged once every batch is
+    done, before descriptions are summarized.
+    """
+    documents = TableSpill(storage, "documents")
+    text_units = TableSpill(storage, "text_units")
+    entities = TableSpill(storage, "entities")
+    relationships = TableSpill(storage, "relationships")
+
+    num_documents = 0
+    async for batch in batches:
+        log.info(
+            "processing batch %d with %d documents", documents.num_parts, len(batch)
+        )
+        batch_text_units = create_base_text_units(
+            batch,
+            callbacks,
+            chunks.group_by_columns,
+            chunks.size,
+            chunks.overlap,
+            chunks.encoding_model,
+            strategy=chunks.strategy,
+        )
+        batch_documents = create_final_documents(batch, batch_text_units, metadata)
+        batch_documents["human_readable_id"] += num_documents
+        num_documents += len(batch_documents)
+
+        batch_entities, batch_relationships = await extractor(
+            text_units=batch_text_units,
+            callbacks=callbacks,
+            cache=cache,
+            text_column="text",
+            id_column="id",
+            strategy=extraction_strategy,
+            async_mode=extraction_async_mode,
+            entity_types=entity_types,
+            num_threads=extraction_num_threads,
+            longest_first=longest_first,
+        )
+
+        await documents.append(batch_documents)
+        await text_units.append(batch_text_units)
+        await entities.append(batch_entities)
+        await relationships.append(batch_relationships)
+
+    if num_documents == 0:
+        error_msg = "Streaming indexing failed. No input documents found."
+        callbacks.error(error_msg)
+        raise ValueError(error_msg)
+
+    extracted_entities = _merge_partial_entities([
+        part async for part in entities.parts()
+    ])
+    extracted_relationships = _merge_partial_relationships([
+        part async for part in relationships.parts()
+    ])
+    await entities.clear()
+    await relationships.clear()
+
+    final_entities, final_relationships = await summarize_graph(
+        extracted_entities=extracted_entities,
+        extracted_relationships=extracted_relationships,
+        callbacks=callbacks,
+        cache=cache,
+        summarization_strategy=summarization_strategy,
+        summarization_num_threads=summarization_num_threads,
+        summarization_async_mode=summarization_async_mode,
+        embed_config=embed_config,
+        layout_enabled=layout_enabled,
+        graphs=graphs,
+    )
+    return (documents, text_units, final_entities, final_relationships)
+
+
+def _merge_partial_entities(partials: list[pd.DataFrame]) -> pd.DataFrame:
+    return (
+        pd.concat(partials, ignore_index=True)
+        .groupby(["title", "type"], sort=False)
+        .agg(
+            description=("description", _concat_lists),
+            text_unit_ids=("text_unit_ids", _concat_lists),
+        )
+        .reset_index()
+    )
+
+
+def _merge_partial_relationships(partials: list[pd.DataFrame]) -> pd.DataFrame:
+    return (
+        pd.concat(partials, ignore_index=True)
+        .groupby(["source", "target"], sort=False)
+        .agg(
+            description=("description", _concat_lists),
+            text_unit_ids=("text_unit_ids", _concat_lists),
+            weight=("weight", "sum"),
+        )
+        .reset_index()
+    )
+
+
+def _concat_lists(values: pd.Series) -> list:
+    return [item for items in values for item in items]
@@ -0,0 +1,117 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'GraphRegistry' model."""
+
+import hashlib
+import logging
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from graphrag.index.utils.csr_graph import CSRGraph
+from graphrag.storage.pipeline_storage import PipelineStorage
+
+log = logging.getLogger(__name__)
+
+GRAPH_FILE = "graph.npz"
+"""The name of the persisted graph in storage."""
+
+
+class GraphRegistry:
+    """In-memory registry of the entity graphs built during a pipeline run.
+
+    Graphs are unweighted and keyed by a hash of the source and target columns of
+    their edge list, so the relationships before and after finalization share one
+    graph, along with the LCC it memoizes. Graphs stay in memory until they are released, once the
+    workflows that share them are done. With a `storage`, graphs can also be saved
+    to and loaded from `graph.npz`, so that a later run over the same relationships
+    does not rebuild them.
+    """
+
+    def __init__(self, storage: PipelineStorage | None = None):
+        self._storage = storage
+        self._graphs: dict[str, CSRGraph] = {}
+
+    def get(self, edges: pd.DataFrame) -> CSRGraph:
+        """Get the graph of an edge list, building it if it was not built during this run."""
+        key = graph_key(edges)
+        graph = self._graphs.get(key)
+        if graph is None:
+            graph = CSRGraph.from_edges(edges)
+            self._graphs[key] = graph
+        return graph
+
+    async def load(self, edges: pd.DataFrame) -> CSRGraph:
+        """Get the graph of an edge list, falling back to the saved graph before building it."""
+        key = graph_key(edges)
+        if key not in self._graphs and self._storage is not None:
+            data = await self._storage.get(GRAPH_FILE, as_bytes=True)
+            if data is not None:
+                stored_key, graph = _from_bytes(data)
+                if stored_key == key:
+                    log.info("loaded graph from storage: %s", GRAPH_FILE)
+                    self._graphs[key] = graph
+        return self.get(edges)
+
+    def release(self, edges: pd.DataFrame) -> None:
+        """Drop the graph of an edge list from memory, a later `get` builds it again."""
+        self._graphs.pop(graph_key(edges), None)
+
+    async def save(self, edges: pd.DataFrame) -> None:
+        """Write the graph of an edge list to storage, if the registry has one."""
+        if self._storage is None:
+            return
+        log.info("writing graph to storage: %s", GRAPH_FILE)
+        await self._storage.set(
+            GRAPH_FILE, _to_bytes(graph_key(edges), self.get(edges))
+        )
+
+
+def graph_key(edges: pd.DataFrame) -> str:
+    """Hash the distinct source and target pairs of an edge list, in order.
+
+    The pairs determine the nodes, their order and the edges of the graph the
+    registry builds, and nothing else: registry graphs are topology-only, so edge
+    weights and other columns are left out of the key and of saved graphs. A
+    weighted graph must be built with `CSRGraph.from_edges(weight=...)` outside the
+    registry, or the key must be extended to cover the weight column.
+    """
+    pairs = edges.loc[:, ["source", "target"]].drop_duplicates()
+    hashes = pd.util.hash_pandas_object(pairs, index=False).to_numpy()
+    return hashlib.sha256(hashes.tobytes()).hexdigest()
+
+
+def _to_bytes(key: str, graph: CSRGraph) -> bytes:
+    """Serialize a graph and its key as a compressed numpy archive."""
+    names = [str(node).encode("utf-8") for node in graph.nodes]
+    arrays = {
+        "key": np.array(key),
+        "names": np.frombuffer(b"".join(names), dtype=np.uint8),
+        "name_ends": np.cumsum([len(name) for name in names], dtype=np.int64),
+        "sources": graph.sources,
+        "targets": graph.targets,
+    }
+    if graph.weights is not None:
+        arrays["weights"] = graph.weights
+    buffer = BytesIO()
+    np.savez_compressed(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def _from_bytes(data: bytes) -> tuple[str, CSRGraph]:
+    """Deserialize a graph and its key written by `_to_bytes`."""
+    arrays = np.load(BytesIO(data))
+    names = arrays["names"].tobytes()
+    ends = arrays["name_ends"]
+    starts = np.concatenate([[0], ends[:-1]]).astype(np.int64)
+    nodes = pd.Index(
+        [
+            names[start:end].decode("utf-8")
+            for start, end in zip(starts, ends, strict=True)
+        ],
+        dtype=object,
+    )
+    graph = CSRGraph(nodes, arrays["sources"], arrays["targets"], arrays.get("weights"))
+    return str(arrays["key"]), graph
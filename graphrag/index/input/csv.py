@@ -6,6 +6,7 @@
 import logging
 import re
 from io import BytesIO
+from typing import Any
 
 import pandas as pd
 
@@ -28,40 +29,28 @@ async def load(
 ) -> pd.DataFrame:
     """Load csv inputs from a directory."""
     log.info("Loading csv files from %s", config.base_dir)
+    files = find_files(config, progress, storage)
+    files_loaded = []
 
-    async def load_file(path: str, group: dict | None) -> pd.DataFrame:
-        if group is None:
-            group = {}
-        buffer = BytesIO(await storage.get(path, as_bytes=True))
-        data = pd.read_csv(buffer, encoding=config.encoding)
-        additional_keys = group.keys()
-        if len(additional_keys) > 0:
-            data[[*additional_keys]] = data.apply(
-                lambda _row: pd.Series([group[key] for key in additional_keys]), axis=1
-            )
-        if "id" not in data.columns:
-            data["id"] = data.apply(lambda x: gen_sha512_hash(x, x.keys()), axis=1)
-        if config.text_column is not None and "text" not in data.columns:
-            if config.text_column not in data.columns:
-                log.warning(
-                    "text_column %s not found in csv file %s",
-                    config.text_column,
-                    path,
-                )
-            else:
-                data["text"] = data.apply(lambda x: x[config.text_column], axis=1)
-        if config.title_column is not None and "title" not in data.columns:
-            if config.title_column not in data.columns:
-                log.warning(
-                    "title_column %s not found in csv file %s",
-                    config.title_column,
-                    path,
-                )
-            else:
-                data["title"] = data.apply(lambda x: x[config.title_column], axis=1)
-
-        return data
+    for file, group in files:
+        try:
+            files_loaded.append(await load_file(file, group, config, storage))
+        except Exception:  # noqa: BLE001 (catching Exception is fine here)
+            log.warning("Warning! Error loading csv file %s. Skipping...", file)
+
+    log.info("Found %d csv files, loading %d", len(files), len(files_loaded))
+    result = pd.concat(files_loaded)
+    total_files_log = f"Total number of unfiltered csv rows: {len(result)}"
+    log.info(total_files_log)
+    return result
 
+
+def find_files(
+    config: InputConfig,
+    progress: ProgressLogger | None,
+    storage: PipelineStorage,
+) -> list[tuple[str, dict[str, Any]]]:
+    """Find the csv files to load."""
     file_pattern = (
         re.compile(config.file_pattern)
         if config.file_pattern is not None
@@ -78,17 +67,44 @@ async def load(
     if len(files) == 0:
         msg = f"No CSV files found in {config.base_dir}"
         raise ValueError(msg)
+    return files
 
-    files_loaded = []
 
-    for file, group in files:
-        try:
-            files_loaded.append(await load_file(file, group))
-        except Exception:  # noqa: BLE001 (catching Exception is fine here)
-            log.warning("Warning! Error loading csv file %s. Skipping...", file)
+async def load_file(
+    path: str,
+    group: dict | None,
+    config: InputConfig,
+    storage: PipelineStorage,
+) -> pd.DataFrame:
+    """Load the rows of a single csv file."""
+    if group is None:
+        group = {}
+    buffer = BytesIO(await storage.get(path, as_bytes=True))
+    data = pd.read_csv(buffer, encoding=config.encoding)
+    additional_keys = group.keys()
+    if len(additional_keys) > 0:
+        data[[*additional_keys]] = data.apply(
+            lambda _row: pd.Series([group[key] for key in additional_keys]), axis=1
+        )
+    if "id" not in data.columns:
+        data["id"] = data.apply(lambda x: gen_sha512_hash(x, x.keys()), axis=1)
+    if config.text_column is not None and "text" not in data.columns:
+        if config.text_column not in data.columns:
+            log.warning(
+                "text_column %s not found in csv file %s",
+                config.text_column,
+                path,
+            )
+        else:
+            data["text"] = data.apply(lambda x: x[config.text_column], axis=1)
+    if config.title_column is not None and "title" not in data.columns:
+        if config.title_column not in data.columns:
+            log.warning(
+                "title_column %s not found in csv file %s",
+                config.title_column,
+                path,
+            )
+        else:
+            data["title"] = data.apply(lambda x: x[config.title_column], axis=1)
 
-    log.info("Found %d csv files, loading %d", len(files), len(files_loaded))
-    result = pd.concat(files_loaded)
-    total_files_log = f"Total number of unfiltered csv rows: {len(result)}"
-    log.info(total_files_log)
-    return result
+    return data
@@ -4,22 +4,30 @@
 """A module containing create_input method definition."""
 
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
+from hashlib import sha256
 from pathlib import Path
 from typing import cast
 
 import pandas as pd
+import tiktoken
 
+import graphrag.config.defaults as defs
 from graphrag.config.enums import InputType
 from graphrag.config.models.input_config import InputConfig
+from graphrag.index.input.csv import find_files as find_csv_files
 from graphrag.index.input.csv import input_type as csv
 from graphrag.index.input.csv import load as load_csv
+from graphrag.index.input.csv import load_file as load_csv_file
+from graphrag.index.input.text import find_files as find_text_files
 from graphrag.index.input.text import input_type as text
 from graphrag.index.input.text import load as load_text
+from graphrag.index.input.text import load_file as load_text_file
 from graphrag.logger.base import ProgressLogger
 from graphrag.logger.null_progress import NullProgressLogger
 from graphrag.storage.blob_pipeline_storage import BlobPipelineStorage
 from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.storage.pipeline_storage import PipelineStorage
 
 log = logging.getLogger(__name__)
 loaders: dict[str, Callable[..., Awaitable[pd.DataFrame]]] = {
@@ -27,6 +35,25 @@ loaders: dict[str, Callable[..., Awaitable[pd.DataFrame]]] = {
     csv: load_csv,
 }
 
+FindFilesFn = Callable[
+    [InputConfig, ProgressLogger | None, PipelineStorage], list[tuple[str, dict]]
+]
+LoadFileFn = Callable[
+    [str, dict | None, InputConfig, PipelineStorage], Awaitable[pd.DataFrame]
+]
+
+
+async def _load_text_file_as_table(
+    path: str, group: dict | None, config: InputConfig, storage: PipelineStorage
+) -> pd.DataFrame:
+    return pd.DataFrame([await load_text_file(path, group, config, storage)])
+
+
+file_loaders: dict[str, tuple[FindFilesFn, LoadFileFn]] = {
+    text: (find_text_files, _load_text_file_as_table),
+    csv: (find_csv_files, load_csv_file),
+}
+
 
 async def create_input(
     config: InputConfig,
@@ -37,7 +64,88 @@ async def create_input(
     root_dir = root_dir or ""
     log.info("loading input from root_dir=%s", config.base_dir)
     progress_reporter = progress_reporter or NullProgressLogger()
+    storage = _create_input_storage(config, root_dir)
+
+    if config.file_type in loaders:
+        progress = progress_reporter.child(
+            f"Loading Input ({config.file_type})", transient=False
+        )
+        loader = loaders[config.file_type]
+        results = await loader(config, progress, storage)
+        return cast("pd.DataFrame", results)
+
+    msg = f"Unknown input type {config.file_type}"
+    raise ValueError(msg)
+
+
+async def stream_input(
+    config: InputConfig,
+    batch_documents: int,
+    batch_tokens: int | None = None,
+    encoding_model: str = defs.ENCODING_MODEL,
+    root_dir: str | None = None,
+) -> AsyncIterator[pd.DataFrame]:
+    """Stream input documents in batches, loading one file at a time.
 
+    Each batch holds at most `batch_documents` documents and, when `batch_tokens` is
+    set, at most that many tokens of text (a single larger document gets a batch of
+    its own).
+    """
+    storage = _create_input_storage(config, root_dir or "")
+    find_files, load_file = _get_file_loader(config)
+    encoder = tiktoken.get_encoding(encoding_model) if batch_tokens else None
+
+    batch: list[pd.DataFrame] = []
+    num_documents = 0
+    num_tokens = 0
+    for path, group in find_files(config, None, storage):
+        try:
+            documents = await load_file(path, group, config, storage)
+        except Exception:  # noqa: BLE001 (catching Exception is fine here)
+            log.warning("Warning! Error loading file %s. Skipping...", path)
+            continue
+
+        tokens = (
+            [len(encoder.encode(text)) for text in documents["text"]]
+            if encoder
+            else [0] * len(documents)
+        )
+        start = 0
+        for index, document_tokens in enumerate(tokens):
+            if num_documents > 0 and (
+                num_documents >= batch_documents
+                or (batch_tokens and num_tokens + document_tokens > batch_tokens)
+            ):
+                batch.append(documents.iloc[start:index])
+                yield pd.concat(batch, ignore_index=True)
+                batch, num_documents, num_tokens, start = [], 0, 0, index
+            num_documents += 1
+            num_tokens += document_tokens
+        batch.append(documents.iloc[start:])
+
+    if num_documents > 0:
+        yield pd.concat(batch, ignore_index=True)
+
+
+async def fingerprint_input(config: InputConfig, root_dir: str | None = None) -> str:
+    """Hash the input files, reading one file at a time."""
+    storage = _create_input_storage(config, root_dir or "")
+    find_files, _ = _get_file_loader(config)
+    fingerprint = sha256()
+    for path, _ in sorted(find_files(config, None, storage)):
+        fingerprint.update(path.encode("utf-8"))
+        fingerprint.update(sha256(await storage.get(path, as_bytes=True)).digest())
+    return fingerprint.hexdigest()
+
+
+def _get_file_loader(config: InputConfig) -> tuple[FindFilesFn, LoadFileFn]:
+    if config.file_type not in file_loaders:
+        msg = f"Unknown input type {config.file_type}"
+        raise ValueError(msg)
+    return file_loaders[config.file_type]
+
+
+def _create_input_storage(config: InputConfig, root_dir: str) -> PipelineStorage:
     match config.type:
         case InputType.blob:
             log.info("using blob storage input")
@@ -50,7 +158,7 @@ async def create_input(
             ):
                 msg = "Connection string or storage account blob url required for blob storage"
                 raise ValueError(msg)
-            storage = BlobPipelineStorage(
+            return BlobPipelineStorage(
                 connection_string=config.connection_string,
                 storage_account_blob_url=config.storage_account_blob_url,
                 container_name=config.container_name,
@@ -58,22 +166,11 @@ async def create_input(
             )
         case InputType.file:
             log.info("using file storage for input")
-            storage = FilePipelineStorage(
+            return FilePipelineStorage(
                 root_dir=str(Path(root_dir) / (config.base_dir or ""))
             )
         case _:
             log.info("using file storage for input")
-            storage = FilePipelineStorage(
+            return FilePipelineStorage(
                 root_dir=str(Path(root_dir) / (config.base_dir or ""))
             )
-
-    if config.file_type in loaders:
-        progress = progress_reporter.child(
-            f"Loading Input ({config.file_type})", transient=False
-        )
-        loader = loaders[config.file_type]
-        results = await loader(config, progress, storage)
-        return cast("pd.DataFrame", results)
-
-    msg = f"Unknown input type {config.file_type}"
-    raise ValueError(msg)
@@ -28,18 +28,26 @@ async def load(
     storage: PipelineStorage,
 ) -> pd.DataFrame:
     """Load text inputs from a directory."""
+    files = find_files(config, progress, storage)
+    files_loaded = []
+
+    for file, group in files:
+        try:
+            files_loaded.append(await load_file(file, group, config, storage))
+        except Exception:  # noqa: BLE001 (catching Exception is fine here)
+            log.warning("Warning! Error loading file %s. Skipping...", file)
 
-    async def load_file(
-        path: str, group: dict | None = None, _encoding: str = "utf-8"
-    ) -> dict[str, Any]:
-        if group is None:
-            group = {}
-        text = await storage.get(path, encoding="utf-8")
-        new_item = {**group, "text": text}
-        new_item["id"] = gen_sha512_hash(new_item, new_item.keys())
-        new_item["title"] = str(Path(path).name)
-        return new_item
+    log.info("Found %d files, loading %d", len(files), len(files_loaded))
+
+    return pd.DataFrame(files_loaded)
 
+
+def find_files(
+    config: InputConfig,
+    progress: ProgressLogger | None,
+    storage: PipelineStorage,
+) -> list[tuple[str, dict[str, Any]]]:
+    """Find the text files to load."""
     files = list(
         storage.find(
             re.compile(config.file_pattern),
@@ -52,15 +60,20 @@ async def load(
         raise ValueError(msg)
     found_files = f"found text files from {config.base_dir}, found {files}"
     log.info(found_files)
+    return files
 
-    files_loaded = []
 
-    for file, group in files:
-        try:
-            files_loaded.append(await load_file(file, group))
-        except Exception:  # noqa: BLE001 (catching Exception is fine here)
-            log.warning("Warning! Error loading file %s. Skipping...", file)
-
-    log.info("Found %d files, loading %d", len(files), len(files_loaded))
-
-    return pd.DataFrame(files_loaded)
+async def load_file(
+    path: str,
+    group: dict | None,
+    _config: InputConfig,
+    storage: PipelineStorage,
+) -> dict[str, Any]:
+    """Load a single text file as a document record."""
+    if group is None:
+        group = {}
+    text = await storage.get(path, encoding="utf-8")
+    new_item = {**group, "text": text}
+    new_item["id"] = gen_sha512_hash(new_item, new_item.keys())
+    new_item["title"] = str(Path(path).name)
+    return new_item
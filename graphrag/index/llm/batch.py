@@ -0,0 +1,214 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Batch submission of chat completion requests."""
+
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from openai.types.chat import ChatCompletion
+
+log = logging.getLogger(__name__)
+
+
+class BatchError(Exception):
+    """A batch job, or one of its requests, failed."""
+
+
+class BatchBackend(ABC):
+    """Runs JSONL batch jobs, in the OpenAI batch input and output formats."""
+
+    url: str = "/v1/chat/completions"
+    """The endpoint the requests of a job are sent to."""
+
+    @abstractmethod
+    async def submit(self, batch_id: str, requests: list[dict[str, Any]]) -> str:
+        """Submit the requests of a batch, returning the id of the job."""
+
+    @abstractmethod
+    async def poll(self, job_id: str) -> list[dict[str, Any]] | None:
+        """Get the output records of a job once it completes, or None while it runs."""
+
+
+class OpenAIBatchBackend(BatchBackend):
+    """Runs batch jobs through the batch endpoint of OpenAI or Azure OpenAI."""
+
+    def __init__(self, client: Any, url: str = "/v1/chat/completions"):
+        self._client = client
+        self.url = url
+
+    async def submit(self, batch_id: str, requests: list[dict[str, Any]]) -> str:
+        """Upload the requests as a JSONL file and create a job for it."""
+        file = await self._client.files.create(
+            file=(f"{batch_id}.jsonl", _to_jsonl(requests)), purpose="batch"
+        )
+        job = await self._client.batches.create(
+            input_file_id=file.id, endpoint=self.url, completion_window="24h"
+        )
+        return job.id
+
+    async def poll(self, job_id: str) -> list[dict[str, Any]] | None:
+        """Get the output and error records of a completed job."""
+        job = await self._client.batches.retrieve(job_id)
+        if job.status in ("validating", "in_progress", "finalizing"):
+            return None
+        if job.status != "completed":
+            msg = f"Batch job {job_id} ended as {job.status}: {job.errors}"
+            raise BatchError(msg)
+        records = []
+        for file_id in (job.output_file_id, job.error_file_id):
+            if file_id is not None:
+                content = await self._client.files.content(file_id)
+                records.extend(_from_jsonl(content.text))
+        return records
+
+
+class FileBatchBackend(BatchBackend):
+    """A local stand-in for a batch endpoint.
+
+    Each job is written to `<batch_id>.jsonl` in `directory`, and completes once its
+    output records are written to `<batch_id>.output.jsonl`, by a test or by any
+    other process.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+
+    async def submit(self, batch_id: str, requests: list[dict[str, Any]]) -> str:
+        """Write the requests of a batch to a JSONL file."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / f"{batch_id}.jsonl").write_bytes(_to_jsonl(requests))
+        return batch_id
+
+    async def poll(self, job_id: str) -> list[dict[str, Any]] | None:
+        """Read the output records of a job, if they have been written."""
+        path = self.directory / f"{job_id}.output.jsonl"
+        if not path.exists():
+            return None
+        return _from_jsonl(path.read_text(encoding="utf-8"))
+
+
+class BatchScheduler:
+    """Collects chat completion requests into batch jobs and resolves them from the job output.
+
+    Requests are submitted once `max_size` of them are pending, or once no new
+    request has arrived for `flush_interval` seconds. Running jobs are polled every
+    `poll_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        backend: BatchBackend,
+        model: str,
+        max_size: int = 50_000,
+        flush_interval: float = 10.0,
+        poll_interval: float = 60.0,
+    ):
+        self.backend = backend
+        self.model = model
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.poll_interval = poll_interval
+        self._pending: list[tuple[dict[str, Any], asyncio.Future]] = []
+        self._last_request = 0.0
+        self._flusher: asyncio.Task | None = None
+        self._jobs: set[asyncio.Task] = set()
+
+    async def create(self, **body: Any) -> ChatCompletion:
+        """Queue a chat completion request and wait for its batch to complete."""
+        loop = asyncio.get_running_loop()
+        body = {k: v for k, v in body.items() if v is not None}
+        body["model"] = self.model
+        future = loop.create_future()
+        self._pending.append((body, future))
+        self._last_request = loop.time()
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_when_quiet())
+        return await future
+
+    async def _flush_when_quiet(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            quiet = loop.time() - self._last_request
+            if quiet >= self.flush_interval:
+                self._flush()
+            else:
+                await asyncio.sleep(self.flush_interval - quiet)
+
+    def _flush(self) -> None:
+        pending, self._pending = self._pending, []
+        job = asyncio.create_task(self._run(pending))
+        self._jobs.add(job)
+        job.add_done_callback(self._jobs.discard)
+
+    async def _run(self, pending: list[tuple[dict[str, Any], asyncio.Future]]) -> None:
+        batch_id = uuid4().hex
+        requests = [
+            {
+                "custom_id": str(i),
+                "method": "POST",
+                "url": self.backend.url,
+                "body": body,
+            }
+            for i, (body, _) in enumerate(pending)
+        ]
+        try:
+            job_id = await self.backend.submit(batch_id, requests)
+            log.info("submitted batch %s with %d requests", job_id, len(requests))
+            while (records := await self.backend.poll(job_id)) is None:  # noqa: ASYNC110
+                await asyncio.sleep(self.poll_interval)
+        except Exception as e:  # noqa: BLE001
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        results = {record["custom_id"]: record for record in records}
+        for i, (_, future) in enumerate(pending):
+            if future.done():
+                continue
+            record = results.get(str(i))
+            response = (record or {}).get("response") or {}
+            if response.get("status_code") == 200:
+                future.set_result(ChatCompletion.model_validate(response["body"]))
+            else:
+                error = (record or {}).get("error") or response.get("body")
+                msg = f"Request {i} of batch {job_id} failed: {error}"
+                future.set_exception(BatchError(msg))
+
+
+class _BatchCompletions:
+    def __init__(self, scheduler: BatchScheduler):
+        self._scheduler = scheduler
+
+    async def create(self, **kwargs: Any) -> ChatCompletion:
+        return await self._scheduler.create(**kwargs)
+
+
+class _BatchChat:
+    def __init__(self, scheduler: BatchScheduler):
+        self.completions = _BatchCompletions(scheduler)
+
+
+class BatchClient:
+    """Stands in for the OpenAI client of a chat LLM, sending its completions through a `BatchScheduler`."""
+
+    def __init__(self, scheduler: BatchScheduler):
+        self.chat = _BatchChat(scheduler)
+
+
+def _to_jsonl(records: list[dict[str, Any]]) -> bytes:
+    return "".join(
+        json.dumps(record, ensure_ascii=False) + "\n" for record in records
+    ).encode("utf-8")
+
+
+def _from_jsonl(text: str) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
@@ -5,6 +5,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -19,17 +22,40 @@ from fnllm.openai import (
     create_openai_embeddings_llm,
 )
 from fnllm.openai.types.chat.parameters import OpenAIChatParameters
+from fnllm.services.cache_interactor import CacheInteractor
 
 import graphrag.config.defaults as defs
-from graphrag.config.enums import LLMType
+from graphrag.config.enums import BatchBackendType, LLMType
 from graphrag.config.models.language_model_config import (
     LanguageModelConfig,  # noqa: TC001
 )
+from graphrag.index.llm.batch import (
+    BatchClient,
+    BatchScheduler,
+    FileBatchBackend,
+    OpenAIBatchBackend,
+)
 from graphrag.index.llm.manager import ChatLLMSingleton, EmbeddingsLLMSingleton
+from graphrag.index.utils.adaptive_limiter import (
+    is_throttling_error,
+    report_throttled,
+)
+from graphrag.index.utils.rate_limiter import (
+    RateLimiter,
+    get_rate_limiter,
+    get_request_slots,
+)
+from graphrag.index.workflow_stats import current_workflow_stats
 
 from .mock_llm import MockChatLLM
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from fnllm.limiting import Manifest
+    from fnllm.types.generics import TJsonModel
+    from fnllm.types.metrics import LLMUsageMetrics
+
     from graphrag.cache.pipeline_cache import PipelineCache
     from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
     from graphrag.index.typing import ErrorHandlerFn
@@ -38,10 +64,18 @@ log = logging.getLogger(__name__)
 
 
 class GraphRagLLMEvents(LLMEvents):
-    """LLM events handler that calls the error handler."""
+    """LLM events handler that calls the error handler, records workflow stats and applies the shared rate and concurrency limits."""
 
-    def __init__(self, on_error: ErrorHandlerFn):
+    def __init__(
+        self,
+        on_error: ErrorHandlerFn,
+        rate_limiter: RateLimiter | None = None,
+        request_slots: asyncio.Semaphore | None = None,
+    ):
         self._on_error = on_error
+        self._rate_limiter = rate_limiter
+        self._request_slots = request_slots
+        self._holding: set[int] = set()
 
     async def on_error(
         self,
@@ -52,6 +86,58 @@ class GraphRagLLMEvents(LLMEvents):
         """Handle an fnllm error."""
         self._on_error(error, traceback, arguments)
 
+    async def on_execute_llm(self) -> None:
+        """Count a request sent to the model."""
+        if stats := current_workflow_stats():
+            stats.llm_calls += 1
+
+    async def on_limit_acquired(self, manifest: Manifest) -> None:
+        """Wait for an open-request slot and the request's share of the deployment's rate limits."""
+        if self._request_slots is not None:
+            await self._request_slots.acquire()
+            self._holding.add(id(manifest))
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(manifest.request_tokens)
+
+    async def on_limit_released(self, manifest: Manifest) -> None:
+        """Free the open-request slot of a finished request."""
+        # also called when the request was cancelled before it got a slot
+        if id(manifest) in self._holding:
+            self._holding.discard(id(manifest))
+            self._request_slots.release()  # type: ignore
+
+    async def on_post_limit(self, manifest: Manifest) -> None:
+        """Take the tokens the request used beyond its estimate."""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.settle(manifest.post_request_tokens)
+
+    async def on_usage(self, usage: LLMUsageMetrics) -> None:
+        """Count the tokens used by a request."""
+        if stats := current_workflow_stats():
+            stats.prompt_tokens += usage.input_tokens
+            stats.completion_tokens += usage.output_tokens
+
+    async def on_cache_hit(self, cache_key: str, name: str | None) -> None:
+        """Count a response served from the cache."""
+        if stats := current_workflow_stats():
+            stats.cache_hits += 1
+
+    async def on_cache_miss(self, cache_key: str, name: str | None) -> None:
+        """Count a response missing from the cache."""
+        if stats := current_workflow_stats():
+            stats.cache_misses += 1
+
+    async def on_retryable_error(
+        self, error: BaseException, attempt_number: int
+    ) -> None:
+        """Count a request that will be retried, and slow down adaptive concurrency if it was throttled."""
+        if is_throttling_error(error):
+            report_throttled()
+        if stats := current_workflow_stats():
+            stats.retries += 1
+            if getattr(error, "status_code", None) == 429:
+                stats.rate_limit_errors += 1
+
 
 class GraphRagLLMCache(LLMCache):
     """A cache for the pipeline."""
@@ -87,6 +173,82 @@ class GraphRagLLMCache(LLMCache):
         return GraphRagLLMCache(child_cache)
 
 
+class CoalescingCacheInteractor(CacheInteractor):
+    """A cache interactor that makes concurrent identical requests share a single call.
+
+    The first request for a key calls the model (or reads the cache) while the
+    identical requests that arrive before it completes wait for its response. If it
+    fails, the waiting requests make their own calls, so errors are not shared.
+    """
+
+    def __init__(
+        self,
+        events: LLMEvents | None = None,
+        cache: LLMCache | None = None,
+        in_flight: dict[str, asyncio.Future] | None = None,
+    ):
+        super().__init__(events, cache)
+        self._in_flight = {} if in_flight is None else in_flight
+
+    def child(self, name: str) -> CoalescingCacheInteractor:
+        """Create a child cache interactor, sharing the requests in flight."""
+        if self._cache is None:
+            return self
+        return CoalescingCacheInteractor(
+            self._events, self._cache.child(name), self._in_flight
+        )
+
+    async def get_or_insert(
+        self,
+        func: Callable[[], Awaitable[TJsonModel]],
+        *,
+        prefix: str,
+        key_data: dict[str, Any],
+        name: str | None,
+        json_model: type[TJsonModel],
+        bypass_cache: bool = False,
+    ) -> TJsonModel:
+        """Get or insert an item into the cache, joining an identical request in flight."""
+        key = f"{prefix}_{hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()}"
+        loop = asyncio.get_running_loop()
+        while not bypass_cache:
+            leader = self._in_flight.get(key)
+            if leader is None or leader.get_loop() is not loop:
+                break
+            succeeded, entry = await asyncio.shield(leader)
+            if succeeded:
+                if stats := current_workflow_stats():
+                    stats.coalesced_requests += 1
+                return entry
+
+        if bypass_cache or key in self._in_flight:
+            return await super().get_or_insert(
+                func,
+                prefix=prefix,
+                key_data=key_data,
+                name=name,
+                json_model=json_model,
+                bypass_cache=bypass_cache,
+            )
+
+        future = loop.create_future()
+        self._in_flight[key] = future
+        try:
+            entry = await super().get_or_insert(
+                func,
+                prefix=prefix,
+                key_data=key_data,
+                name=name,
+                json_model=json_model,
+            )
+            future.set_result((True, entry))
+            return entry
+        finally:
+            if not future.done():
+                future.set_result((False, None))
+            del self._in_flight[key]
+
+
 def create_cache(cache: PipelineCache | None, name: str) -> LLMCache | None:
     """Create an LLM cache from a pipeline cache."""
     if cache is None:
@@ -170,10 +332,16 @@ def _load_openai_chat_llm(
     config: LanguageModelConfig,
     azure=False,
 ):
+    if config.batch_backend is not None:
+        return _create_batch_chat_llm(
+            _create_openai_config(config, azure), on_error, cache, config, azure
+        )
     return _create_openai_chat_llm(
         _create_openai_config(config, azure),
         on_error,
         cache,
+        _create_rate_limiter(config),
+        _create_request_slots(config),
     )
 
 
@@ -187,9 +355,43 @@ def _load_openai_embeddings_llm(
         _create_openai_config(config, azure),
         on_error,
         cache,
+        _create_rate_limiter(config),
+        _create_request_slots(config),
     )
 
 
+def _create_rate_limiter(config: LanguageModelConfig) -> RateLimiter | None:
+    """Get the rate limiter shared by every LLM that uses the same deployment.
+
+    The per-LLM limiters of fnllm are left to limit concurrency only, since each of
+    them would otherwise spend the whole deployment budget on its own.
+    """
+    if not config.requests_per_minute and not config.tokens_per_minute:
+        return None
+    return get_rate_limiter(
+        _deployment_key(config),
+        config.requests_per_minute,
+        config.tokens_per_minute,
+        config.rate_limit_state_path,
+    )
+
+
+def _create_request_slots(config: LanguageModelConfig) -> asyncio.Semaphore | None:
+    """Get the `concurrent_requests` slots shared by every LLM that uses the same deployment.
+
+    The per-LLM limits of fnllm still apply, but no longer add up when workflows that
+    use the same model run side by side.
+    """
+    if not config.concurrent_requests:
+        return None
+    return get_request_slots(_deployment_key(config), config.concurrent_requests)
+
+
+def _deployment_key(config: LanguageModelConfig) -> str:
+    deployment = config.deployment_name or config.model
+    return f"{config.api_base or config.type}/{deployment}"
+
+
 def _create_openai_config(config: LanguageModelConfig, azure: bool) -> OpenAIConfig:
     encoding_model = config.encoding_model
     json_strategy = (
@@ -218,8 +420,6 @@ def _create_openai_config(config: LanguageModelConfig, azure: bool) -> OpenAICon
             organization=config.organization,
             max_retries=config.max_retries,
             max_retry_wait=config.max_retry_wait,
-            requests_per_minute=config.requests_per_minute,
-            tokens_per_minute=config.tokens_per_minute,
             cognitive_services_endpoint=audience,
             timeout=config.request_timeout,
             max_concurrency=config.concurrent_requests,
@@ -235,8 +435,6 @@ def _create_openai_config(config: LanguageModelConfig, azure: bool) -> OpenAICon
         organization=config.organization,
         max_retries=config.max_retries,
         max_retry_wait=config.max_retry_wait,
-        requests_per_minute=config.requests_per_minute,
-        tokens_per_minute=config.tokens_per_minute,
         timeout=config.request_timeout,
         max_concurrency=config.concurrent_requests,
         model=config.model,
@@ -294,14 +492,56 @@ def _create_openai_chat_llm(
     configuration: OpenAIConfig,
     on_error: ErrorHandlerFn,
     cache: LLMCache,
+    rate_limiter: RateLimiter | None = None,
+    request_slots: asyncio.Semaphore | None = None,
+    client: Any = None,
 ) -> ChatLLM:
-    """Create an openAI chat llm."""
-    client = create_openai_client(configuration)
+    """Create an openAI chat llm, optionally with a stand-in for the OpenAI client."""
+    client = client or create_openai_client(configuration)
+    events = GraphRagLLMEvents(on_error, rate_limiter, request_slots)
     return create_openai_chat_llm(
         configuration,
         client=client,
-        cache=cache,
-        events=GraphRagLLMEvents(on_error),
+        cache_interactor=CoalescingCacheInteractor(events, cache),
+        events=events,
+    )
+
+
+def _create_batch_chat_llm(
+    configuration: OpenAIConfig,
+    on_error: ErrorHandlerFn,
+    cache: LLMCache,
+    config: LanguageModelConfig,
+    azure: bool,
+) -> ChatLLM:
+    """Create an openAI chat llm that sends its requests as batch jobs.
+
+    Only the client is replaced, so responses go through the same cache, parsing
+    and retries as the requests sent one at a time.
+    """
+    client = create_openai_client(configuration)
+    backend = (
+        FileBatchBackend(config.batch_dir)
+        if config.batch_backend == BatchBackendType.file
+        else OpenAIBatchBackend(
+            client, "/chat/completions" if azure else "/v1/chat/completions"
+        )
+    )
+    scheduler = BatchScheduler(
+        backend,
+        model=config.deployment_name or config.model,
+        max_size=config.batch_max_size,
+        flush_interval=config.batch_flush_interval,
+        poll_interval=config.batch_poll_interval,
+    )
+    # requests wait for their whole batch, a concurrency limit would cap its size
+    configuration = configuration.model_copy(update={"max_concurrency": None})
+    events = GraphRagLLMEvents(on_error)
+    return create_openai_chat_llm(
+        configuration,
+        client=BatchClient(scheduler),  # type: ignore
+        cache_interactor=CoalescingCacheInteractor(events, cache),
+        events=events,
     )
 
 
@@ -309,12 +549,16 @@ def _create_openai_embeddings_llm(
     configuration: OpenAIConfig,
     on_error: ErrorHandlerFn,
     cache: LLMCache,
+    rate_limiter: RateLimiter | None = None,
+    request_slots: asyncio.Semaphore | None = None,
+    client: Any = None,
 ) -> EmbeddingsLLM:
-    """Create an openAI embeddings llm."""
-    client = create_openai_client(configuration)
+    """Create an openAI embeddings llm, optionally with a stand-in for the OpenAI client."""
+    client = client or create_openai_client(configuration)
+    events = GraphRagLLMEvents(on_error, rate_limiter, request_slots)
     return create_openai_embeddings_llm(
         configuration,
         client=client,
-        cache=cache,
-        events=GraphRagLLMEvents(on_error),
+        cache_interactor=CoalescingCacheInteractor(events, cache),
+        events=events,
     )
@@ -0,0 +1,250 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A simulated OpenAI service, with latency, rate limits and errors, for benchmarks."""
+
+import asyncio
+import hashlib
+import itertools
+import json
+import math
+import random
+import re
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+import numpy as np
+from openai import InternalServerError, RateLimitError
+from openai.types import CreateEmbeddingResponse
+from openai.types.chat import ChatCompletion
+
+from graphrag.index.operations.extract_graph.graph_extractor import (
+    DEFAULT_COMPLETION_DELIMITER,
+    DEFAULT_RECORD_DELIMITER,
+    DEFAULT_TUPLE_DELIMITER,
+)
+from graphrag.index.utils.rate_limiter import RateLimiter
+
+ENTITY_PATTERN = re.compile(r"\b(PERSON|ORGANIZATION|GEO|EVENT)_\d+\b")
+"""The entity names the simulated model extracts, see `generate_corpus`."""
+
+_CHARS_PER_TOKEN = 4
+_EMBEDDING_DIMENSIONS = 32
+
+
+@dataclass
+class LLMSimulation:
+    """How the simulated service behaves."""
+
+    latency_median: float = 1.0
+    """The median time to the first token, in seconds."""
+
+    latency_sigma: float = 0.5
+    """The shape of the log-normal latency distribution; higher values give longer tails."""
+
+    output_tokens_per_second: float = 100.0
+    """The generation speed, added to the latency of each chat completion."""
+
+    requests_per_minute: int = 0
+    """The request quota of the service (0 is unlimited); requests over it fail with a 429."""
+
+    tokens_per_minute: int = 0
+    """The token quota of the service (0 is unlimited); requests over it fail with a 429."""
+
+    error_rate: float = 0.0
+    """The fraction of requests that fail with a 500."""
+
+    seed: int = 0
+    """The seed of the latency and error draws."""
+
+
+@dataclass
+class SimulatedRequest:
+    """A request handled by the simulated service."""
+
+    tag: str | None
+    kind: str
+    start: float
+    end: float
+    status: int
+    tokens: int
+
+
+class SimulatedClient:
+    """Stands in for the OpenAI client under fnllm, answering requests from the text of their prompts.
+
+    Graph extraction returns the `ENTITY_PATTERN` names found in the input text,
+    related when they share a sentence; community reports, summaries and gleaning
+    checks get minimal well-formed answers. Every request is recorded with the
+    value of `tag` when it arrived.
+    """
+
+    def __init__(
+        self,
+        simulation: LLMSimulation,
+        tag: Callable[[], str | None] = lambda: None,
+    ):
+        self.simulation = simulation
+        self.requests: list[SimulatedRequest] = []
+        self._tag = tag
+        self._random = random.Random(simulation.seed)  # noqa: S311
+        self._quota = RateLimiter(
+            "simulated", simulation.requests_per_minute, simulation.tokens_per_minute
+        )
+        self.chat = _Namespace(completions=_Namespace(create=self._chat))
+        self.embeddings = _Namespace(create=self._embed)
+
+    async def _chat(
+        self, *, messages: list[dict[str, Any]], **_: Any
+    ) -> ChatCompletion:
+        prompt = str(messages[-1]["content"])
+        content = _respond(prompt)
+        input_tokens = (
+            sum(len(str(message["content"])) for message in messages)
+            // _CHARS_PER_TOKEN
+        )
+        output_tokens = len(content) // _CHARS_PER_TOKEN
+        await self._serve(
+            "chat",
+            input_tokens + output_tokens,
+            output_tokens / self.simulation.output_tokens_per_second,
+        )
+        return ChatCompletion.model_validate({
+            "id": "simulated",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": "simulated",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": content},
+                }
+            ],
+            "usage": {
+                "prompt_tokens": input_tokens,
+                "completion_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            },
+        })
+
+    async def _embed(
+        self, *, input: str | list[str], **_: Any
+    ) -> CreateEmbeddingResponse:
+        texts = [input] if isinstance(input, str) else input
+        tokens = sum(len(text) for text in texts) // _CHARS_PER_TOKEN
+        await self._serve("embedding", tokens, 0.0)
+        return CreateEmbeddingResponse.model_validate({
+            "object": "list",
+            "model": "simulated",
+            "data": [
+                {"object": "embedding", "index": i, "embedding": _embedding(text)}
+                for i, text in enumerate(texts)
+            ],
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+        })
+
+    async def _serve(self, kind: str, tokens: int, generation_time: float) -> None:
+        start = time.monotonic()
+        request = SimulatedRequest(self._tag(), kind, start, start, 200, tokens)
+        self.requests.append(request)
+        latency = self._random.lognormvariate(
+            math.log(self.simulation.latency_median), self.simulation.latency_sigma
+        )
+        failed = self._random.random() < self.simulation.error_rate
+        retry_after = self._quota.try_acquire(tokens)
+        if retry_after > 0:
+            request.status = 429
+            request.end = time.monotonic()
+            msg = f"Rate limit reached. Please retry after {math.ceil(retry_after)} seconds."
+            raise RateLimitError(msg, response=_response(429), body=None)
+        await asyncio.sleep(latency + generation_time)
+        request.end = time.monotonic()
+        if failed:
+            request.status = 500
+            msg = "The server had an error while processing your request."
+            raise InternalServerError(msg, response=_response(500), body=None)
+
+
+class _Namespace:
+    def __init__(self, **attributes: Any):
+        self.__dict__.update(attributes)
+
+
+def _response(status: int) -> httpx.Response:
+    return httpx.Response(
+        status, request=httpx.Request("POST", "https://simulated.invalid/v1")
+    )
+
+
+def _embedding(text: str) -> list[float]:
+    seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "little")
+    vector = np.random.default_rng(seed).standard_normal(_EMBEDDING_DIMENSIONS)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+def _respond(prompt: str) -> str:
+    if prompt.startswith("MANY entities"):
+        return ""
+    if prompt.startswith("It appears some entities"):
+        return "N"
+    if '"summaries"' in prompt:
+        items = json.loads(prompt.split("Items:")[-1].split("\n")[0])
+        return json.dumps({
+            "summaries": [
+                {
+                    "id": item["id"],
+                    "description": f"{item['entities']} appears together with related entities in the corpus.",
+                }
+                for item in items
+            ]
+        })
+    if "Description List:" in prompt:
+        entities = prompt.split("Entities:")[-1].split("\n")[0].strip()
+        return f"{entities} appears together with related entities in the corpus."
+    if '"findings"' in prompt:
+        names = _entities(prompt.split("Real Data")[-1])
+        title = f"Community around {names[0]}" if names else "Community"
+        return json.dumps({
+            "title": title,
+            "summary": f"A community of {len(names)} entities.",
+            "rating": 5.0,
+            "rating_explanation": "The community has a moderate impact.",
+            "findings": [
+                {"summary": name, "explanation": f"{name} is part of {title}."}
+                for name in names[:5]
+            ],
+        })
+    if "Claim description:" in prompt:
+        return DEFAULT_COMPLETION_DELIMITER
+    if "-Real Data-" in prompt:
+        return _extract_graph(prompt.split("-Real Data-")[-1].split("Text:", 1)[-1])
+    return "Hello World"
+
+
+def _entities(text: str) -> list[str]:
+    return list(
+        dict.fromkeys(match.group(0) for match in ENTITY_PATTERN.finditer(text))
+    )
+
+
+def _extract_graph(text: str) -> str:
+    # describe each entity and relationship by the sentence it is mentioned in,
+    # so mentions across texts give lists of different descriptions to summarize
+    records = []
+    for sentence in text.split("."):
+        names = _entities(sentence)
+        context = " ".join(sentence.split()[:8])
+        for name in names:
+            entity_type = name.split("_")[0]
+            records.append(
+                f'("entity"{DEFAULT_TUPLE_DELIMITER}{name}{DEFAULT_TUPLE_DELIMITER}{entity_type}{DEFAULT_TUPLE_DELIMITER}{name} is mentioned in: {context})'
+            )
+        for source, target in itertools.pairwise(names):
+            records.append(
+                f'("relationship"{DEFAULT_TUPLE_DELIMITER}{source}{DEFAULT_TUPLE_DELIMITER}{target}{DEFAULT_TUPLE_DELIMITER}{source} and {target} are mentioned together in: {context}{DEFAULT_TUPLE_DELIMITER}1)'
+            )
+    return DEFAULT_RECORD_DELIMITER.join(records) + DEFAULT_COMPLETION_DELIMITER
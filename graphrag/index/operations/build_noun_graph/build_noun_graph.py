@@ -7,19 +7,27 @@ import math
 
 import pandas as pd
 
+from graphrag.config.enums import AsyncType
 from graphrag.index.operations.build_noun_graph.np_extractors.base import (
     BaseNounPhraseExtractor,
 )
+from graphrag.index.utils.process_pool import parallel_apply
 
 
 def build_noun_graph(
     text_unit_df: pd.DataFrame,
     text_analyzer: BaseNounPhraseExtractor,
     normalize_edge_weights: bool,
+    async_mode: AsyncType = AsyncType.Threaded,
+    num_processes: int | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Build a noun graph from text units."""
+    """Build a noun graph from text units.
+
+    With `AsyncType.Process`, noun phrases are extracted in a pool of `num_processes`
+    worker processes, each holding its own copy of the text analyzer.
+    """
     text_units = text_unit_df.loc[:, ["id", "text"]]
-    nodes_df = _extract_nodes(text_units, text_analyzer)
+    nodes_df = _extract_nodes(text_units, text_analyzer, async_mode, num_processes)
     edges_df = _extract_edges(nodes_df, normalize_edge_weights=normalize_edge_weights)
 
     return (nodes_df, edges_df)
@@ -28,6 +36,8 @@ def build_noun_graph(
 def _extract_nodes(
     text_unit_df: pd.DataFrame,
     text_analyzer: BaseNounPhraseExtractor,
+    async_mode: AsyncType = AsyncType.Threaded,
+    num_processes: int | None = None,
 ) -> pd.DataFrame:
     """
     Extract initial nodes and edges from text units.
@@ -35,9 +45,14 @@ def _extract_nodes(
     Input: text unit df with schema [id, text, document_id]
     Returns a dataframe with schema [id, title, freq, text_unit_ids].
     """
-    text_unit_df["noun_phrases"] = text_unit_df["text"].apply(
-        lambda text: text_analyzer.extract(text)
-    )
+    if async_mode == AsyncType.Process:
+        text_unit_df["noun_phrases"] = parallel_apply(
+            text_unit_df["text"], text_analyzer.extract, num_processes
+        )
+    else:
+        text_unit_df["noun_phrases"] = text_unit_df["text"].apply(
+            lambda text: text_analyzer.extract(text)
+        )
     noun_node_df = text_unit_df.explode("noun_phrases")
     noun_node_df = noun_node_df.rename(
         columns={"noun_phrases": "title", "id": "text_unit_id"}
@@ -6,6 +6,7 @@
 from typing import Any
 
 import spacy
+from spacy.language import Language
 from spacy.tokens.doc import Doc
 
 from graphrag.index.operations.build_noun_graph.np_extractors.base import (
@@ -56,15 +57,28 @@ class CFGNounPhraseExtractor(BaseNounPhraseExtractor):
         )
         self.include_named_entities = include_named_entities
         self.exclude_entity_tags = exclude_entity_tags
-        if not include_named_entities:
-            self.nlp = spacy.load(model_name, exclude=["lemmatizer", "parser", "ner"])
-        else:
-            self.nlp = spacy.load(model_name, exclude=["lemmatizer", "parser"])
+        self.nlp = self._load_model()
 
         self.exclude_pos_tags = exclude_pos_tags
         self.noun_phrase_grammars = noun_phrase_grammars
         self.noun_phrase_tags = noun_phrase_tags
 
+    def _load_model(self) -> Language:
+        if not self.include_named_entities:
+            return spacy.load(self.model_name, exclude=["lemmatizer", "parser", "ner"])
+        return spacy.load(self.model_name, exclude=["lemmatizer", "parser"])
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the extractor without the SpaCy pipeline, e.g. to send it to a worker process."""
+        state = self.__dict__.copy()
+        del state["nlp"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Reload the SpaCy pipeline after unpickling."""
+        self.__dict__.update(state)
+        self.nlp = self._load_model()
+
     def extract(
         self,
         text: str,
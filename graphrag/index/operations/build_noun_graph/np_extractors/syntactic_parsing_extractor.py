@@ -6,6 +6,7 @@
 from typing import Any
 
 import spacy
+from spacy.language import Language
 from spacy.tokens.span import Span
 from spacy.util import filter_spans
 
@@ -54,13 +55,26 @@ class SyntacticNounPhraseExtractor(BaseNounPhraseExtractor):
         )
         self.include_named_entities = include_named_entities
         self.exclude_entity_tags = exclude_entity_tags
-        if not include_named_entities:
-            self.nlp = spacy.load(model_name, exclude=["lemmatizer", "ner"])
-        else:
-            self.nlp = spacy.load(model_name, exclude=["lemmatizer"])
+        self.nlp = self._load_model()
 
         self.exclude_pos_tags = exclude_pos_tags
 
+    def _load_model(self) -> Language:
+        if not self.include_named_entities:
+            return spacy.load(self.model_name, exclude=["lemmatizer", "ner"])
+        return spacy.load(self.model_name, exclude=["lemmatizer"])
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the extractor without the SpaCy pipeline, e.g. to send it to a worker process."""
+        state = self.__dict__.copy()
+        del state["nlp"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Reload the SpaCy pipeline after unpickling."""
+        self.__dict__.update(state)
+        self.nlp = self._load_model()
+
     def extract(
         self,
         text: str,
@@ -4,34 +4,70 @@
 """A module containing cluster_graph, apply_clustering and run_layout methods definition."""
 
 import logging
+from collections import defaultdict
+from functools import partial
 
 import networkx as nx
+import pandas as pd
 
+from graphrag.index.utils.csr_graph import CSRGraph
+from graphrag.index.utils.process_pool import parallel_apply
 from graphrag.index.utils.stable_lcc import stable_largest_connected_component
 
 Communities = list[tuple[int, int, int, list[str]]]
 
+# the level, node, cluster and parent cluster of each node in a hierarchical clustering
+Partitions = list[tuple[int, str, int, int | None]]
+
 
 log = logging.getLogger(__name__)
 
 
 def cluster_graph(
-    graph: nx.Graph,
+    graph: nx.Graph | CSRGraph,
     max_cluster_size: int,
     use_lcc: bool,
     seed: int | None = None,
+    per_component: bool = False,
+    num_processes: int | None = None,
 ) -> Communities:
-    """Apply a hierarchical clustering algorithm to a graph."""
+    """Apply a hierarchical clustering algorithm to a graph.
+
+    With `per_component`, each connected component is clustered on its own, in a
+    pool of `num_processes` worker processes.
+    """
     if len(graph.nodes) == 0:
         log.warning("Graph has no nodes")
         return []
 
-    node_id_to_community_map, parent_mapping = _compute_leiden_communities(
-        graph=graph,
-        max_cluster_size=max_cluster_size,
-        use_lcc=use_lcc,
-        seed=seed,
-    )
+    if isinstance(graph, CSRGraph):
+        # only the nodes that get clustered are converted for graspologic, and
+        # the stable LCC may already have been computed to embed the graph
+        graph = (
+            graph.stable_largest_connected_component()
+            if use_lcc
+            else graph.to_networkx()
+        )
+        use_lcc = False
+
+    if per_component:
+        if use_lcc:
+            graph = stable_largest_connected_component(graph)
+        node_id_to_community_map, parent_mapping = (
+            _compute_leiden_communities_by_component(
+                graph=graph,
+                max_cluster_size=max_cluster_size,
+                seed=seed,
+                num_processes=num_processes,
+            )
+        )
+    else:
+        node_id_to_community_map, parent_mapping = _compute_leiden_communities(
+            graph=graph,
+            max_cluster_size=max_cluster_size,
+            use_lcc=use_lcc,
+            seed=seed,
+        )
 
     levels = sorted(node_id_to_community_map.keys())
 
@@ -52,6 +88,124 @@ def cluster_graph(
     return results
 
 
+def recluster_graph(
+    graph: nx.Graph | CSRGraph,
+    previous: Communities,
+    touched: set[str],
+    max_cluster_size: int,
+    use_lcc: bool,
+    seed: int | None = None,
+) -> tuple[Communities, set[int]]:
+    """Update the hierarchical clustering of a graph that has grown, reclustering only the communities with touched nodes.
+
+    The level 0 communities of `previous` that contain a `touched` node are clustered
+    again together with the nodes new to the graph, starting Leiden from their
+    previous communities, and every other community is kept as it is. Reclustered
+    communities that end up with the same level and nodes as before keep their id,
+    and the others are numbered after the largest previous id.
+
+    Returns the clusters, and the ids of the communities that are new or contain a
+    touched node, whose reports need to be generated again.
+    """
+    if len(graph.nodes) == 0:
+        log.warning("Graph has no nodes")
+        return [], set()
+
+    if isinstance(graph, CSRGraph):
+        graph = (
+            graph.stable_largest_connected_component()
+            if use_lcc
+            else graph.to_networkx()
+        )
+    elif use_lcc:
+        graph = stable_largest_connected_component(graph)
+
+    root_of = {
+        node: community
+        for level, community, _, nodes in previous
+        if level == 0
+        for node in nodes
+    }
+    touched = {node for node in graph.nodes if node in touched or node not in root_of}
+    touched_roots = {root_of[node] for node in touched if node in root_of}
+    children: dict[int, list[int]] = defaultdict(list)
+    for _, community, parent, _ in previous:
+        children[parent].append(community)
+    removed: set[int] = set()
+    pending = list(touched_roots)
+    while pending:
+        community = pending.pop()
+        removed.add(community)
+        pending.extend(children[community])
+
+    nodes = [
+        node
+        for node in graph.nodes
+        if node not in root_of or root_of[node] in touched_roots
+    ]
+    edges = list(graph.subgraph(nodes).edges(data="weight", default=1.0))
+    # graspologic needs a starting community for each node, numbered from 0
+    starting_ids: dict[object, int] = {}
+    starting_communities = {
+        node: starting_ids.setdefault(root_of.get(node, node), len(starting_ids))
+        for node in dict.fromkeys(node for edge in edges for node in edge[:2])
+    }
+    members: dict[int, list[str]] = defaultdict(list)
+    levels: dict[int, int] = {}
+    parents: dict[int, int | None] = {}
+    partitions = (
+        _leiden_partitions(edges, max_cluster_size, seed, starting_communities)
+        if edges
+        else []
+    )
+    for level, node, cluster, parent in partitions:
+        members[cluster].append(node)
+        levels[cluster] = level
+        parents[cluster] = parent
+    # nodes without edges among the reclustered nodes are left out by Leiden
+    for node in nodes:
+        if node not in starting_communities:
+            cluster = max(levels, default=-1) + 1
+            members[cluster].append(node)
+            levels[cluster] = 0
+            parents[cluster] = None
+
+    removed_ids = {
+        (level, frozenset(community_nodes)): community
+        for level, community, _, community_nodes in previous
+        if community in removed
+    }
+    next_id = max((community for _, community, _, _ in previous), default=-1) + 1
+    ids: dict[int, int] = {}
+    changed: set[int] = set()
+    for cluster in sorted(levels, key=lambda cluster: (levels[cluster], cluster)):
+        community = removed_ids.pop(
+            (levels[cluster], frozenset(members[cluster])), None
+        )
+        if community is None:
+            community = next_id
+            next_id += 1
+            changed.add(community)
+        elif not touched.isdisjoint(members[cluster]):
+            changed.add(community)
+        ids[cluster] = community
+
+    clusters: Communities = [
+        cluster for cluster in previous if cluster[1] not in removed
+    ]
+    clusters.extend(
+        (
+            levels[cluster],
+            ids[cluster],
+            ids[parents[cluster]] if parents[cluster] is not None else -1,
+            members[cluster],
+        )
+        for cluster in levels
+    )
+    clusters.sort(key=lambda cluster: (cluster[0], cluster[1]))
+    return clusters, changed
+
+
 # Taken from graph_intelligence & adapted
 def _compute_leiden_communities(
     graph: nx.Graph | nx.DiGraph,
@@ -80,3 +234,88 @@ def _compute_leiden_communities(
         )
 
     return results, hierarchy
+
+
+def _compute_leiden_communities_by_component(
+    graph: nx.Graph,
+    max_cluster_size: int,
+    seed: int | None = None,
+    num_processes: int | None = None,
+) -> tuple[dict[int, dict[str, int]], dict[int, int]]:
+    """Return Leiden root communities and their hierarchy mapping, clustering each connected component on its own.
+
+    Components no larger than `max_cluster_size` become a single community, and the
+    others are clustered in worker processes with the same seed, so a component gets
+    the same communities whatever else is in the graph. Community ids are numbered
+    level by level, in the order the components appear in the graph.
+    """
+    component_of: dict[str, int] = {}
+    for index, component in enumerate(nx.connected_components(graph)):
+        component_of.update(dict.fromkeys(component, index))
+    num_components = len(set(component_of.values()))
+    nodes: list[list[str]] = [[] for _ in range(num_components)]
+    for node in graph.nodes:
+        nodes[component_of[node]].append(node)
+    edges: list[list[tuple[str, str, float]]] = [[] for _ in range(num_components)]
+    for source, target, weight in graph.edges(data="weight", default=1.0):
+        edges[component_of[source]].append((source, target, weight))
+
+    partitions: list[Partitions] = [
+        [(0, node, 0, None) for node in component] for component in nodes
+    ]
+    large = [
+        index
+        for index, component in enumerate(nodes)
+        if len(component) > max_cluster_size
+    ]
+    clustered = parallel_apply(
+        pd.Series([edges[index] for index in large], dtype=object),
+        partial(_leiden_partitions, max_cluster_size=max_cluster_size, seed=seed),
+        num_processes,
+        batch_size=1,
+    )
+    for index, component_partitions in zip(large, clustered, strict=True):
+        partitions[index] = component_partitions
+
+    # cluster ids are unique across the levels of a component, and increase with the level
+    keys = sorted({
+        (level, index, cluster)
+        for index, component_partitions in enumerate(partitions)
+        for level, _, cluster, _ in component_partitions
+    })
+    ids = {(index, cluster): number for number, (_, index, cluster) in enumerate(keys)}
+    results: dict[int, dict[str, int]] = {}
+    hierarchy: dict[int, int] = {}
+    for index, component_partitions in enumerate(partitions):
+        for level, node, cluster, parent in component_partitions:
+            results.setdefault(level, {})[node] = ids[index, cluster]
+            hierarchy[ids[index, cluster]] = (
+                ids[index, parent] if parent is not None else -1
+            )
+    return results, hierarchy
+
+
+def _leiden_partitions(
+    edges: list[tuple[str, str, float]],
+    max_cluster_size: int,
+    seed: int | None = None,
+    starting_communities: dict[str, int] | None = None,
+) -> Partitions:
+    """Cluster the edges of a graph, such as one connected component in a worker process."""
+    # NOTE: This import is done here to reduce the initial import time of the graphrag package
+    from graspologic.partition import hierarchical_leiden
+
+    return [
+        (
+            partition.level,
+            partition.node,
+            partition.cluster,
+            partition.parent_cluster,
+        )
+        for partition in hierarchical_leiden(
+            edges,
+            max_cluster_size=max_cluster_size,
+            starting_communities=starting_communities,
+            random_seed=seed,
+        )
+    ]
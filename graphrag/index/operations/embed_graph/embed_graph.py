@@ -10,11 +10,12 @@ from graphrag.index.operations.embed_graph.embed_node2vec import embed_node2vec
 from graphrag.index.operations.embed_graph.typing import (
     NodeEmbeddings,
 )
+from graphrag.index.utils.csr_graph import CSRGraph
 from graphrag.index.utils.stable_lcc import stable_largest_connected_component
 
 
 def embed_graph(
-    graph: nx.Graph,
+    graph: nx.Graph | CSRGraph,
     config: EmbedGraphConfig,
 ) -> NodeEmbeddings:
     """
@@ -30,7 +31,13 @@ def embed_graph(
     random_seed: 86 # Optional, The random seed to use for the embedding, default: 86
     ```
     """
-    if config.use_lcc:
+    if isinstance(graph, CSRGraph):
+        graph = (
+            graph.stable_largest_connected_component()
+            if config.use_lcc
+            else graph.to_networkx()
+        )
+    elif config.use_lcc:
         graph = stable_largest_connected_component(graph)
 
     # create graph embedding using node2vec
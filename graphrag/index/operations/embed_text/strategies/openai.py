@@ -10,12 +10,17 @@ from typing import Any
 import numpy as np
 from fnllm import EmbeddingsLLM
 
+from graphrag.cache.embedding_cache import EmbeddingCache
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.language_model_config import LanguageModelConfig
 from graphrag.index.llm.load_llm import load_llm_embeddings
 from graphrag.index.operations.embed_text.strategies.typing import TextEmbeddingResult
 from graphrag.index.text_splitting.text_splitting import TokenTextSplitter
+from graphrag.index.utils.adaptive_limiter import (
+    ConcurrencyLimiter,
+    create_concurrency_limiter,
+)
 from graphrag.index.utils.is_null import is_null
 from graphrag.logger.progress import ProgressTicker, progress_ticker
 
@@ -37,21 +42,41 @@ async def run(
     llm_config = args["llm"]
     llm_config = LanguageModelConfig(**args["llm"])
     splitter = _get_splitter(llm_config, batch_max_tokens)
-    llm = _get_llm(llm_config, callbacks, cache)
-    semaphore: asyncio.Semaphore = asyncio.Semaphore(args.get("num_threads", 4))
+    llm = _get_llm(llm_config, callbacks)
+    embedding_cache = EmbeddingCache(
+        cache,
+        llm_config.model,
+        deployment_name=llm_config.deployment_name,
+        api_base=llm_config.api_base,
+        batch_size=batch_size,
+    )
+    semaphore = create_concurrency_limiter(
+        llm_config.async_mode, args.get("num_threads", 4)
+    )
 
     # Break up the input texts. The sizes here indicate how many snippets are in each input text
     texts, input_sizes = _prepare_embed_texts(input, splitter)
+
+    # Only embed the snippets that are not cached yet, once each
+    cached = await embedding_cache.get(texts)
+    missing = list(
+        dict.fromkeys(
+            text
+            for text, embedding in zip(texts, cached, strict=True)
+            if embedding is None
+        )
+    )
     text_batches = _create_text_batches(
-        texts,
+        missing,
         batch_size,
         batch_max_tokens,
         splitter,
     )
     log.info(
-        "embedding %d inputs via %d snippets using %d batches. max_batch_size=%d, max_tokens=%d",
+        "embedding %d inputs via %d snippets (%d cached) using %d batches. max_batch_size=%d, max_tokens=%d",
         len(input),
         len(texts),
+        len(texts) - len(missing),
         len(text_batches),
         batch_size,
         batch_max_tokens,
@@ -59,7 +84,13 @@ async def run(
     ticker = progress_ticker(callbacks.progress, len(text_batches))
 
     # Embed each chunk of snippets
-    embeddings = await _execute(llm, text_batches, ticker, semaphore)
+    new_embeddings = await _execute(llm, text_batches, ticker, semaphore)
+    await embedding_cache.set(missing, new_embeddings)
+    embedded = dict(zip(missing, new_embeddings, strict=True))
+    embeddings = [
+        embedding if embedding is not None else embedded[text]
+        for text, embedding in zip(texts, cached, strict=True)
+    ]
     embeddings = _reconstitute_embeddings(embeddings, input_sizes)
 
     return TextEmbeddingResult(embeddings=embeddings)
@@ -77,13 +108,13 @@ def _get_splitter(
 def _get_llm(
     config: LanguageModelConfig,
     callbacks: WorkflowCallbacks,
-    cache: PipelineCache,
 ) -> EmbeddingsLLM:
+    # embeddings are cached per text by the EmbeddingCache, not per request
     return load_llm_embeddings(
         "text_embedding",
         config,
         callbacks=callbacks,
-        cache=cache,
+        cache=None,
     )
 
 
@@ -91,7 +122,7 @@ async def _execute(
     llm: EmbeddingsLLM,
     chunks: list[list[str]],
     tick: ProgressTicker,
-    semaphore: asyncio.Semaphore,
+    semaphore: ConcurrencyLimiter,
 ) -> list[list[float]]:
     async def embed(chunk: list[str]):
         async with semaphore:
@@ -39,6 +39,7 @@ async def extract_covariates(
     async_mode: AsyncType = AsyncType.AsyncIO,
     entity_types: list[str] | None = None,
     num_threads: int = 4,
+    longest_first: bool = False,
 ):
     """Extract claims from a piece of text."""
     log.debug("extract_covariates strategy=%s", strategy)
@@ -71,6 +72,7 @@ async def extract_covariates(
         callbacks,
         async_type=async_mode,
         num_threads=num_threads,
+        cost_column="n_tokens" if longest_first and "n_tokens" in input else None,
     )
     return pd.DataFrame([item for row in results for item in row or []])
 
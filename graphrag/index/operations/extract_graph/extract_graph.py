@@ -34,6 +34,7 @@ async def extract_graph(
     async_mode: AsyncType = AsyncType.AsyncIO,
     entity_types=DEFAULT_ENTITY_TYPES,
     num_threads: int = 4,
+    longest_first: bool = False,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Extract entities from a piece of text.
@@ -68,6 +69,7 @@ async def extract_graph(
         completion_delimiter: "<|COMPLETE|>" # Optional, the delimiter to use for the LLM to mark completion
         tuple_delimiter: "<|>" # Optional, the delimiter to use for the LLM to mark a tuple
         record_delimiter: "##" # Optional, the delimiter to use for the LLM to mark a record
+        max_pack_tokens: 0 # Optional, pack consecutive text units into one extraction call up to this many tokens
 
         encoding_name: cl100k_base # Optional, The encoding to use for the LLM with gleanings
 
@@ -98,10 +100,8 @@ async def extract_graph(
 
     async def run_strategy(row):
         nonlocal num_started
-        text = row[text_column]
-        id = row[id_column]
         result = await strategy_exec(
-            [Document(text=text, id=id)],
+            row["documents"],
             entity_types,
             callbacks,
             cache,
@@ -110,12 +110,16 @@ async def extract_graph(
         num_started += 1
         return [result.entities, result.relationships, result.graph]
 
+    packs = _pack_text_units(
+        text_units, text_column, id_column, strategy_config.get("max_pack_tokens", 0)
+    )
     results = await derive_from_rows(
-        text_units,
+        packs,
         run_strategy,
         callbacks,
         async_type=async_mode,
         num_threads=num_threads,
+        cost_column="n_tokens" if longest_first and "n_tokens" in packs else None,
     )
 
     entity_dfs = []
@@ -146,8 +150,33 @@ def _load_strategy(strategy_type: ExtractEntityStrategyType) -> EntityExtractStr
             raise ValueError(msg)
 
 
+def _pack_text_units(
+    text_units: pd.DataFrame, text_column: str, id_column: str, max_tokens: int
+) -> pd.DataFrame:
+    """Group consecutive text units into the documents of each strategy call, up to `max_tokens` per call."""
+    documents = [
+        Document(text=text, id=id)
+        for text, id in zip(text_units[text_column], text_units[id_column], strict=True)
+    ]
+    if "n_tokens" not in text_units:
+        return pd.DataFrame({"documents": [[document] for document in documents]})
+
+    packs: list[list[Document]] = []
+    pack_tokens: list[int] = []
+    for document, n_tokens in zip(documents, text_units["n_tokens"], strict=True):
+        if packs and max_tokens > 0 and pack_tokens[-1] + n_tokens <= max_tokens:
+            packs[-1].append(document)
+            pack_tokens[-1] += n_tokens
+        else:
+            packs.append([document])
+            pack_tokens.append(n_tokens)
+    return pd.DataFrame({"documents": packs, "n_tokens": pack_tokens})
+
+
 def _merge_entities(entity_dfs) -> pd.DataFrame:
     all_entities = pd.concat(entity_dfs, ignore_index=True)
+    if all_entities.empty:
+        return pd.DataFrame(columns=["title", "type", "description", "text_unit_ids"])
     return (
         all_entities.groupby(["title", "type"], sort=False)
         .agg(description=("description", list), text_unit_ids=("source_id", list))
@@ -157,6 +186,10 @@ def _merge_entities(entity_dfs) -> pd.DataFrame:
 
 def _merge_relationships(relationship_dfs) -> pd.DataFrame:
     all_relationships = pd.concat(relationship_dfs, ignore_index=False)
+    if all_relationships.empty:
+        return pd.DataFrame(
+            columns=["source", "target", "description", "text_unit_ids", "weight"]
+        )
     return (
         all_relationships.groupby(["source", "target"], sort=False)
         .agg(
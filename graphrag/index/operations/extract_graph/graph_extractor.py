@@ -27,6 +27,7 @@ DEFAULT_TUPLE_DELIMITER = "<|>"
 DEFAULT_RECORD_DELIMITER = "##"
 DEFAULT_COMPLETION_DELIMITER = "<|COMPLETE|>"
 DEFAULT_ENTITY_TYPES = ["organization", "person", "geo", "event"]
+PACKED_TEXT_HEADER = "-----Text {index}-----"
 
 log = logging.getLogger(__name__)
 
@@ -55,6 +56,7 @@ class GraphExtractor:
     _summarization_prompt: str
     _loop_args: dict[str, Any]
     _max_gleanings: int
+    _max_pack_tokens: int
     _on_error: ErrorHandlerFn
 
     def __init__(
@@ -70,6 +72,7 @@ class GraphExtractor:
         encoding_model: str | None = None,
         max_gleanings: int | None = None,
         on_error: ErrorHandlerFn | None = None,
+        max_pack_tokens: int = 0,
     ):
         """Init method definition."""
         # TODO: streamline construction
@@ -88,18 +91,24 @@ class GraphExtractor:
             if max_gleanings is not None
             else defs.EXTRACT_GRAPH_MAX_GLEANINGS
         )
+        self._max_pack_tokens = max_pack_tokens
         self._on_error = on_error or (lambda _e, _s, _d: None)
 
         # Construct the looping arguments
-        encoding = tiktoken.get_encoding(encoding_model or defs.ENCODING_MODEL)
-        yes = f"{encoding.encode('Y')[0]}"
-        no = f"{encoding.encode('N')[0]}"
+        self._encoding = tiktoken.get_encoding(encoding_model or defs.ENCODING_MODEL)
+        yes = f"{self._encoding.encode('Y')[0]}"
+        no = f"{self._encoding.encode('N')[0]}"
         self._loop_args = {"logit_bias": {yes: 100, no: 100}, "max_tokens": 1}
 
     async def __call__(
         self, texts: list[str], prompt_variables: dict[str, Any] | None = None
     ) -> GraphExtractionResult:
-        """Call method definition."""
+        """Extract a graph from each text.
+
+        With `max_pack_tokens` set, consecutive texts are packed into one extraction
+        prompt up to that many tokens, and each extracted record is attributed to the
+        texts of the pack that mention its entities.
+        """
         if prompt_variables is None:
             prompt_variables = {}
         all_records: dict[int, str] = {}
@@ -121,19 +130,38 @@ class GraphExtractor:
             ),
         }
 
-        for doc_index, text in enumerate(texts):
+        for pack in self._pack(texts):
+            text = (
+                texts[pack[0]]
+                if len(pack) == 1
+                else "\n\n".join(
+                    f"{PACKED_TEXT_HEADER.format(index=n + 1)}\n{texts[doc_index]}"
+                    for n, doc_index in enumerate(pack)
+                )
+            )
             try:
                 # Invoke the entity extraction
                 result = await self._process_document(text, prompt_variables)
-                source_doc_map[doc_index] = text
-                all_records[doc_index] = result
+                results = (
+                    [result]
+                    if len(pack) == 1
+                    else _attribute_records(
+                        result,
+                        [texts[doc_index] for doc_index in pack],
+                        prompt_variables[self._tuple_delimiter_key],
+                        prompt_variables[self._record_delimiter_key],
+                    )
+                )
+                for doc_index, doc_result in zip(pack, results, strict=True):
+                    source_doc_map[doc_index] = texts[doc_index]
+                    all_records[doc_index] = doc_result
             except Exception as e:
                 log.exception("error extracting graph")
                 self._on_error(
                     e,
                     traceback.format_exc(),
                     {
-                        "doc_index": doc_index,
+                        "doc_index": pack[0] if len(pack) == 1 else pack,
                         "text": text,
                     },
                 )
@@ -149,6 +177,22 @@ class GraphExtractor:
             source_docs=source_doc_map,
         )
 
+    def _pack(self, texts: list[str]) -> list[list[int]]:
+        """Group the indices of consecutive texts up to the token budget of a pack."""
+        if self._max_pack_tokens <= 0:
+            return [[doc_index] for doc_index in range(len(texts))]
+        packs: list[list[int]] = []
+        pack_tokens = 0
+        for doc_index, text in enumerate(texts):
+            num_tokens = len(self._encoding.encode(text))
+            if packs and pack_tokens + num_tokens <= self._max_pack_tokens:
+                packs[-1].append(doc_index)
+                pack_tokens += num_tokens
+            else:
+                packs.append([doc_index])
+                pack_tokens = num_tokens
+        return packs
+
     async def _process_document(
         self, text: str, prompt_variables: dict[str, str]
     ) -> str:
@@ -299,6 +343,50 @@ class GraphExtractor:
         return graph
 
 
+def _attribute_records(
+    result: str, texts: list[str], tuple_delimiter: str, record_delimiter: str
+) -> list[str]:
+    """Split the records extracted from packed texts by the texts they came from.
+
+    Names are matched as whole words. An entity belongs to the texts that mention it,
+    or to all of them if none does. A relationship belongs to the texts that mention
+    both of its ends, where an end no text mentions matches any text; a relationship
+    between ends only mentioned in different texts is dropped, since it can only come
+    from packing the texts together.
+    """
+    upper_texts = [text.upper() for text in texts]
+    text_records: list[list[str]] = [[] for _ in texts]
+    num_dropped = 0
+    for record in result.split(record_delimiter):
+        record_attributes = re.sub(r"^\(|\)$", "", record.strip()).split(
+            tuple_delimiter
+        )
+        if record_attributes[0] == '"entity"':
+            names = record_attributes[1:2]
+        elif record_attributes[0] == '"relationship"':
+            names = record_attributes[1:3]
+        else:
+            continue
+        mentioned_by = []
+        for name in names:
+            pattern = re.compile(rf"(?<!\w){re.escape(clean_str(name).upper())}(?!\w)")
+            mentioned = {
+                i for i, text in enumerate(upper_texts) if pattern.search(text)
+            }
+            mentioned_by.append(mentioned or set(range(len(texts))))
+        mentions = sorted(set.intersection(*mentioned_by))
+        if not mentions:
+            num_dropped += 1
+        for i in mentions:
+            text_records[i].append(record)
+    if num_dropped:
+        log.info(
+            "dropped %d relationships between entities of different packed texts",
+            num_dropped,
+        )
+    return [record_delimiter.join(records) for records in text_records]
+
+
 def _unpack_descriptions(data: Mapping) -> list[str]:
     value = data.get("description", None)
     return [] if value is None else value.split("\n")
@@ -52,12 +52,14 @@ async def run_extract_graph(
     extraction_prompt = args.get("extraction_prompt", None)
     encoding_model = args.get("encoding_name", None)
     max_gleanings = args.get("max_gleanings", defs.EXTRACT_GRAPH_MAX_GLEANINGS)
+    max_pack_tokens = args.get("max_pack_tokens", defs.EXTRACT_GRAPH_MAX_PACK_TOKENS)
 
     extractor = GraphExtractor(
         llm_invoker=llm,
         prompt=extraction_prompt,
         encoding_model=encoding_model,
         max_gleanings=max_gleanings,
+        max_pack_tokens=max_pack_tokens,
         on_error=lambda e, s, d: (
             callbacks.error("Entity Extraction Error", e, s, d) if callbacks else None
         ),
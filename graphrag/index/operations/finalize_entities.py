@@ -10,9 +10,9 @@ import pandas as pd
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.embed_graph_config import EmbedGraphConfig
 from graphrag.index.operations.compute_degree import compute_degree
-from graphrag.index.operations.create_graph import create_graph
 from graphrag.index.operations.embed_graph.embed_graph import embed_graph
 from graphrag.index.operations.layout_graph.layout_graph import layout_graph
+from graphrag.index.utils.csr_graph import CSRGraph
 
 
 def finalize_entities(
@@ -21,17 +21,23 @@ def finalize_entities(
     callbacks: WorkflowCallbacks,
     embed_config: EmbedGraphConfig | None = None,
     layout_enabled: bool = False,
+    graph: CSRGraph | None = None,
 ) -> pd.DataFrame:
-    """All the steps to transform final entities."""
-    graph = create_graph(relationships)
+    """All the steps to transform final entities.
+
+    `graph` is the graph of `relationships`, if it was already built.
+    """
+    if graph is None:
+        graph = CSRGraph.from_edges(relationships)
     graph_embeddings = None
     if embed_config is not None and embed_config.enabled:
         graph_embeddings = embed_graph(
             graph,
             embed_config,
         )
+    # umap works on networkx, the zero layout only needs the nodes
     layout = layout_graph(
-        graph,
+        graph.to_networkx(with_edges=layout_enabled),
         callbacks,
         layout_enabled,
         embeddings=graph_embeddings,
@@ -38,6 +38,7 @@ async def summarize_communities(
     max_input_length: int,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    longest_first: bool = False,
 ):
     """Generate community summaries."""
     reports: list[CommunityReport | None] = []
@@ -79,6 +80,9 @@ async def summarize_communities(
             callbacks=NoopWorkflowCallbacks(),
             num_threads=num_threads,
             async_type=async_mode,
+            cost_column=schemas.CONTEXT_SIZE
+            if longest_first and schemas.CONTEXT_SIZE in level_context
+            else None,
         )
         reports.extend([lr for lr in local_reports if lr is not None])
 
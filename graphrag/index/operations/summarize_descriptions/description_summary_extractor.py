@@ -3,14 +3,23 @@
 
 """A module containing 'GraphExtractionResult' and 'GraphExtractor' models."""
 
+import asyncio
 import json
+import logging
+import traceback
 from dataclasses import dataclass
 
 from fnllm import ChatLLM
+from pydantic import BaseModel, Field
 
 from graphrag.index.typing import ErrorHandlerFn
 from graphrag.index.utils.tokens import num_tokens_from_string
-from graphrag.prompts.index.summarize_descriptions import SUMMARIZE_PROMPT
+from graphrag.prompts.index.summarize_descriptions import (
+    BATCH_SUMMARIZE_PROMPT,
+    SUMMARIZE_PROMPT,
+)
+
+log = logging.getLogger(__name__)
 
 # Max token size for input prompts
 DEFAULT_MAX_INPUT_TOKENS = 4_000
@@ -18,6 +27,19 @@ DEFAULT_MAX_INPUT_TOKENS = 4_000
 DEFAULT_MAX_SUMMARY_LENGTH = 500
 
 
+class SummaryModel(BaseModel):
+    """A model for the expected LLM response shape."""
+
+    id: int = Field(description="The id of the summarized item.")
+    description: str = Field(description="The summary of the item.")
+
+
+class BatchSummaryResponse(BaseModel):
+    """A model for the expected LLM response shape."""
+
+    summaries: list[SummaryModel] = Field(description="The summary of each item.")
+
+
 @dataclass
 class SummarizationResult:
     """Unipartite graph extraction result class definition."""
@@ -33,6 +55,7 @@ class SummarizeExtractor:
     _entity_name_key: str
     _input_descriptions_key: str
     _summarization_prompt: str
+    _batch_summarization_prompt: str
     _on_error: ErrorHandlerFn
     _max_summary_length: int
     _max_input_tokens: int
@@ -46,6 +69,7 @@ class SummarizeExtractor:
         on_error: ErrorHandlerFn | None = None,
         max_summary_length: int | None = None,
         max_input_tokens: int | None = None,
+        batch_summarization_prompt: str | None = None,
     ):
         """Init method definition."""
         # TODO: streamline construction
@@ -54,6 +78,9 @@ class SummarizeExtractor:
         self._input_descriptions_key = input_descriptions_key or "description_list"
 
         self._summarization_prompt = summarization_prompt or SUMMARIZE_PROMPT
+        self._batch_summarization_prompt = (
+            batch_summarization_prompt or BATCH_SUMMARIZE_PROMPT
+        )
         self._on_error = on_error or (lambda _e, _s, _d: None)
         self._max_summary_length = max_summary_length or DEFAULT_MAX_SUMMARY_LENGTH
         self._max_input_tokens = max_input_tokens or DEFAULT_MAX_INPUT_TOKENS
@@ -77,6 +104,66 @@ class SummarizeExtractor:
             description=result or "",
         )
 
+    async def summarize_batch(
+        self, items: list[tuple[str | tuple[str, str], list[str]]]
+    ) -> list[SummarizationResult]:
+        """Summarize the descriptions of several entities or relationships in one call.
+
+        Items the response has no summary for, or all of them if the call fails, are
+        summarized one call each instead.
+        """
+        pending = {i: item for i, item in enumerate(items) if len(item[1]) > 1}
+        summaries: dict[int, str] = {}
+        if len(pending) > 1:
+            try:
+                summaries = await self._summarize_batch_with_llm(pending)
+            except Exception as e:
+                log.exception("error summarizing descriptions batch")
+                self._on_error(
+                    e, traceback.format_exc(), {"ids": [id for id, _ in items]}
+                )
+
+        async def summarize(
+            i: int, id: str | tuple[str, str], descriptions: list[str]
+        ) -> SummarizationResult:
+            if i in summaries:
+                return SummarizationResult(id=id, description=summaries[i])
+            return await self(id, descriptions)
+
+        return await asyncio.gather(*[
+            summarize(i, id, descriptions) for i, (id, descriptions) in enumerate(items)
+        ])
+
+    async def _summarize_batch_with_llm(
+        self, items: dict[int, tuple[str | tuple[str, str], list[str]]]
+    ) -> dict[int, str]:
+        """Summarize the descriptions of each item using one LLM call."""
+        response = await self._llm(
+            self._batch_summarization_prompt.format(
+                items=json.dumps(
+                    [
+                        {
+                            "id": i,
+                            "entities": id,
+                            "descriptions": sorted(descriptions),
+                        }
+                        for i, (id, descriptions) in items.items()
+                    ],
+                    ensure_ascii=False,
+                )
+            ),
+            json=True,
+            name="summarize_batch",
+            json_model=BatchSummaryResponse,
+            model_parameters={"max_tokens": self._max_summary_length * len(items)},
+        )
+        output: BatchSummaryResponse = response.parsed_json  # type: ignore
+        return {
+            summary.id: summary.description
+            for summary in output.summaries
+            if summary.id in items and summary.description
+        }
+
     async def _summarize_descriptions(
         self, id: str | tuple[str, str], descriptions: list[str]
     ) -> str:
@@ -36,6 +36,28 @@ async def run_graph_intelligence(
     return await run_summarize_descriptions(llm, id, descriptions, callbacks, args)
 
 
+async def run_graph_intelligence_batch(
+    items: list[tuple[str | tuple[str, str], list[str]]],
+    callbacks: WorkflowCallbacks,
+    cache: PipelineCache,
+    args: StrategyConfig,
+) -> list[SummarizedDescriptionResult]:
+    """Run the graph intelligence description summarization strategy on a batch of entities or relationships."""
+    llm_config = LanguageModelConfig(**args["llm"])
+    llm = load_llm(
+        "summarize_descriptions",
+        llm_config,
+        callbacks=callbacks,
+        cache=cache,
+    )
+    extractor = _create_extractor(llm, callbacks, args)
+    results = await extractor.summarize_batch(items)
+    return [
+        SummarizedDescriptionResult(id=result.id, description=result.description)
+        for result in results
+    ]
+
+
 async def run_summarize_descriptions(
     llm: ChatLLM,
     id: str | tuple[str, str],
@@ -44,13 +66,21 @@ async def run_summarize_descriptions(
     args: StrategyConfig,
 ) -> SummarizedDescriptionResult:
     """Run the entity extraction chain."""
+    extractor = _create_extractor(llm, callbacks, args)
+    result = await extractor(id=id, descriptions=descriptions)
+    return SummarizedDescriptionResult(id=result.id, description=result.description)
+
+
+def _create_extractor(
+    llm: ChatLLM, callbacks: WorkflowCallbacks, args: StrategyConfig
+) -> SummarizeExtractor:
     # Extraction Arguments
     summarize_prompt = args.get("summarize_prompt", None)
     entity_name_key = args.get("entity_name_key", "entity_name")
     input_descriptions_key = args.get("input_descriptions_key", "description_list")
     max_tokens = args.get("max_tokens", None)
 
-    extractor = SummarizeExtractor(
+    return SummarizeExtractor(
         llm_invoker=llm,
         summarization_prompt=summarize_prompt,
         entity_name_key=entity_name_key,
@@ -62,7 +92,5 @@ async def run_summarize_descriptions(
         ),
         max_summary_length=args.get("max_summary_length", None),
         max_input_tokens=max_tokens,
+        batch_summarization_prompt=args.get("batch_summarize_prompt", None),
     )
-
-    result = await extractor(id=id, descriptions=descriptions)
-    return SummarizedDescriptionResult(id=result.id, description=result.description)
@@ -11,10 +11,20 @@ import pandas as pd
 
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.config.enums import AsyncType
+from graphrag.index.operations.summarize_descriptions.description_summary_extractor import (
+    DEFAULT_MAX_SUMMARY_LENGTH,
+)
 from graphrag.index.operations.summarize_descriptions.typing import (
+    BatchSummarizationStrategy,
     SummarizationStrategy,
     SummarizeStrategyType,
 )
+from graphrag.index.utils.adaptive_limiter import (
+    ConcurrencyLimiter,
+    create_concurrency_limiter,
+)
+from graphrag.index.utils.tokens import num_tokens_from_string
 from graphrag.logger.progress import ProgressTicker, progress_ticker
 
 log = logging.getLogger(__name__)
@@ -27,6 +37,7 @@ async def summarize_descriptions(
     cache: PipelineCache,
     strategy: dict[str, Any] | None = None,
     num_threads: int = 4,
+    async_mode: AsyncType = AsyncType.AsyncIO,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Summarize entity and relationship descriptions from an entity graph.
@@ -54,6 +65,8 @@ async def summarize_descriptions(
     strategy:
         type: graph_intelligence
         summarize_prompt: # Optional, the prompt to use for extraction
+        batch_summarize_prompt: # Optional, the prompt to use for batched summarization
+        max_batch_tokens: 0 # Optional, summarize short description lists together in calls of up to this many tokens
 
 
         llm: # The configuration for the LLM
@@ -75,25 +88,59 @@ async def summarize_descriptions(
         strategy.get("type", SummarizeStrategyType.graph_intelligence)
     )
     strategy_config = {**strategy}
+    max_batch_tokens = strategy_config.get("max_batch_tokens", 0)
+    batch_strategy_exec = (
+        load_batch_strategy(
+            strategy.get("type", SummarizeStrategyType.graph_intelligence)
+        )
+        if max_batch_tokens > 0
+        else None
+    )
+    if (
+        batch_strategy_exec is not None
+        and strategy_config.get("summarize_prompt")
+        and not strategy_config.get("batch_summarize_prompt")
+    ):
+        log.warning(
+            "summarize_descriptions has a custom prompt but no batch prompt, batched descriptions use the built-in batch prompt"
+        )
 
     async def get_summarized(
-        nodes: pd.DataFrame, edges: pd.DataFrame, semaphore: asyncio.Semaphore
+        nodes: pd.DataFrame, edges: pd.DataFrame, semaphore: ConcurrencyLimiter
     ):
-        ticker_length = len(nodes) + len(edges)
-
-        ticker = progress_ticker(callbacks.progress, ticker_length)
-
-        node_futures = [
-            do_summarize_descriptions(
-                str(row[1]["title"]),
+        node_items = [
+            (str(row[1]["title"]), sorted(set(row[1]["description"])))
+            for row in nodes.iterrows()
+        ]
+        edge_items = [
+            (
+                (str(row[1]["source"]), str(row[1]["target"])),
                 sorted(set(row[1]["description"])),
-                ticker,
-                semaphore,
             )
-            for row in nodes.iterrows()
+            for row in edges.iterrows()
         ]
+        items = node_items + edge_items
 
-        node_results = await asyncio.gather(*node_futures)
+        ticker = progress_ticker(callbacks.progress, len(items))
+
+        if batch_strategy_exec is None:
+            batches = [[i] for i in range(len(items))]
+        else:
+            batches = _batch_items(
+                items,
+                max_batch_tokens,
+                strategy_config.get("max_summary_length") or DEFAULT_MAX_SUMMARY_LENGTH,
+            )
+        batch_results = await asyncio.gather(*[
+            do_summarize_descriptions([items[i] for i in batch], ticker, semaphore)
+            for batch in batches
+        ])
+        results: list[Any] = [None] * len(items)
+        for batch, batch_result in zip(batches, batch_results, strict=True):
+            for i, result in zip(batch, batch_result, strict=True):
+                results[i] = result
+        node_results = results[: len(node_items)]
+        edge_results = results[len(node_items) :]
 
         node_descriptions = [
             {
@@ -103,18 +150,6 @@ async def summarize_descriptions(
             for result in node_results
         ]
 
-        edge_futures = [
-            do_summarize_descriptions(
-                (str(row[1]["source"]), str(row[1]["target"])),
-                sorted(set(row[1]["description"])),
-                ticker,
-                semaphore,
-            )
-            for row in edges.iterrows()
-        ]
-
-        edge_results = await asyncio.gather(*edge_futures)
-
         edge_descriptions = [
             {
                 "source": result.id[0],
@@ -129,19 +164,26 @@ async def summarize_descriptions(
         return entity_descriptions, relationship_descriptions
 
     async def do_summarize_descriptions(
-        id: str | tuple[str, str],
-        descriptions: list[str],
+        items: list[tuple[str | tuple[str, str], list[str]]],
         ticker: ProgressTicker,
-        semaphore: asyncio.Semaphore,
+        semaphore: ConcurrencyLimiter,
     ):
         async with semaphore:
-            results = await strategy_exec(
-                id, descriptions, callbacks, cache, strategy_config
-            )
-            ticker(1)
+            if len(items) == 1:
+                id, descriptions = items[0]
+                results = [
+                    await strategy_exec(
+                        id, descriptions, callbacks, cache, strategy_config
+                    )
+                ]
+            else:
+                results = await batch_strategy_exec(  # type: ignore
+                    items, callbacks, cache, strategy_config
+                )
+            ticker(len(items))
         return results
 
-    semaphore = asyncio.Semaphore(num_threads)
+    semaphore = create_concurrency_limiter(async_mode, num_threads)
 
     return await get_summarized(entities_df, relationships_df, semaphore)
 
@@ -158,3 +200,47 @@ def load_strategy(strategy_type: SummarizeStrategyType) -> SummarizationStrategy
         case _:
             msg = f"Unknown strategy: {strategy_type}"
             raise ValueError(msg)
+
+
+def load_batch_strategy(
+    strategy_type: SummarizeStrategyType,
+) -> BatchSummarizationStrategy:
+    """Load the batch variant of a strategy."""
+    match strategy_type:
+        case SummarizeStrategyType.graph_intelligence:
+            from graphrag.index.operations.summarize_descriptions.graph_intelligence_strategy import (
+                run_graph_intelligence_batch,
+            )
+
+            return run_graph_intelligence_batch
+        case _:
+            msg = f"Unknown strategy: {strategy_type}"
+            raise ValueError(msg)
+
+
+def _batch_items(
+    items: list[tuple[str | tuple[str, str], list[str]]],
+    max_batch_tokens: int,
+    max_item_tokens: int,
+) -> list[list[int]]:
+    """Group the indices of the items to summarize together.
+
+    Lists of several descriptions that fit in `max_item_tokens` are batched up to
+    `max_batch_tokens`; every other item is summarized on its own.
+    """
+    batches: list[list[int]] = []
+    batch: list[int] = []
+    batch_tokens = 0
+    for i, (_, descriptions) in enumerate(items):
+        num_tokens = sum(num_tokens_from_string(d) for d in descriptions)
+        if len(descriptions) < 2 or num_tokens > max_item_tokens:
+            batches.append([i])
+            continue
+        if batch and batch_tokens + num_tokens > max_batch_tokens:
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(i)
+        batch_tokens += num_tokens
+    if batch:
+        batches.append(batch)
+    return batches
@@ -33,6 +33,16 @@ SummarizationStrategy = Callable[
     Awaitable[SummarizedDescriptionResult],
 ]
 
+BatchSummarizationStrategy = Callable[
+    [
+        list[tuple[str | tuple[str, str], list[str]]],
+        WorkflowCallbacks,
+        PipelineCache,
+        StrategyConfig,
+    ],
+    Awaitable[list[SummarizedDescriptionResult]],
+]
+
 
 class DescriptionSummarizeRow(NamedTuple):
     """DescriptionSummarizeRow class definition."""
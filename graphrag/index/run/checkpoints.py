@@ -0,0 +1,166 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Workflow fingerprints used to resume interrupted pipeline runs."""
+
+import json
+import logging
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.typing import WorkflowTables
+from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.storage import storage_has_table
+
+log = logging.getLogger(__name__)
+
+CHECKPOINTS_FILENAME = "checkpoints.json"
+
+# Language model settings that change what a model returns. Credentials, endpoints,
+# rate limits and concurrency settings are left out so tuning them does not force a re-run.
+_MODEL_OUTPUT_FIELDS = [
+    "type",
+    "model",
+    "deployment_name",
+    "encoding_model",
+    "max_tokens",
+    "temperature",
+    "top_p",
+    "n",
+    "frequency_penalty",
+    "presence_penalty",
+    "model_supports_json",
+    "responses",
+]
+
+
+async def load_checkpoints(storage: PipelineStorage) -> dict[str, str]:
+    """Load the fingerprints of the workflows completed by a previous run."""
+    if not await storage.has(CHECKPOINTS_FILENAME):
+        return {}
+    return json.loads(await storage.get(CHECKPOINTS_FILENAME))
+
+
+async def write_checkpoints(
+    checkpoints: dict[str, str], storage: PipelineStorage
+) -> None:
+    """Write the fingerprints of the completed workflows."""
+    await storage.set(
+        CHECKPOINTS_FILENAME, json.dumps(checkpoints, indent=4, ensure_ascii=False)
+    )
+
+
+async def fingerprint_workflows(
+    names: list[str],
+    tables: dict[str, WorkflowTables],
+    config: GraphRagConfig,
+    storage: PipelineStorage,
+    table_hashes: dict[str, str] | None = None,
+) -> list[str | None]:
+    """Fingerprint each workflow from its config and the fingerprints of its inputs.
+
+    Tables written by an earlier workflow are identified by that workflow's
+    fingerprint, so the chain stays valid even though some tables (documents,
+    text_units) are overwritten in place. Tables no workflow in the pipeline writes
+    are taken from `table_hashes`, or hashed from storage. Workflows without declared
+    tables get no fingerprint, and neither does anything that runs after them.
+    """
+    fingerprints: list[str | None] = []
+    writers: dict[str, str] = {}
+    table_hashes = table_hashes or {}
+
+    for name in names:
+        declared = tables.get(name)
+        if declared is None or None in fingerprints:
+            fingerprints.append(None)
+            continue
+
+        inputs = {}
+        for table in declared.inputs:
+            if table in writers:
+                inputs[table] = writers[table]
+            elif table in table_hashes:
+                inputs[table] = table_hashes[table]
+            else:
+                inputs[table] = await _hash_stored_table(table, storage)
+
+        fingerprint = _hash({
+            "workflow": name,
+            "config": {
+                section: _resolve_config_section(config, section)
+                for section in declared.config_sections
+            },
+            "inputs": inputs,
+        })
+        fingerprints.append(fingerprint)
+        for table in declared.outputs:
+            writers[table] = fingerprint
+
+    return fingerprints
+
+
+def hash_table(table: pd.DataFrame) -> str:
+    """Hash the content of a table."""
+    return sha256(table.to_parquet()).hexdigest()
+
+
+async def count_resumable_workflows(
+    names: list[str],
+    tables: dict[str, WorkflowTables],
+    fingerprints: list[str | None],
+    checkpoints: dict[str, str],
+    storage: PipelineStorage,
+) -> int:
+    """Count the leading workflows whose outputs are already up to date.
+
+    Only a prefix of the pipeline can be skipped: once one workflow has to run, the
+    tables that later workflows overwrite in place are no longer guaranteed to hold
+    what the workflows after it expect.
+    """
+    for index, (name, fingerprint) in enumerate(zip(names, fingerprints, strict=True)):
+        if fingerprint is None or checkpoints.get(name) != fingerprint:
+            log.info("workflow %s is out of date, resuming from it", name)
+            return index
+        for table in tables[name].outputs:
+            if not await storage_has_table(table, storage):
+                log.info(
+                    "workflow %s is missing table %s, resuming from it", name, table
+                )
+                return index
+    return len(names)
+
+
+async def _hash_stored_table(name: str, storage: PipelineStorage) -> str:
+    if not await storage_has_table(name, storage):
+        return "missing"
+    return sha256(await storage.get(f"{name}.parquet", as_bytes=True)).hexdigest()
+
+
+def _resolve_config_section(config: GraphRagConfig, section: str) -> Any:
+    """Dump a config section, inlining the model and prompt files it references."""
+    value = config.model_dump(mode="json", include={section})[section]
+    if not isinstance(value, dict):
+        return value
+    resolved = {}
+    for key, item in value.items():
+        if key == "model_id" and item in config.models:
+            model = config.models[item].model_dump(mode="json")
+            resolved[key] = {field: model[field] for field in _MODEL_OUTPUT_FIELDS}
+        elif isinstance(item, str) and key.endswith("prompt"):
+            prompt = Path(config.root_dir) / item
+            resolved[key] = (
+                prompt.read_text(encoding="utf-8") if prompt.is_file() else item
+            )
+        else:
+            resolved[key] = item
+    return resolved
+
+
+def _hash(value: Any) -> str:
+    return sha256(
+        json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
@@ -6,19 +6,42 @@
 import asyncio
 import inspect
 import logging
+import os
+import time
 import traceback
-from collections.abc import Awaitable, Callable, Coroutine, Hashable
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
 from typing import Any, TypeVar, cast
 
+import numpy as np
 import pandas as pd
 
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
+from graphrag.index.run.failed_rows import (
+    RowFailurePolicy,
+    current_row_failure_policy,
+    record_failed_row,
+)
+from graphrag.index.utils.adaptive_limiter import AdaptiveConcurrencyLimiter
+from graphrag.index.utils.process_pool import (
+    create_process_pool,
+    is_picklable,
+    worker_fn,
+)
 from graphrag.logger.progress import progress_ticker
 
 logger = logging.getLogger(__name__)
 ItemType = TypeVar("ItemType")
 
+ExecuteFn = Callable[[tuple[Hashable, pd.Series]], Awaitable[ItemType | None]]
+ExecuteRowFn = Callable[
+    [ExecuteFn[ItemType], tuple[Hashable, pd.Series]], Awaitable[ItemType | None]
+]
+ResultSinkFn = Callable[[int, ItemType | None], Awaitable[None] | None]
+# a failed row, with the error and stack of its last attempt
+_RowError = tuple[tuple[Hashable, pd.Series], BaseException, str]
+
 
 class ParallelizationError(ValueError):
     """Exception for invalid parallel processing."""
@@ -36,16 +59,70 @@ async def derive_from_rows(
     callbacks: WorkflowCallbacks,
     num_threads: int = 4,
     async_type: AsyncType = AsyncType.AsyncIO,
+    sink: ResultSinkFn[ItemType] | None = None,
+    cost_column: str | None = None,
+) -> list[ItemType | None]:
+    """Apply a generic transform function to each row. Any errors will be reported and thrown.
+
+    Failed rows are retried, and a small fraction of them may be tolerated, as set by
+    the row failure policy of the running workflow (see `collect_failed_rows`).
+    Tolerated failures return None and are recorded in the workflow's dead-letter rows.
+
+    Rows are pulled lazily by a pool of `num_threads` workers, so only the rows in
+    flight are materialized. When a `sink` is given, each result is handed to it with
+    the row's position as soon as it completes instead of being collected, and an
+    empty list is returned.
+
+    With a `cost_column`, rows are started in descending order of their estimated cost
+    (longest processing time first), so the most expensive rows do not end up running
+    alone at the end of the stage. Results keep the input order either way.
+    """
+    if cost_column is None:
+        return await _derive_from_rows_by_type(
+            input, transform, callbacks, num_threads, async_type, sink
+        )
+
+    order = np.argsort(-input[cost_column].fillna(0).to_numpy(), kind="stable")
+    ordered_sink = (
+        None
+        if sink is None
+        else lambda position, result: sink(int(order[position]), result)
+    )
+    ordered_results = await _derive_from_rows_by_type(
+        input.iloc[order], transform, callbacks, num_threads, async_type, ordered_sink
+    )
+    if sink is not None:
+        return []
+    results: list[ItemType | None] = [None] * len(input)
+    for position, result in zip(order, ordered_results, strict=True):
+        results[position] = result
+    return results
+
+
+async def _derive_from_rows_by_type(
+    input: pd.DataFrame,
+    transform: Callable[[pd.Series], Awaitable[ItemType]],
+    callbacks: WorkflowCallbacks,
+    num_threads: int,
+    async_type: AsyncType,
+    sink: ResultSinkFn[ItemType] | None,
 ) -> list[ItemType | None]:
-    """Apply a generic transform function to each row. Any errors will be reported and thrown."""
     match async_type:
         case AsyncType.AsyncIO:
             return await derive_from_rows_asyncio(
-                input, transform, callbacks, num_threads
+                input, transform, callbacks, num_threads, sink=sink
             )
         case AsyncType.Threaded:
             return await derive_from_rows_asyncio_threads(
-                input, transform, callbacks, num_threads
+                input, transform, callbacks, num_threads, sink=sink
+            )
+        case AsyncType.Adaptive:
+            return await derive_from_rows_asyncio(
+                input, transform, callbacks, num_threads, adaptive=True, sink=sink
+            )
+        case AsyncType.Process:
+            return await derive_from_rows_process(
+                input, transform, callbacks, num_threads, sink=sink
             )
         case _:
             msg = f"Unsupported scheduling type {async_type}"
@@ -60,26 +137,24 @@ async def derive_from_rows_asyncio_threads(
     transform: Callable[[pd.Series], Awaitable[ItemType]],
     callbacks: WorkflowCallbacks,
     num_threads: int | None = 4,
+    sink: ResultSinkFn[ItemType] | None = None,
 ) -> list[ItemType | None]:
     """
     Derive from rows asynchronously.
 
     This is useful for IO bound operations.
     """
-    semaphore = asyncio.Semaphore(num_threads or 4)
-
-    async def gather(execute: ExecuteFn[ItemType]) -> list[ItemType | None]:
-        tasks = [asyncio.to_thread(execute, row) for row in input.iterrows()]
 
-        async def execute_task(task: Coroutine) -> ItemType | None:
-            async with semaphore:
-                # fire off the thread
-                thread = await task
-                return await thread
+    async def execute_row(
+        execute: ExecuteFn[ItemType], row: tuple[Hashable, pd.Series]
+    ) -> ItemType | None:
+        # fire off the thread
+        thread = await asyncio.to_thread(execute, row)
+        return await thread
 
-        return await asyncio.gather(*[execute_task(task) for task in tasks])
-
-    return await _derive_from_rows_base(input, transform, callbacks, gather)
+    return await _derive_from_rows_base(
+        input, transform, callbacks, num_threads or 4, execute_row, sink
+    )
 
 
 """A module containing the derive_from_rows_async method."""
@@ -90,70 +165,212 @@ async def derive_from_rows_asyncio(
     transform: Callable[[pd.Series], Awaitable[ItemType]],
     callbacks: WorkflowCallbacks,
     num_threads: int = 4,
+    adaptive: bool = False,
+    sink: ResultSinkFn[ItemType] | None = None,
 ) -> list[ItemType | None]:
     """
     Derive from rows asynchronously.
 
-    This is useful for IO bound operations.
+    This is useful for IO bound operations. With `adaptive`, `num_threads` caps a
+    concurrency limit that is tuned from the latency and throttling of each call.
     """
-    semaphore = asyncio.Semaphore(num_threads or 4)
+    limiter = AdaptiveConcurrencyLimiter(num_threads or 4) if adaptive else None
 
-    async def gather(execute: ExecuteFn[ItemType]) -> list[ItemType | None]:
-        async def execute_row_protected(
-            row: tuple[Hashable, pd.Series],
-        ) -> ItemType | None:
-            async with semaphore:
-                return await execute(row)
+    async def execute_row(
+        execute: ExecuteFn[ItemType], row: tuple[Hashable, pd.Series]
+    ) -> ItemType | None:
+        if limiter is None:
+            return await execute(row)
+        async with limiter:
+            return await execute(row)
 
-        tasks = [
-            asyncio.create_task(execute_row_protected(row)) for row in input.iterrows()
-        ]
-        return await asyncio.gather(*tasks)
+    return await _derive_from_rows_base(
+        input, transform, callbacks, num_threads or 4, execute_row, sink
+    )
 
-    return await _derive_from_rows_base(input, transform, callbacks, gather)
 
+"""A module containing the derive_from_rows_process method."""
 
-ItemType = TypeVar("ItemType")
 
-ExecuteFn = Callable[[tuple[Hashable, pd.Series]], Awaitable[ItemType | None]]
-GatherFn = Callable[[ExecuteFn], Awaitable[list[ItemType | None]]]
+async def derive_from_rows_process(
+    input: pd.DataFrame,
+    transform: Callable[[pd.Series], Awaitable[ItemType] | ItemType],
+    callbacks: WorkflowCallbacks,
+    num_threads: int = 4,
+    batch_size: int = 16,
+    sink: ResultSinkFn[ItemType] | None = None,
+) -> list[ItemType | None]:
+    """
+    Derive from rows in a pool of up to `num_threads` worker processes.
+
+    This is useful for CPU bound operations, so the pool is no larger than the
+    number of CPUs, whatever the (I/O sized) `num_threads`. The transform is sent to each worker
+    once and must be picklable (a module-level function or a picklable callable
+    object); otherwise the rows are transformed with asyncio instead. Rows are sent
+    in batches of `batch_size`, with at most two batches per worker in flight.
+    """
+    if not is_picklable(transform):
+        logger.warning(
+            "transform %s cannot be sent to worker processes, using asyncio instead",
+            transform,
+        )
+        return await derive_from_rows_asyncio(
+            input, transform, callbacks, num_threads, sink=sink
+        )
+
+    num_workers = max(1, min(num_threads or 4, os.cpu_count() or 1, len(input)))
+    policy = current_row_failure_policy()
+    tick = progress_ticker(callbacks.progress, num_total=len(input))
+    errors: list[_RowError] = []
+    results: list[ItemType | None] = [] if sink else [None] * len(input)
+    loop = asyncio.get_running_loop()
+
+    async def collect(start: int, future: Awaitable[list]) -> None:
+        for offset, (result, error) in enumerate(await future):
+            if error is not None:
+                row = input.iloc[start + offset]
+                errors.append(((row.name, row), *error))
+            if sink is None:
+                results[start + offset] = result
+            else:
+                written = sink(start + offset, result)
+                if inspect.isawaitable(written):
+                    await written
+            tick(1)
+
+    with create_process_pool(transform, num_workers) as pool:
+        pending: deque[tuple[int, Awaitable[list]]] = deque()
+        for start in range(0, len(input), batch_size):
+            batch = input.iloc[start : start + batch_size]
+            pending.append((
+                start,
+                loop.run_in_executor(
+                    pool,
+                    _transform_batch,
+                    batch,
+                    policy.max_retries,
+                    policy.retry_backoff,
+                ),
+            ))
+            if len(pending) >= 2 * num_workers:
+                await collect(*pending.popleft())
+        while pending:
+            await collect(*pending.popleft())
+
+    tick.done()
+    _handle_errors(errors, len(input), policy, callbacks)
+    return results
+
+
+def _transform_batch(
+    batch: pd.DataFrame, max_retries: int, retry_backoff: float
+) -> list[tuple[Any, tuple[BaseException, str] | None]]:
+    """Transform a batch of rows in a worker process, capturing each row's error."""
+    transform = worker_fn()
+    outputs = []
+    for _, row in batch.iterrows():
+        attempt = 0
+        while True:
+            try:
+                result = transform(row)
+                if inspect.iscoroutine(result):
+                    result = asyncio.run(result)
+                outputs.append((result, None))
+                break
+            except Exception as e:  # noqa: BLE001
+                if attempt >= max_retries:
+                    # the error is sent back to the parent, so it has to survive pickling
+                    error = e if is_picklable(e) else RuntimeError(repr(e))
+                    outputs.append((None, (error, traceback.format_exc())))
+                    break
+            time.sleep(retry_backoff * 2**attempt)
+            attempt += 1
+    return outputs
+
+
+ItemType = TypeVar("ItemType")
 
 
 async def _derive_from_rows_base(
     input: pd.DataFrame,
     transform: Callable[[pd.Series], Awaitable[ItemType]],
     callbacks: WorkflowCallbacks,
-    gather: GatherFn[ItemType],
+    num_workers: int,
+    execute_row: ExecuteRowFn[ItemType],
+    sink: ResultSinkFn[ItemType] | None = None,
 ) -> list[ItemType | None]:
     """
     Derive from rows asynchronously.
 
     This is useful for IO bound operations.
     """
+    policy = current_row_failure_policy()
     tick = progress_ticker(callbacks.progress, num_total=len(input))
-    errors: list[tuple[BaseException, str]] = []
+    errors: list[_RowError] = []
+    results: list[ItemType | None] = [] if sink else [None] * len(input)
 
     async def execute(row: tuple[Any, pd.Series]) -> ItemType | None:
+        attempt = 0
         try:
-            result = transform(row[1])
-            if inspect.iscoroutine(result):
-                result = await result
-        except Exception as e:  # noqa: BLE001
-            errors.append((e, traceback.format_exc()))
-            return None
-        else:
-            return cast("ItemType", result)
+            while True:
+                try:
+                    result = transform(row[1])
+                    if inspect.iscoroutine(result):
+                        result = await result
+                    return cast("ItemType", result)
+                except Exception as e:  # noqa: BLE001
+                    if attempt >= policy.max_retries:
+                        errors.append((row, e, traceback.format_exc()))
+                        return None
+                await asyncio.sleep(policy.retry_backoff * 2**attempt)
+                attempt += 1
         finally:
             tick(1)
 
-    result = await gather(execute)
+    # the workers share one lazy iterator, so rows are only built as they are picked up
+    rows = enumerate(input.iterrows())
+
+    async def worker() -> None:
+        for position, row in rows:
+            result = await execute_row(execute, row)
+            if sink is None:
+                results[position] = result
+            else:
+                written = sink(position, result)
+                if inspect.isawaitable(written):
+                    await written
+
+    workers = [
+        asyncio.create_task(worker()) for _ in range(min(num_workers, len(input)))
+    ]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
 
     tick.done()
+    _handle_errors(errors, len(input), policy, callbacks)
+    return results
 
-    for error, stack in errors:
+
+def _handle_errors(
+    errors: list[_RowError],
+    num_rows: int,
+    policy: RowFailurePolicy,
+    callbacks: WorkflowCallbacks,
+) -> None:
+    """Report the failed rows, then raise unless the policy tolerates that many."""
+    for _, error, stack in errors:
         callbacks.error("parallel transformation error", error, stack)
 
-    if len(errors) > 0:
-        raise ParallelizationError(len(errors), errors[0][1])
+    if len(errors) > policy.max_failure_rate * num_rows:
+        raise ParallelizationError(len(errors), errors[0][2])
 
-    return result
+    for (index, row), error, stack in errors:
+        record_failed_row(index, row, error, stack)
+    if errors:
+        callbacks.warning(
+            f"{len(errors)} of {num_rows} rows failed and were skipped, "
+            "run again with --retry-failed to reprocess them"
+        )
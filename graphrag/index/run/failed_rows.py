@@ -0,0 +1,120 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Failure handling for row transforms: retries, a failure tolerance, and a dead-letter table."""
+
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+
+import pandas as pd
+
+from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.storage import (
+    delete_table_from_storage,
+    load_table_from_storage,
+    storage_has_table,
+    write_table_to_storage,
+)
+
+FAILED_ROWS_TABLE = "failed_rows"
+
+
+@dataclass
+class RowFailurePolicy:
+    """How row transforms handle rows that fail."""
+
+    max_retries: int = 0
+    """The number of times a failed row is retried."""
+
+    retry_backoff: float = 1.0
+    """The delay before the first retry, in seconds. It doubles with each retry."""
+
+    max_failure_rate: float = 0.0
+    """The fraction of rows allowed to fail (after retries) without failing the run."""
+
+
+@dataclass
+class FailedRow:
+    """A row that failed every attempt."""
+
+    row_index: str
+    row: str
+    error: str
+    stack: str
+
+
+@dataclass
+class FailedRows:
+    """The policy and the failed rows of the workflow running in the current context."""
+
+    policy: RowFailurePolicy
+    rows: list[FailedRow] = field(default_factory=list)
+
+
+_current_failed_rows: ContextVar[FailedRows | None] = ContextVar(
+    "current_failed_rows", default=None
+)
+
+
+def current_row_failure_policy() -> RowFailurePolicy:
+    """Get the row failure policy of the current context, or the default (no retries, no failures tolerated)."""
+    failed_rows = _current_failed_rows.get()
+    return failed_rows.policy if failed_rows else RowFailurePolicy()
+
+
+def record_failed_row(
+    row_index: object, row: pd.Series, error: BaseException, stack: str
+) -> None:
+    """Record a tolerated row failure in the current context."""
+    failed_rows = _current_failed_rows.get()
+    if failed_rows is None:
+        return
+    failed_rows.rows.append(
+        FailedRow(
+            row_index=str(row_index),
+            row=json.dumps(row.to_dict(), default=str, ensure_ascii=False),
+            error=repr(error),
+            stack=stack,
+        )
+    )
+
+
+@contextmanager
+def collect_failed_rows(policy: RowFailurePolicy) -> Iterator[list[FailedRow]]:
+    """Apply `policy` to the row transforms that run in the current context, collecting the rows that fail."""
+    failed_rows = FailedRows(policy)
+    token = _current_failed_rows.set(failed_rows)
+    try:
+        yield failed_rows.rows
+    finally:
+        _current_failed_rows.reset(token)
+
+
+async def load_failed_rows(storage: PipelineStorage) -> dict[str, list[FailedRow]]:
+    """Load the dead-letter table, grouped by workflow."""
+    if not await storage_has_table(FAILED_ROWS_TABLE, storage):
+        return {}
+    table = await load_table_from_storage(FAILED_ROWS_TABLE, storage)
+    failed: dict[str, list[FailedRow]] = {}
+    for record in table.to_dict("records"):
+        workflow = record.pop("workflow")
+        failed.setdefault(workflow, []).append(FailedRow(**record))
+    return failed
+
+
+async def write_failed_rows(
+    failed: dict[str, list[FailedRow]], storage: PipelineStorage
+) -> None:
+    """Write the dead-letter table, or remove it once no rows are left failing."""
+    records = [
+        {"workflow": workflow, **asdict(row)}
+        for workflow, rows in failed.items()
+        for row in rows
+    ]
+    if records:
+        await write_table_to_storage(pd.DataFrame(records), FAILED_ROWS_TABLE, storage)
+    elif await storage_has_table(FAILED_ROWS_TABLE, storage):
+        await delete_table_from_storage(FAILED_ROWS_TABLE, storage)
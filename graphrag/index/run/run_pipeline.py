@@ -3,6 +3,7 @@
 
 """Different methods to run the pipeline."""
 
+import asyncio
 import json
 import logging
 import time
@@ -14,24 +15,47 @@ import pandas as pd
 
 from graphrag.cache.factory import CacheFactory
 from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.cache.tiered_pipeline_cache import TieredPipelineCache
+from graphrag.cache.usage import CacheUsageRecorder, write_cache_usage
 from graphrag.callbacks.console_workflow_callbacks import ConsoleWorkflowCallbacks
 from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.context import PipelineRunStats
-from graphrag.index.input.factory import create_input
+from graphrag.index.input.factory import create_input, fingerprint_input
+from graphrag.index.run.checkpoints import (
+    count_resumable_workflows,
+    fingerprint_workflows,
+    hash_table,
+    load_checkpoints,
+    write_checkpoints,
+)
+from graphrag.index.run.failed_rows import (
+    FailedRow,
+    RowFailurePolicy,
+    collect_failed_rows,
+    load_failed_rows,
+    write_failed_rows,
+)
+from graphrag.index.run.scheduler import run_workflows_concurrently
 from graphrag.index.run.utils import create_callback_chain, create_run_context
-from graphrag.index.typing import Pipeline, PipelineRunResult
+from graphrag.index.typing import Pipeline, PipelineRunResult, WorkflowFunction
 from graphrag.index.update.incremental_index import (
+    RECLUSTERED_WORKFLOWS,
     get_delta_docs,
     update_dataframe_outputs,
 )
+from graphrag.index.workflow_stats import collect_workflow_stats
+from graphrag.index.workflows import (
+    all_workflow_tables,
+    create_community_reports_text,
+    extract_graph_streaming,
+)
 from graphrag.logger.base import ProgressLogger
 from graphrag.logger.null_progress import NullProgressLogger
 from graphrag.logger.progress import Progress
 from graphrag.storage.factory import StorageFactory
 from graphrag.storage.pipeline_storage import PipelineStorage
-from graphrag.utils.storage import write_table_to_storage
 
 log = logging.getLogger(__name__)
 
@@ -43,8 +67,15 @@ async def run_pipeline(
     callbacks: list[WorkflowCallbacks] | None = None,
     logger: ProgressLogger | None = None,
     is_update_run: bool = False,
+    resume: bool = False,
+    retry_failed: bool = False,
 ) -> AsyncIterable[PipelineRunResult]:
-    """Run all workflows using a simplified pipeline."""
+    """Run all workflows using a simplified pipeline.
+
+    When `resume` is set, leading workflows whose outputs were produced by a previous
+    run with the same inputs and config are skipped. `retry_failed` resumes as well,
+    but re-runs the workflows that left rows in the dead-letter table.
+    """
     root_dir = config.root_dir
     progress_logger = logger or NullProgressLogger()
     callbacks = callbacks or [ConsoleWorkflowCallbacks()]
@@ -60,12 +91,14 @@ async def run_pipeline(
         root_dir=root_dir,
         kwargs=cache_config,
     )
-
-    dataset = await create_input(config.input, logger, root_dir)
+    # record the entries this run reads and writes, for `graphrag cache`
+    cache = CacheUsageRecorder(cache)
 
     if is_update_run:
         progress_logger.info("Running incremental indexing.")
 
+        dataset = await create_input(config.input, logger, root_dir)
+
         update_storage_config = config.update_index_output.model_dump()  # type: ignore
         update_index_storage = StorageFactory().create_storage(
             storage_type=update_storage_config["type"],  # type: ignore
@@ -81,16 +114,30 @@ async def run_pipeline(
 
         delta_storage = update_index_storage.child("delta")
 
+        workflows = list(pipeline)
+        text_reports = any(
+            name == create_community_reports_text for name, _ in workflows
+        )
+        if config.cluster_graph.incremental:
+            # communities and their reports are rebuilt on the merged graph below
+            workflows = [
+                (name, fn)
+                for name, fn in workflows
+                if name not in RECLUSTERED_WORKFLOWS
+            ]
+
         # Run the pipeline on the new documents
         tables_dict = {}
         async for table in _run_pipeline(
-            pipeline=pipeline,
+            pipeline=iter(workflows),
             config=config,
             dataset=delta_dataset.new_inputs,
             cache=cache,
             storage=delta_storage,
             callbacks=callback_chain,
             logger=progress_logger,
+            resume=resume,
+            retry_failed=retry_failed,
         ):
             tables_dict[table.workflow] = table.result
 
@@ -104,64 +151,193 @@ async def run_pipeline(
             cache=cache,
             callbacks=NoopWorkflowCallbacks(),
             progress_logger=progress_logger,
+            text_reports=text_reports,
         )
 
     else:
         progress_logger.info("Running standard indexing.")
 
+        workflows = list(pipeline)
+        # the streaming workflow reads the input documents itself, in micro-batches
+        dataset = (
+            None
+            if any(name == extract_graph_streaming for name, _ in workflows)
+            else await create_input(config.input, logger, root_dir)
+        )
+
         async for table in _run_pipeline(
-            pipeline=pipeline,
+            pipeline=iter(workflows),
             config=config,
             dataset=dataset,
             cache=cache,
             storage=storage,
             callbacks=callback_chain,
             logger=progress_logger,
+            resume=resume,
+            retry_failed=retry_failed,
         ):
             yield table
 
+    await write_cache_usage(cache)
+
 
 async def _run_pipeline(
     pipeline: Pipeline,
     config: GraphRagConfig,
-    dataset: pd.DataFrame,
+    dataset: pd.DataFrame | None,
     cache: PipelineCache,
     storage: PipelineStorage,
     callbacks: WorkflowCallbacks,
     logger: ProgressLogger,
+    resume: bool = False,
+    retry_failed: bool = False,
 ) -> AsyncIterable[PipelineRunResult]:
     start_time = time.time()
 
-    context = create_run_context(storage=storage, cache=cache, stats=None)
+    context = create_run_context(
+        storage=storage,
+        cache=cache,
+        stats=None,
+        write_behind=True,
+        persist_graphs=config.snapshots.graph,
+    )
 
-    log.info("Final # of rows loaded: %s", len(dataset))
-    context.stats.num_documents = len(dataset)
+    if dataset is not None:
+        log.info("Final # of rows loaded: %s", len(dataset))
+        context.stats.num_documents = len(dataset)
     last_workflow = "starting documents"
 
+    workflows = list(pipeline)
+    names = [name for name, _ in workflows]
+    fingerprints: dict[str, str | None] = {}
+    checkpoints: dict[str, str] = {}
+    checkpoint_writes: list[asyncio.Task] = []
+    checkpoint_lock = asyncio.Lock()
+    failure_policy = RowFailurePolicy(**config.fault_tolerance.model_dump())
+    failed_rows: dict[str, list[FailedRow]] = {}
+
+    async def run_workflow(name: str, fn: WorkflowFunction) -> pd.DataFrame | None:
+        nonlocal last_workflow
+        last_workflow = name
+        if name not in all_workflow_tables:
+            # custom workflows may read tables straight from storage
+            await context.tables.flush()
+        progress = logger.child(name, transient=False)
+        callbacks.workflow_start(name, None)
+        try:
+            with (
+                collect_workflow_stats() as stats,
+                collect_failed_rows(failure_policy) as failures,
+            ):
+                result = await fn(
+                    config,
+                    context,
+                    callbacks,
+                )
+        except Exception:
+            # with concurrent workflows, make sure the failing one gets reported
+            last_workflow = name
+            raise
+        progress(Progress(percent=1))
+        callbacks.workflow_end(name, result)
+        failed_rows[name] = failures
+        stats.failed_rows = len(failures)
+        context.stats.workflows[name] = asdict(stats)
+        callbacks.workflow_stats(name, context.stats.workflows[name])
+        fingerprint = fingerprints[name]
+        if fingerprint is not None:
+            checkpoint_writes.append(
+                asyncio.create_task(_checkpoint(name, fingerprint))
+            )
+        return result
+
+    async def _checkpoint(name: str, fingerprint: str) -> None:
+        # only record the workflow once its tables have reached storage
+        await context.tables.flush(all_workflow_tables[name].outputs)
+        async with checkpoint_lock:
+            checkpoints[name] = fingerprint
+            await write_checkpoints(checkpoints, context.storage)
+
     try:
         await _dump_stats(context.stats, context.storage)
-        await write_table_to_storage(dataset, "documents", context.storage)
 
-        for name, fn in pipeline:
-            last_workflow = name
-            progress = logger.child(name, transient=False)
-            callbacks.workflow_start(name, None)
-            work_time = time.time()
-            result = await fn(
-                config,
-                context,
-                callbacks,
+        fingerprints.update(
+            zip(
+                names,
+                await fingerprint_workflows(
+                    names,
+                    all_workflow_tables,
+                    config,
+                    context.storage,
+                    table_hashes={
+                        "documents": hash_table(dataset)
+                        if dataset is not None
+                        else await fingerprint_input(config.input, config.root_dir)
+                    },
+                ),
+                strict=True,
+            )
+        )
+        failed_rows.update(await load_failed_rows(context.storage))
+        num_skipped = 0
+        if resume or retry_failed:
+            checkpoints.update(await load_checkpoints(context.storage))
+            if retry_failed:
+                # forget the workflows that skipped rows, so they run again
+                for name in failed_rows:
+                    checkpoints.pop(name, None)
+            num_skipped = await count_resumable_workflows(
+                names,
+                all_workflow_tables,
+                list(fingerprints.values()),
+                checkpoints,
+                context.storage,
             )
-            progress(Progress(percent=1))
-            callbacks.workflow_end(name, result)
-            yield PipelineRunResult(name, result, None)
+        await write_checkpoints(checkpoints, context.storage)
+
+        # a skipped workflow may already have replaced the input documents
+        if dataset is not None and not any(
+            "documents" in all_workflow_tables[name].outputs
+            for name in names[:num_skipped]
+        ):
+            await context.tables.set("documents", dataset)
 
-            context.stats.workflows[name] = {"overall": time.time() - work_time}
+        if num_skipped and isinstance(cache, CacheUsageRecorder):
+            # the skipped workflows' entries are still in use
+            cache.carry_forward = True
+        for name in names[:num_skipped]:
+            log.info("skipping workflow %s, its outputs are up to date", name)
+            yield PipelineRunResult(name, None, None)
+        workflows = workflows[num_skipped:]
+
+        if config.concurrent_workflows:
+            async for name, result in run_workflows_concurrently(
+                workflows, all_workflow_tables, run_workflow
+            ):
+                yield PipelineRunResult(name, result, None)
+        else:
+            for name, fn in workflows:
+                result = await run_workflow(name, fn)
+                yield PipelineRunResult(name, result, None)
+
+        await context.tables.flush()
+        await asyncio.gather(*checkpoint_writes)
+        await write_failed_rows(failed_rows, context.storage)
 
         context.stats.total_runtime = time.time() - start_time
+        memory_tier = cache.cache if isinstance(cache, CacheUsageRecorder) else cache
+        if isinstance(memory_tier, TieredPipelineCache):
+            context.stats.memory_cache = asdict(memory_tier.stats)
         await _dump_stats(context.stats, context.storage)
 
     except Exception as e:
+        # keep whatever completed so a resumed run can pick up from there
+        await asyncio.gather(
+            context.tables.flush(),
+            *checkpoint_writes,
+            write_failed_rows(failed_rows, context.storage),
+            return_exceptions=True,
+        )
         log.exception("error running workflow %s", last_workflow)
         callbacks.error("Error running pipeline!", e, traceback.format_exc())
         yield PipelineRunResult(last_workflow, None, [e])
@@ -0,0 +1,99 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Dependency-aware scheduling of pipeline workflows."""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterable, Awaitable, Callable
+
+import pandas as pd
+
+from graphrag.index.typing import Workflow, WorkflowFunction, WorkflowTables
+
+log = logging.getLogger(__name__)
+
+RunWorkflowFn = Callable[[str, WorkflowFunction], Awaitable[pd.DataFrame | None]]
+
+
+def resolve_workflow_dependencies(
+    names: list[str], tables: dict[str, WorkflowTables]
+) -> list[set[int]]:
+    """Resolve, for each workflow position, the positions of the workflows it must wait for.
+
+    A workflow waits for the last writer of every table it reads or writes, and for
+    every reader of a table it overwrites, so a concurrent run produces the same
+    tables as running the list in order. Side effects are ordered like written
+    tables, so two workflows never write the same vector store at once. Workflows without declared tables act as a
+    barrier: they wait for everything before them and everything after waits for them.
+    """
+    dependencies: list[set[int]] = []
+    last_writer: dict[str, int] = {}
+    readers: dict[str, list[int]] = {}
+    barrier: int | None = None
+
+    for index, name in enumerate(names):
+        declared = tables.get(name)
+        if declared is None:
+            dependencies.append(set(range(index)))
+            barrier = index
+            last_writer.clear()
+            readers.clear()
+            continue
+
+        waits_for = set() if barrier is None else {barrier}
+        for table in declared.inputs:
+            if table in last_writer:
+                waits_for.add(last_writer[table])
+        written = [*declared.outputs, *declared.side_effects]
+        for table in written:
+            if table in last_writer:
+                waits_for.add(last_writer[table])
+            waits_for.update(readers.get(table, []))
+
+        for table in declared.inputs:
+            readers.setdefault(table, []).append(index)
+        for table in written:
+            last_writer[table] = index
+            readers[table] = []
+
+        dependencies.append(waits_for)
+
+    return dependencies
+
+
+async def run_workflows_concurrently(
+    workflows: list[Workflow],
+    tables: dict[str, WorkflowTables],
+    run: RunWorkflowFn,
+) -> AsyncIterable[tuple[str, pd.DataFrame | None]]:
+    """Run workflows as soon as their dependencies complete, yielding results in completion order.
+
+    If a workflow fails, the workflows still running are cancelled and the error is raised.
+    """
+    dependencies = resolve_workflow_dependencies(
+        [name for name, _ in workflows], tables
+    )
+    pending = list(range(len(workflows)))
+    completed: set[int] = set()
+    running: dict[asyncio.Task, int] = {}
+
+    try:
+        while pending or running:
+            for index in [i for i in pending if dependencies[i] <= completed]:
+                pending.remove(index)
+                name, fn = workflows[index]
+                log.info("scheduling workflow %s", name)
+                running[asyncio.create_task(run(name, fn))] = index
+
+            finished, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in sorted(finished, key=lambda t: running[t]):
+                index = running.pop(task)
+                yield workflows[index][0], task.result()
+                completed.add(index)
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
@@ -9,6 +9,8 @@ from graphrag.callbacks.progress_workflow_callbacks import ProgressWorkflowCallb
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks_manager import WorkflowCallbacksManager
 from graphrag.index.context import PipelineRunContext, PipelineRunStats
+from graphrag.index.graph_registry import GraphRegistry
+from graphrag.index.table_registry import TableRegistry
 from graphrag.logger.base import ProgressLogger
 from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
 from graphrag.storage.pipeline_storage import PipelineStorage
@@ -18,12 +20,17 @@ def create_run_context(
     storage: PipelineStorage | None,
     cache: PipelineCache | None,
     stats: PipelineRunStats | None,
+    write_behind: bool = False,
+    persist_graphs: bool = False,
 ) -> PipelineRunContext:
     """Create the run context for the pipeline."""
+    storage = storage or MemoryPipelineStorage()
     return PipelineRunContext(
         stats=stats or PipelineRunStats(),
         cache=cache or InMemoryCache(),
-        storage=storage or MemoryPipelineStorage(),
+        storage=storage,
+        tables=TableRegistry(storage, write_behind=write_behind),
+        graphs=GraphRegistry(storage if persist_graphs else None),
     )
 
 
@@ -0,0 +1,98 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'TableRegistry' model."""
+
+import asyncio
+import logging
+from io import BytesIO
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from graphrag.index.table_spill import TableSpill
+from graphrag.index.workflow_stats import current_workflow_stats
+from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.storage import load_table_from_storage, storage_has_table
+
+log = logging.getLogger(__name__)
+
+
+class TableRegistry:
+    """In-memory registry of the tables written during a pipeline run.
+
+    Tables are kept as immutable Arrow tables, so each `get` returns a fresh
+    DataFrame with the same column types a parquet round-trip would produce,
+    without encoding, compressing and parsing the parquet file in between
+    workflows. Tables are also written to storage as parquet, in the background
+    when `write_behind` is set; call `flush` to wait for those writes.
+    """
+
+    def __init__(self, storage: PipelineStorage, write_behind: bool = False):
+        self._storage = storage
+        self._write_behind = write_behind
+        self._tables: dict[str, pa.Table] = {}
+        self._writes: dict[str, asyncio.Task] = {}
+
+    async def get(self, name: str) -> pd.DataFrame:
+        """Get a table, falling back to storage if it was not written during this run."""
+        table = self._tables.get(name)
+        if table is None:
+            result = await load_table_from_storage(name, self._storage)
+        else:
+            result = table.to_pandas()
+        if stats := current_workflow_stats():
+            stats.rows_in += len(result)
+        return result
+
+    async def has(self, name: str) -> bool:
+        """Check if a table was written during this run or exists in storage."""
+        return name in self._tables or await storage_has_table(name, self._storage)
+
+    async def set(self, name: str, table: pd.DataFrame) -> None:
+        """Register a table and write it to storage."""
+        # numeric columns are converted zero-copy, so copy first to keep later
+        # in-place edits of the DataFrame from leaking into the registered table
+        arrow_table = pa.Table.from_pandas(table.copy())
+        self._tables[name] = arrow_table
+        if stats := current_workflow_stats():
+            stats.rows_out += arrow_table.num_rows
+        write = self._write(name, arrow_table, self._writes.get(name))
+        if self._write_behind:
+            self._writes[name] = asyncio.create_task(write)
+        else:
+            await write
+
+    async def set_spill(self, name: str, spill: TableSpill) -> None:
+        """Write a table spilled to storage in parts, without keeping it in memory.
+
+        Later `get` calls read the table back from storage.
+        """
+        self._tables.pop(name, None)
+        await self.flush([name])
+        log.info("writing table to storage: %s.parquet", name)
+        await spill.combine(self._storage, f"{name}.parquet")
+
+    async def flush(self, names: list[str] | None = None) -> None:
+        """Wait for the background writes of the given tables, or of all tables."""
+        names = list(self._writes) if names is None else names
+        await asyncio.gather(*[
+            self._writes[name] for name in names if name in self._writes
+        ])
+
+    async def _write(
+        self, name: str, table: pa.Table, previous: asyncio.Task | None
+    ) -> None:
+        if previous is not None:
+            # keep successive versions of the same table landing in order
+            await previous
+        log.info("writing table to storage: %s.parquet", name)
+        data = await asyncio.to_thread(_to_parquet, table)
+        await self._storage.set(f"{name}.parquet", data)
+
+
+def _to_parquet(table: pa.Table) -> bytes:
+    buffer = BytesIO()
+    pq.write_table(table, buffer)
+    return buffer.getvalue()
@@ -0,0 +1,101 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'TableSpill' model."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from io import BytesIO
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.storage.pipeline_storage import PipelineStorage
+
+
+class TableSpill:
+    """A table written to storage in parts, so it is never held in memory whole."""
+
+    def __init__(self, storage: PipelineStorage, name: str):
+        self._storage = storage
+        self._name = name
+        self._parts: list[str] = []
+        self._schemas: list[pa.Schema] = []
+        self._num_rows = 0
+
+    @property
+    def num_parts(self) -> int:
+        """The number of parts written so far."""
+        return len(self._parts)
+
+    @property
+    def num_rows(self) -> int:
+        """The number of rows written so far."""
+        return self._num_rows
+
+    async def append(self, table: pd.DataFrame) -> None:
+        """Write the next part of the table."""
+        arrow_table = pa.Table.from_pandas(table, preserve_index=False)
+        key = f"{self._name}_{len(self._parts):05d}.parquet"
+        await self._storage.set(key, await asyncio.to_thread(_to_parquet, arrow_table))
+        self._parts.append(key)
+        self._schemas.append(arrow_table.schema)
+        self._num_rows += arrow_table.num_rows
+
+    async def parts(self) -> AsyncIterator[pd.DataFrame]:
+        """Read the parts back, one at a time."""
+        for key in self._parts:
+            yield pd.read_parquet(BytesIO(await self._storage.get(key, as_bytes=True)))
+
+    async def combine(self, storage: PipelineStorage, key: str) -> None:
+        """Combine the parts into a single parquet file under `key` in `storage`, one part at a time.
+
+        Parts may disagree on columns that were empty in some batches, so each part
+        is cast to the unified schema, with missing columns filled with nulls. File
+        storage is written to directly; other storage only accepts whole values, so
+        the combined file is assembled in memory before it is written.
+        """
+        schema = pa.unify_schemas(self._schemas, promote_options="default")
+        path = storage.path(key) if isinstance(storage, FilePipelineStorage) else None
+        if path is not None:
+            await self._write(path, schema)
+        else:
+            buffer = BytesIO()
+            await self._write(buffer, schema)
+            await storage.set(key, buffer.getvalue())
+
+    async def _write(self, sink: Path | BytesIO, schema: pa.Schema) -> None:
+        with pq.ParquetWriter(sink, schema) as writer:
+            for key in self._parts:
+                part = pq.read_table(
+                    BytesIO(await self._storage.get(key, as_bytes=True))
+                )
+                await asyncio.to_thread(
+                    writer.write_table,
+                    pa.Table.from_arrays(
+                        [
+                            part.column(field.name).cast(field.type)
+                            if field.name in part.column_names
+                            else pa.nulls(part.num_rows, field.type)
+                            for field in schema
+                        ],
+                        schema=schema,
+                    ),
+                )
+
+    async def clear(self) -> None:
+        """Delete the parts from storage."""
+        for key in self._parts:
+            await self._storage.delete(key)
+        self._parts.clear()
+        self._schemas.clear()
+        self._num_rows = 0
+
+
+def _to_parquet(table: pa.Table) -> bytes:
+    buffer = BytesIO()
+    pq.write_table(table, buffer)
+    return buffer.getvalue()
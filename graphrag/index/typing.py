@@ -4,7 +4,7 @@
 """A module containing the 'PipelineRunResult' model."""
 
 from collections.abc import Awaitable, Callable, Generator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import pandas as pd
 
@@ -23,6 +23,24 @@ Workflow = tuple[str, WorkflowFunction]
 Pipeline = Generator[Workflow]
 
 
+@dataclass
+class WorkflowTables:
+    """The tables a workflow reads from and writes to storage, and the config that shapes them."""
+
+    inputs: list[str]
+    """Names of the tables the workflow reads."""
+    outputs: list[str]
+    """Names of the tables the workflow writes."""
+    config_sections: list[str] = field(default_factory=list)
+    """Names of the GraphRagConfig sections that shape the workflow outputs."""
+    side_effects: list[str] = field(default_factory=list)
+    """Names of resources outside the table storage that the workflow writes, such as the vector store.
+
+    The scheduler orders their writers like the writers of a table, but they are not
+    checkpointed, so a skipped workflow does not rewrite them.
+    """
+
+
 @dataclass
 class PipelineRunResult:
     """Pipeline run result class definition."""
@@ -5,6 +5,24 @@
 
 import pandas as pd
 
+from graphrag.index.flows.create_communities import create_communities_from_clusters
+from graphrag.index.operations.cluster_graph import Communities, recluster_graph
+from graphrag.index.utils.csr_graph import CSRGraph
+
+_COMMUNITY_COLUMNS = [
+    "id",
+    "human_readable_id",
+    "community",
+    "parent",
+    "level",
+    "title",
+    "entity_ids",
+    "relationship_ids",
+    "text_unit_ids",
+    "period",
+    "size",
+]
+
 
 def _update_and_merge_communities(
     old_communities: pd.DataFrame,
@@ -74,25 +92,89 @@ def _update_and_merge_communities(
     # Re-assign the human_readable_id
     merged_communities["human_readable_id"] = merged_communities["community"]
 
-    merged_communities = merged_communities.loc[
-        :,
-        [
-            "id",
-            "human_readable_id",
-            "community",
-            "parent",
-            "level",
-            "title",
-            "entity_ids",
-            "relationship_ids",
-            "text_unit_ids",
-            "period",
-            "size",
-        ],
-    ]
+    merged_communities = merged_communities.loc[:, _COMMUNITY_COLUMNS]
     return merged_communities, community_id_mapping
 
 
+def _recluster_and_merge_communities(
+    old_communities: pd.DataFrame,
+    merged_entities: pd.DataFrame,
+    merged_relationships: pd.DataFrame,
+    delta_entities: pd.DataFrame,
+    delta_relationships: pd.DataFrame,
+    max_cluster_size: int,
+    use_lcc: bool,
+    seed: int | None = None,
+) -> tuple[pd.DataFrame, set[int]]:
+    """Recluster the communities touched by the delta entities and relationships.
+
+    Parameters
+    ----------
+    old_communities : pd.DataFrame
+        The old communities.
+    merged_entities : pd.DataFrame
+        The merged entities, keeping the ids of the old entities.
+    merged_relationships : pd.DataFrame
+        The merged relationships.
+    delta_entities : pd.DataFrame
+        The delta entities.
+    delta_relationships : pd.DataFrame
+        The delta relationships.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, set[int]]
+        The updated communities, and the ids of the communities whose reports need
+        to be generated again.
+    """
+    titles = merged_entities.set_index("id")["title"]
+    previous: Communities = [
+        (
+            int(row.level),
+            int(row.community),
+            int(row.parent),
+            titles.reindex(list(row.entity_ids)).dropna().tolist(),
+        )
+        for row in old_communities.itertuples()
+    ]
+    touched = {
+        *delta_entities["title"],
+        *delta_relationships["source"],
+        *delta_relationships["target"],
+    }
+    clusters, changed = recluster_graph(
+        CSRGraph.from_edges(merged_relationships),
+        previous,
+        touched,
+        max_cluster_size,
+        use_lcc,
+        seed=seed,
+    )
+
+    # unchanged communities keep their rows, but may have a new parent
+    parents = {community: parent for _, community, parent, _ in clusters}
+    kept = old_communities.loc[
+        old_communities["community"].astype(int).isin(parents.keys() - changed)
+    ].copy()
+    kept["parent"] = kept["community"].astype(int).map(parents)
+    reclustered = create_communities_from_clusters(
+        [cluster for cluster in clusters if cluster[1] in changed],
+        merged_entities,
+        merged_relationships,
+    )
+    merged_communities = pd.concat([kept, reclustered], ignore_index=True, copy=False)
+    merged_communities["community"] = merged_communities["community"].astype(int)
+    merged_communities["parent"] = merged_communities["parent"].astype(int)
+    merged_communities = merged_communities.sort_values(
+        ["level", "community"], ignore_index=True
+    )
+    merged_communities["title"] = "Community " + merged_communities["community"].astype(
+        str
+    )
+    merged_communities["human_readable_id"] = merged_communities["community"]
+    return merged_communities.loc[:, _COMMUNITY_COLUMNS], changed
+
+
 def _update_and_merge_community_reports(
     old_community_reports: pd.DataFrame,
     delta_community_reports: pd.DataFrame,
@@ -174,3 +256,74 @@ def _update_and_merge_community_reports(
             "size",
         ],
     ]
+
+
+def _merge_regenerated_community_reports(
+    old_community_reports: pd.DataFrame,
+    regenerated_community_reports: pd.DataFrame,
+    communities: pd.DataFrame,
+) -> pd.DataFrame:
+    """Replace the reports of reclustered communities.
+
+    Parameters
+    ----------
+    old_community_reports : pd.DataFrame
+        The old community reports.
+    regenerated_community_reports : pd.DataFrame
+        The reports of the new and changed communities.
+    communities : pd.DataFrame
+        The reclustered communities.
+
+    Returns
+    -------
+    pd.DataFrame
+        The updated community reports.
+    """
+    if "size" not in old_community_reports.columns:
+        old_community_reports["size"] = None
+    if "period" not in old_community_reports.columns:
+        old_community_reports["period"] = None
+
+    # keep the reports of communities that still exist and were not regenerated
+    parents = communities.set_index("community")["parent"]
+    old_community_reports["community"] = old_community_reports["community"].astype(int)
+    kept = old_community_reports.loc[
+        old_community_reports["community"].isin(parents.index)
+        & ~old_community_reports["community"].isin(
+            regenerated_community_reports["community"]
+        )
+    ].copy()
+    kept["parent"] = kept["community"].map(parents).astype(int)
+
+    merged_community_reports = pd.concat(
+        [kept, regenerated_community_reports], ignore_index=True, copy=False
+    )
+    merged_community_reports["community"] = merged_community_reports[
+        "community"
+    ].astype(int)
+    merged_community_reports = merged_community_reports.sort_values(
+        ["level", "community"], ignore_index=True
+    )
+    merged_community_reports["human_readable_id"] = merged_community_reports[
+        "community"
+    ]
+
+    return merged_community_reports.loc[
+        :,
+        [
+            "id",
+            "human_readable_id",
+            "community",
+            "parent",
+            "level",
+            "title",
+            "summary",
+            "full_content",
+            "rank",
+            "rank_explanation",
+            "findings",
+            "full_content_json",
+            "period",
+            "size",
+        ],
+    ]
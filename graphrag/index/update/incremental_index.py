@@ -12,8 +12,14 @@ from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.embeddings import get_embedded_fields, get_embedding_settings
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.flows.create_community_reports import create_community_reports
+from graphrag.index.flows.create_community_reports_text import (
+    create_community_reports_text,
+)
 from graphrag.index.flows.generate_text_embeddings import generate_text_embeddings
 from graphrag.index.update.communities import (
+    _merge_regenerated_community_reports,
+    _recluster_and_merge_communities,
     _update_and_merge_communities,
     _update_and_merge_community_reports,
 )
@@ -30,6 +36,17 @@ from graphrag.utils.storage import (
     write_table_to_storage,
 )
 
+RECLUSTERED_WORKFLOWS = {
+    "create_communities",
+    "create_community_reports",
+    "create_community_reports_text",
+    "generate_text_embeddings",
+}
+"""Workflows left out of the delta pipeline when `cluster_graph.incremental` is set.
+
+Their outputs are built on the merged tables by `update_dataframe_outputs` instead.
+"""
+
 
 @dataclass
 class InputDelta:
@@ -87,6 +104,7 @@ async def update_dataframe_outputs(
     cache: PipelineCache,
     callbacks: WorkflowCallbacks,
     progress_logger: ProgressLogger,
+    text_reports: bool = False,
 ) -> None:
     """Update the mergeable outputs.
 
@@ -96,6 +114,9 @@ async def update_dataframe_outputs(
         The dictionary of dataframes.
     storage : PipelineStorage
         The storage used to store the dataframes.
+    text_reports : bool
+        Whether community reports are generated from text units, as the fast
+        indexing method does, when they are regenerated.
     """
     progress_logger.info("Updating Documents")
     final_documents_df = await _concat_dataframes(
@@ -121,24 +142,55 @@ async def update_dataframe_outputs(
     )
 
     # Merge final covariates
+    merged_covariates = None
     if (
         await storage_has_table("covariates", storage)
         and "covariates" in dataframe_dict
     ):
         progress_logger.info("Updating Covariates")
-        await _update_covariates(dataframe_dict, storage, update_storage)
+        merged_covariates = await _update_covariates(
+            dataframe_dict, storage, update_storage
+        )
 
-    # Merge final communities
-    progress_logger.info("Updating Communities")
-    community_id_mapping = await _update_communities(
-        dataframe_dict, storage, update_storage
-    )
+    if config.cluster_graph.incremental:
+        # Recluster the touched communities and regenerate their reports
+        progress_logger.info("Reclustering Communities")
+        merged_communities, changed_communities = await _recluster_communities(
+            dataframe_dict,
+            storage,
+            update_storage,
+            config,
+            merged_entities_df,
+            merged_relationships_df,
+        )
 
-    # Merge community reports
-    progress_logger.info("Updating Community Reports")
-    merged_community_reports = await _update_community_reports(
-        dataframe_dict, storage, update_storage, community_id_mapping
-    )
+        progress_logger.info("Regenerating Community Reports")
+        merged_community_reports = await _regenerate_community_reports(
+            storage,
+            update_storage,
+            config,
+            cache,
+            callbacks,
+            merged_entities_df,
+            merged_relationships_df,
+            merged_text_units,
+            merged_communities,
+            changed_communities,
+            merged_covariates,
+            text_reports,
+        )
+    else:
+        # Merge final communities
+        progress_logger.info("Updating Communities")
+        community_id_mapping = await _update_communities(
+            dataframe_dict, storage, update_storage
+        )
+
+        # Merge community reports
+        progress_logger.info("Updating Community Reports")
+        merged_community_reports = await _update_community_reports(
+            dataframe_dict, storage, update_storage, community_id_mapping
+        )
 
     # Generate text embeddings
     progress_logger.info("Updating Text Embeddings")
@@ -177,6 +229,100 @@ async def _update_community_reports(
     return merged_community_reports
 
 
+async def _regenerate_community_reports(
+    storage,
+    update_storage,
+    config,
+    cache,
+    callbacks,
+    merged_entities,
+    merged_relationships,
+    merged_text_units,
+    merged_communities,
+    changed_communities,
+    merged_covariates,
+    text_reports,
+):
+    """Generate the reports of the changed communities and merge them with the old ones."""
+    old_community_reports = await load_table_from_storage("community_reports", storage)
+    regenerated_community_reports = old_community_reports.iloc[:0]
+    if changed_communities:
+        community_reports_llm_settings = config.get_language_model_config(
+            config.community_reports.model_id
+        )
+        changed = merged_communities.loc[
+            merged_communities["community"].isin(changed_communities)
+        ]
+        summarization_strategy = config.community_reports.resolved_strategy(
+            config.root_dir, community_reports_llm_settings
+        )
+        async_mode = community_reports_llm_settings.async_mode
+        num_threads = community_reports_llm_settings.num_threads()
+        if text_reports:
+            regenerated_community_reports = await create_community_reports_text(
+                merged_entities,
+                changed,
+                merged_text_units,
+                callbacks,
+                cache,
+                summarization_strategy,
+                async_mode=async_mode,
+                num_threads=num_threads,
+                longest_first=config.longest_first,
+            )
+        else:
+            regenerated_community_reports = await create_community_reports(
+                edges_input=merged_relationships,
+                entities=merged_entities,
+                communities=changed,
+                claims_input=merged_covariates
+                if config.extract_claims.enabled
+                else None,
+                callbacks=callbacks,
+                cache=cache,
+                summarization_strategy=summarization_strategy,
+                async_mode=async_mode,
+                num_threads=num_threads,
+                longest_first=config.longest_first,
+            )
+
+    merged_community_reports = _merge_regenerated_community_reports(
+        old_community_reports, regenerated_community_reports, merged_communities
+    )
+
+    await write_table_to_storage(
+        merged_community_reports, "community_reports", update_storage
+    )
+
+    return merged_community_reports
+
+
+async def _recluster_communities(
+    dataframe_dict,
+    storage,
+    update_storage,
+    config,
+    merged_entities,
+    merged_relationships,
+):
+    """Recluster the communities touched by the update."""
+    old_communities = await load_table_from_storage("communities", storage)
+    merged_communities, changed_communities = _recluster_and_merge_communities(
+        old_communities,
+        merged_entities,
+        merged_relationships,
+        dataframe_dict["entities"],
+        dataframe_dict["relationships"],
+        max_cluster_size=config.cluster_graph.max_cluster_size,
+        use_lcc=config.cluster_graph.use_lcc,
+        seed=config.cluster_graph.seed,
+    )
+
+    await write_table_to_storage(merged_communities, "communities", update_storage)
+
+    return merged_communities, changed_communities
+
+
 async def _update_communities(dataframe_dict, storage, update_storage):
     """Update the communities output."""
     old_communities = await load_table_from_storage("communities", storage)
@@ -199,6 +345,8 @@ async def _update_covariates(dataframe_dict, storage, update_storage):
 
     await write_table_to_storage(merged_covariates, "covariates", update_storage)
 
+    return merged_covariates
+
 
 async def _update_text_units(
     dataframe_dict, storage, update_storage, entity_id_mapping
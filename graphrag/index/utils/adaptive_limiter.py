@@ -0,0 +1,138 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Adaptive concurrency limiter utility."""
+
+import asyncio
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from types import TracebackType
+
+from graphrag.config.enums import AsyncType
+
+_BACKOFF_FACTOR = 0.5
+_LATENCY_TOLERANCE = 2.0
+_LATENCY_SMOOTHING = 0.1
+
+
+@dataclass
+class _Call:
+    limiter: "AdaptiveConcurrencyLimiter"
+    start: float
+    parent: "_Call | None"
+    token: Token | None = None
+    throttled: bool = False
+
+
+_current_call: ContextVar[_Call | None] = ContextVar(
+    "current_limited_call", default=None
+)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    A drop-in replacement for `asyncio.Semaphore` that tunes its own limit (AIMD).
+
+    The limit starts low and doubles while calls succeed (slow start), then grows by
+    about one per round of calls once the first throttling signal is seen. Calls that
+    are rate limited or time out cut the limit in half, at most once per round, and
+    calls much slower than the recent average stop it from growing.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: int = 4,
+    ):
+        self.max_limit = max(max_limit, min_limit)
+        self.min_limit = min_limit
+        self._limit = float(min(max(initial_limit, min_limit), self.max_limit))
+        self._slow_start = True
+        self._in_flight = 0
+        self._latency: float | None = None
+        self._last_decrease = 0.0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """The current number of calls allowed to run at once."""
+        return int(self._limit)
+
+    async def __aenter__(self) -> None:
+        """Wait for a free slot, then track the call in the current context."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        call = _Call(self, time.monotonic(), _current_call.get())
+        call.token = _current_call.set(call)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Release the slot and adjust the limit from the outcome of the call."""
+        call = _current_call.get()
+        if call is not None and call.limiter is self:
+            if call.token is not None:
+                _current_call.reset(call.token)
+            throttled = call.throttled or (exc is not None and is_throttling_error(exc))
+            if throttled:
+                self._decrease(call.start)
+            elif exc is None:
+                self._increase(time.monotonic() - call.start)
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def _increase(self, latency: float) -> None:
+        healthy = self._latency is None or latency <= self._latency * _LATENCY_TOLERANCE
+        self._latency = (
+            latency
+            if self._latency is None
+            else self._latency + (latency - self._latency) * _LATENCY_SMOOTHING
+        )
+        # only grow when the current limit is actually in use
+        if healthy and self._in_flight >= self.limit:
+            step = 1 if self._slow_start else 1 / self._limit
+            self._limit = min(self._limit + step, self.max_limit)
+
+    def _decrease(self, start: float) -> None:
+        # calls started before the last decrease saw the old limit, skip them
+        if start < self._last_decrease:
+            return
+        self._slow_start = False
+        self._limit = max(self._limit * _BACKOFF_FACTOR, self.min_limit)
+        self._last_decrease = time.monotonic()
+
+
+ConcurrencyLimiter = asyncio.Semaphore | AdaptiveConcurrencyLimiter
+
+
+def create_concurrency_limiter(
+    async_type: AsyncType, num_threads: int
+) -> ConcurrencyLimiter:
+    """Create an adaptive limiter capped at `num_threads` for `AsyncType.Adaptive`, otherwise a fixed semaphore."""
+    if async_type == AsyncType.Adaptive:
+        return AdaptiveConcurrencyLimiter(max_limit=num_threads)
+    return asyncio.Semaphore(num_threads)
+
+
+def report_throttled() -> None:
+    """Report that the limited calls running in the current context were throttled."""
+    call = _current_call.get()
+    while call is not None:
+        call.throttled = True
+        call = call.parent
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Check if an error means the service is overloaded: a rate limit (HTTP 429) or a timeout."""
+    return (
+        isinstance(error, TimeoutError)
+        or getattr(error, "status_code", None) == 429
+        or type(error).__name__ in ("RateLimitError", "APITimeoutError")
+    )
@@ -0,0 +1,176 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'CSRGraph' model."""
+
+import weakref
+from collections.abc import Sequence
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+from graphrag.index.utils.stable_lcc import (
+    stable_largest_connected_component,
+    stable_largest_connected_component_from_edges,
+)
+
+
+class CSRGraph:
+    """An undirected graph held in arrays, with integer node ids and a compressed sparse row adjacency.
+
+    Nodes keep the order in which they first appear in the edge list, and duplicate
+    edges keep the position of their first row and the weight of their last one, so
+    `to_networkx` gives the same graph as `nx.from_pandas_edgelist`.
+
+    The largest connected component is computed once and shared by later calls. The
+    stable networkx LCC is only shared while a caller still holds it, so that a
+    long-lived graph does not keep a networkx copy alive; treat it as read-only.
+    """
+
+    def __init__(
+        self,
+        nodes: pd.Index,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        weights: np.ndarray | None = None,
+    ):
+        self.nodes = nodes
+        """The name of each node, indexed by node id."""
+        self.sources = sources
+        """The source node id of each edge."""
+        self.targets = targets
+        """The target node id of each edge."""
+        self.weights = weights
+        """The weight of each edge, if the graph is weighted."""
+        num_nodes = len(nodes)
+        loops = sources == targets
+        self.adjacency = sparse.csr_array(
+            (
+                np.ones(2 * len(sources) - loops.sum(), dtype=np.int8),
+                (
+                    np.concatenate([sources, targets[~loops]]),
+                    np.concatenate([targets, sources[~loops]]),
+                ),
+            ),
+            shape=(num_nodes, num_nodes),
+        )
+        """The symmetric adjacency matrix of the graph."""
+        self._lcc: CSRGraph | None = None
+        self._stable_lcc: weakref.ref[nx.Graph] | None = None
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: pd.DataFrame,
+        source: str = "source",
+        target: str = "target",
+        weight: str | None = None,
+    ) -> "CSRGraph":
+        """Create a graph from the source and target names of an edge list."""
+        codes, nodes = pd.factorize(
+            np.column_stack([edges[source], edges[target]]).ravel(),
+            use_na_sentinel=False,
+        )
+        sources, targets = codes[0::2], codes[1::2]
+        low, high = np.minimum(sources, targets), np.maximum(sources, targets)
+        keys = low.astype(np.int64) * max(len(nodes), 1) + high
+        _, first = np.unique(keys, return_index=True)
+        _, last = np.unique(keys[::-1], return_index=True)
+        order = np.argsort(first)
+        first, last = first[order], len(keys) - 1 - last[order]
+        return cls(
+            pd.Index(nodes),
+            sources[first],
+            targets[first],
+            edges[weight].to_numpy()[last] if weight is not None else None,
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        """The number of nodes."""
+        return len(self.nodes)
+
+    @property
+    def num_edges(self) -> int:
+        """The number of edges."""
+        return len(self.sources)
+
+    def node_ids(self, names: Sequence[str] | pd.Series | np.ndarray) -> np.ndarray:
+        """Get the id of each node name, or -1 for names not in the graph."""
+        return self.nodes.get_indexer(names)
+
+    def degree(self) -> np.ndarray:
+        """Get the degree of each node, counting self-loops twice as networkx does."""
+        return np.bincount(self.sources, minlength=self.num_nodes) + np.bincount(
+            self.targets, minlength=self.num_nodes
+        )
+
+    def edge_combined_degree(
+        self,
+        sources: Sequence[str] | pd.Series | np.ndarray,
+        targets: Sequence[str] | pd.Series | np.ndarray,
+    ) -> np.ndarray:
+        """Get the sum of the degrees of the ends of each edge, counting names not in the graph as degree 0."""
+        degree = np.append(self.degree(), 0)
+        # -1, a name not in the graph, indexes the trailing 0
+        return degree[self.node_ids(sources)] + degree[self.node_ids(targets)]
+
+    def largest_connected_component(self) -> "CSRGraph":
+        """Get the largest connected component, the one with the earliest node on ties."""
+        if self._lcc is None:
+            if self.num_nodes == 0:
+                return self
+            _, labels = connected_components(self.adjacency, directed=False)
+            sizes = np.bincount(labels)
+            largest = labels[np.argmax(sizes[labels] == sizes.max())]
+            self._lcc = self.subgraph(labels == largest)
+        return self._lcc
+
+    def stable_largest_connected_component(self) -> nx.Graph:
+        """Get the largest connected component in networkx, with normalized node names and a stable order."""
+        stable = self._stable_lcc() if self._stable_lcc is not None else None
+        if stable is None:
+            edge_data = (
+                None
+                if self.weights is None
+                else [{"weight": weight} for weight in self.weights]
+            )
+            stable = stable_largest_connected_component_from_edges(
+                self.nodes, self.sources, self.targets, edge_data=edge_data
+            )
+            if stable is None:
+                # names that only differ before normalization, see `stable_lcc`
+                stable = stable_largest_connected_component(
+                    self.largest_connected_component().to_networkx()
+                )
+            self._stable_lcc = weakref.ref(stable)
+        return stable
+
+    def subgraph(self, mask: np.ndarray) -> "CSRGraph":
+        """Get the subgraph induced by the nodes where `mask` is true, keeping their order."""
+        new_ids = np.cumsum(mask) - 1
+        kept = mask[self.sources] & mask[self.targets]
+        return CSRGraph(
+            self.nodes[mask],
+            new_ids[self.sources[kept]],
+            new_ids[self.targets[kept]],
+            self.weights[kept] if self.weights is not None else None,
+        )
+
+    def to_networkx(self, with_edges: bool = True) -> nx.Graph:
+        """Convert to networkx, for the libraries that require it."""
+        graph = nx.Graph()
+        graph.add_nodes_from(self.nodes)
+        if with_edges:
+            sources = self.nodes[self.sources]
+            targets = self.nodes[self.targets]
+            if self.weights is None:
+                graph.add_edges_from(zip(sources, targets, strict=True))
+            else:
+                graph.add_weighted_edges_from(
+                    zip(sources, targets, self.weights, strict=True)
+                )
+        return graph
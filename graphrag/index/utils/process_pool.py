@@ -0,0 +1,95 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Process pool utilities for CPU bound transforms."""
+
+import logging
+import multiprocessing
+import pickle  # noqa: S403
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+# the function installed in each worker process by `create_process_pool`
+_worker_fn: Callable[..., Any] | None = None
+
+
+def create_process_pool(
+    fn: Callable[..., Any], num_workers: int | None = None
+) -> ProcessPoolExecutor:
+    """Create a pool of worker processes that each receive `fn` once, when they start.
+
+    Workers are spawned rather than forked, so they do not inherit the state (threads,
+    event loop, open clients) of the parent process. `fn` must be picklable.
+    """
+    return ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_install_worker_fn,
+        initargs=(fn,),
+    )
+
+
+def worker_fn() -> Callable[..., Any]:
+    """Get the function installed in the current worker process."""
+    if _worker_fn is None:
+        msg = "No function installed, not running in a worker process."
+        raise RuntimeError(msg)
+    return _worker_fn
+
+
+def is_picklable(value: Any) -> bool:
+    """Check if a value can be sent to a worker process."""
+    try:
+        pickle.dumps(value)
+    except Exception:  # noqa: BLE001
+        return False
+    return True
+
+
+def parallel_apply(
+    values: pd.Series,
+    fn: Callable[[Any], Any],
+    num_workers: int | None = None,
+    batch_size: int = 64,
+) -> pd.Series:
+    """Apply `fn` to each value in a pool of worker processes, like `Series.apply`.
+
+    Values are sent to the workers in batches of `batch_size`. Small inputs, or a
+    function that cannot be pickled, are applied in this process instead.
+    """
+    if len(values) <= batch_size or num_workers == 1:
+        return values.apply(fn)
+    if not is_picklable(fn):
+        log.warning(
+            "%s cannot be sent to worker processes, applying it in this process",
+            fn,
+        )
+        return values.apply(fn)
+
+    with create_process_pool(fn, num_workers) as pool:
+        results = [
+            result
+            for batch in pool.map(_apply_batch, _batches(values.tolist(), batch_size))
+            for result in batch
+        ]
+    return pd.Series(results, index=values.index, name=values.name)
+
+
+def _install_worker_fn(fn: Callable[..., Any]) -> None:
+    global _worker_fn
+    _worker_fn = fn
+
+
+def _apply_batch(values: list[Any]) -> list[Any]:
+    fn = worker_fn()
+    return [fn(value) for value in values]
+
+
+def _batches(values: list[Any], batch_size: int) -> Iterator[list[Any]]:
+    for start in range(0, len(values), batch_size):
+        yield values[start : start + batch_size]
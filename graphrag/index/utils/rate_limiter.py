@@ -4,37 +4,190 @@
 """Rate limiter utility."""
 
 import asyncio
+import sqlite3
+import threading
 import time
+from pathlib import Path
+
+_PERIOD = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limits (
+    key TEXT PRIMARY KEY,
+    requests REAL NOT NULL,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL
+)
+"""
 
 
 class RateLimiter:
     """
-    The original TpmRpmLLMLimiter strategy did not account for minute-based rate limiting when scheduled.
+    A token-bucket limiter for the requests and tokens sent to one model deployment.
+
+    Each budget refills continuously, up to one minute's worth. Requests wait until
+    both buckets hold their share, and the tokens a request turns out to use beyond
+    its estimate are taken afterwards, as debt. A budget of 0 is unlimited.
 
-    The RateLimiter was introduced to ensure that the CommunityReportsExtractor could be scheduled to adhere to rate configurations on a per-minute basis.
+    With a `state_path`, the buckets live in a SQLite file instead of memory, so that
+    every process using the file shares the same budgets.
     """
 
-    # TODO: RateLimiter scheduled: using asyncio for async_mode
-
-    def __init__(self, rate: int, per: int):
-        self.rate = rate
-        self.per = per
-        self.allowance = rate
-        self.last_check = time.monotonic()
-
-    async def acquire(self):
-        """Acquire a token from the rate limiter."""
-        current = time.monotonic()
-        elapsed = current - self.last_check
-        self.last_check = current
-        self.allowance += elapsed * (self.rate / self.per)
-
-        if self.allowance > self.rate:
-            self.allowance = self.rate
-
-        if self.allowance < 1.0:
-            sleep_time = (1.0 - self.allowance) * (self.per / self.rate)
-            await asyncio.sleep(sleep_time)
-            self.allowance = 0.0
-        else:
-            self.allowance -= 1.0
+    def __init__(
+        self,
+        key: str,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        state_path: str | Path | None = None,
+    ):
+        self.key = key
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._capacities = (float(requests_per_minute), float(tokens_per_minute))
+        self._levels = self._capacities
+        self._updated = time.time()
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        if state_path is not None:
+            Path(state_path).parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                state_path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            self._connection.execute(_SCHEMA)
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait for one request and an estimated number of tokens."""
+        # the buckets may be shared with other processes, so poll instead of waiting on an event
+        while (wait := await self._take_async(1, tokens)) > 0:  # noqa: ASYNC110
+            await asyncio.sleep(wait)
+
+    async def settle(self, tokens: int) -> None:
+        """Take tokens used beyond the estimate of a request that already ran, see `consume`."""
+        await self._take_async(0, tokens, force=True)
+
+    def try_acquire(self, tokens: int) -> float:
+        """Take one request and a number of tokens if both are available, otherwise return the seconds to wait."""
+        return self._take(1, tokens)
+
+    def consume(self, tokens: int) -> None:
+        """Take tokens used beyond the estimate of a request that already ran."""
+        self._take(0, tokens, force=True)
+
+    def _take(self, requests: int, tokens: int, force: bool = False) -> float:
+        """Take from both buckets if they hold enough (or `force`), otherwise return the seconds to wait."""
+        with self._lock:
+            if self._connection is None:
+                self._levels, self._updated, wait = self._refill_and_take(
+                    self._levels, self._updated, (requests, tokens), force
+                )
+                return wait
+            return self._take_shared(requests, tokens, force)
+
+    async def _take_async(
+        self, requests: int, tokens: int, force: bool = False
+    ) -> float:
+        """Take from both buckets without blocking the event loop on the state file's lock."""
+        if self._connection is None:
+            return self._take(requests, tokens, force)
+        return await asyncio.to_thread(self._take, requests, tokens, force)
+
+    def _take_shared(self, requests: int, tokens: int, force: bool) -> float:
+        connection = self._connection
+        assert connection is not None  # noqa: S101
+        # an immediate transaction locks the file against the other processes
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT requests, tokens, updated FROM rate_limits WHERE key = ?",
+                (self.key,),
+            ).fetchone()
+            levels, updated = (
+                ((row[0], row[1]), row[2]) if row else (self._capacities, time.time())
+            )
+            levels, updated, wait = self._refill_and_take(
+                levels, updated, (requests, tokens), force
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO rate_limits (key, requests, tokens, updated) VALUES (?, ?, ?, ?)",
+                (self.key, *levels, updated),
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return wait
+
+    def _refill_and_take(
+        self,
+        levels: tuple[float, float],
+        updated: float,
+        amounts: tuple[int, int],
+        force: bool,
+    ) -> tuple[tuple[float, float], float, float]:
+        now = time.time()
+        elapsed = max(now - updated, 0.0)
+        refilled = []
+        wait = 0.0
+        for level, capacity, amount in zip(
+            levels, self._capacities, amounts, strict=True
+        ):
+            if capacity <= 0:
+                refilled.append(level)
+                continue
+            level = min(capacity, level + elapsed * capacity / _PERIOD)
+            # a request larger than the whole budget waits for a full bucket
+            needed = min(amount, capacity)
+            if level < needed:
+                wait = max(wait, (needed - level) * _PERIOD / capacity)
+            refilled.append(level)
+        if wait > 0 and not force:
+            return (refilled[0], refilled[1]), now, wait
+        taken = [
+            level - amount if capacity > 0 else level
+            for level, capacity, amount in zip(
+                refilled, self._capacities, amounts, strict=True
+            )
+        ]
+        return (taken[0], taken[1]), now, 0.0
+
+
+_rate_limiters: dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    key: str,
+    requests_per_minute: int,
+    tokens_per_minute: int,
+    state_path: str | Path | None = None,
+) -> RateLimiter:
+    """Get the rate limiter shared by everything in this process that uses the deployment `key`.
+
+    The budgets of the first caller for a key are the ones enforced.
+    """
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(
+                key, requests_per_minute, tokens_per_minute, state_path
+            )
+            _rate_limiters[key] = limiter
+        return limiter
+
+
+_request_slots: dict[str, asyncio.Semaphore] = {}
+
+
+def get_request_slots(key: str, max_concurrency: int) -> asyncio.Semaphore:
+    """Get the open-request slots shared by everything in this process that uses the deployment `key`.
+
+    Workflows that run side by side each load their own LLM, so without a shared
+    semaphore each of them would keep `max_concurrency` requests open on its own.
+    The limit of the first caller for a key is the one enforced.
+    """
+    with _rate_limiters_lock:
+        slots = _request_slots.get(key)
+        if slots is None:
+            slots = asyncio.Semaphore(max_concurrency)
+            _request_slots[key] = slots
+        return slots
@@ -7,10 +7,29 @@ import html
 from typing import Any, cast
 
 import networkx as nx
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
 
 
 def stable_largest_connected_component(graph: nx.Graph) -> nx.Graph:
     """Return the largest connected component of the graph, with nodes and edges sorted in a stable way."""
+    if graph.number_of_nodes() > 0 and not graph.is_multigraph():
+        nodes = list(graph.nodes(data=True))
+        edges = list(graph.edges(data=True))
+        names = pd.Index([node for node, _ in nodes], dtype=object)
+        stable = stable_largest_connected_component_from_edges(
+            names,
+            names.get_indexer([source for source, _, _ in edges]),
+            names.get_indexer([target for _, target, _ in edges]),
+            directed=graph.is_directed(),
+            node_data=[data for _, data in nodes],
+            edge_data=[data for _, _, data in edges],
+        )
+        if stable is not None:
+            return stable
+
     # NOTE: The import is done here to reduce the initial import time of the module
     from graspologic.utils import largest_connected_component
 
@@ -20,6 +39,70 @@ def stable_largest_connected_component(graph: nx.Graph) -> nx.Graph:
     return _stabilize_graph(graph)
 
 
+def stable_largest_connected_component_from_edges(
+    names: pd.Index,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    directed: bool = False,
+    node_data: list[dict[str, Any]] | None = None,
+    edge_data: list[dict[str, Any]] | None = None,
+) -> nx.Graph | None:
+    """Build the stable largest connected component of a graph given as arrays of node ids.
+
+    The result is the same as `stable_largest_connected_component` of the graph,
+    with the component, normalized names and sort orders computed on arrays. Returns
+    None when that would be wrong: names that are not strings, or names that only
+    differ before normalization, which networkx would merge into one node.
+    """
+    num_nodes = len(names)
+    if num_nodes == 0 or names.inferred_type != "string":
+        return None
+
+    # networkx yields components in the order of their first node, and graspologic
+    # keeps the first of the largest
+    adjacency = sparse.csr_array(
+        (np.ones(len(sources), dtype=np.int8), (sources, targets)),
+        shape=(num_nodes, num_nodes),
+    )
+    _, labels = connected_components(adjacency, directed=False)
+    sizes = np.bincount(labels)
+    in_lcc = labels == labels[np.argmax(sizes[labels] == sizes.max())]
+
+    normalized = _normalize_names(pd.Series(names[in_lcc], dtype=object))
+    if not normalized.is_unique:
+        return None
+    node_names = np.empty(num_nodes, dtype=object)
+    node_names[in_lcc] = normalized.to_numpy()
+
+    fixed_graph = nx.DiGraph() if directed else nx.Graph()
+    node_order = np.flatnonzero(in_lcc)[np.argsort(node_names[in_lcc], kind="stable")]
+    fixed_graph.add_nodes_from(
+        (node_names[node], node_data[node] if node_data is not None else {})
+        for node in node_order
+    )
+
+    edges = np.flatnonzero(in_lcc[sources])
+    edge_sources = node_names[sources[edges]]
+    edge_targets = node_names[targets[edges]]
+    # undirected edges are written from the lesser to the greater node, see `_stabilize_graph`
+    if not directed:
+        flipped = (edge_sources > edge_targets).astype(bool)
+        edge_sources, edge_targets = (
+            np.where(flipped, edge_targets, edge_sources),
+            np.where(flipped, edge_sources, edge_targets),
+        )
+    edge_order = np.argsort(edge_sources + " -> " + edge_targets, kind="stable")
+    fixed_graph.add_edges_from(
+        (
+            edge_sources[i],
+            edge_targets[i],
+            edge_data[edges[i]] if edge_data is not None else {},
+        )
+        for i in edge_order
+    )
+    return fixed_graph
+
+
 def _stabilize_graph(graph: nx.Graph) -> nx.Graph:
     """Ensure an undirected graph with the same relationships will always be read the same way."""
     fixed_graph = nx.DiGraph() if graph.is_directed() else nx.Graph()
@@ -65,3 +148,12 @@ def normalize_node_names(graph: nx.Graph | nx.DiGraph) -> nx.Graph | nx.DiGraph:
     """Normalize node names."""
     node_mapping = {node: html.unescape(node.upper().strip()) for node in graph.nodes()}  # type: ignore
     return nx.relabel_nodes(graph, node_mapping)
+
+
+def _normalize_names(names: pd.Series) -> pd.Series:
+    """Normalize node names as `normalize_node_names` does."""
+    normalized = names.str.upper().str.strip()
+    # only names with an ampersand can hold an entity
+    escaped = normalized.str.contains("&", regex=False)
+    normalized[escaped] = normalized[escaped].map(html.unescape)
+    return normalized
@@ -0,0 +1,106 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Performance counters collected for the workflow that is currently running."""
+
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+@dataclass
+class WorkflowStats:
+    """Performance counters for a single workflow run.
+
+    CPU time and peak RSS are measured for the whole process, so they overlap
+    between workflows that run concurrently.
+    """
+
+    overall: float = 0
+    """Wall-clock time, in seconds."""
+
+    cpu_time: float = 0
+    """Process CPU time (user and system), in seconds."""
+
+    peak_rss_delta: float = 0
+    """Growth of the process peak resident set size, in bytes."""
+
+    llm_calls: int = 0
+    """Requests sent to a language model, including retries."""
+
+    prompt_tokens: int = 0
+    """Prompt tokens reported by the language model."""
+
+    completion_tokens: int = 0
+    """Completion tokens reported by the language model."""
+
+    cache_hits: int = 0
+    """Language model responses served from the cache."""
+
+    cache_misses: int = 0
+    """Language model responses missing from the cache."""
+
+    coalesced_requests: int = 0
+    """Language model requests that shared the response of an identical request already in flight."""
+
+    retries: int = 0
+    """Language model requests that failed with a retryable error."""
+
+    rate_limit_errors: int = 0
+    """Retryable errors caused by rate limiting (HTTP 429)."""
+
+    rows_in: int = 0
+    """Rows read from the pipeline tables."""
+
+    rows_out: int = 0
+    """Rows written to the pipeline tables."""
+
+    failed_rows: int = 0
+    """Rows skipped by row transforms after failing every attempt."""
+
+
+_current_stats: ContextVar[WorkflowStats | None] = ContextVar(
+    "current_workflow_stats", default=None
+)
+
+
+def current_workflow_stats() -> WorkflowStats | None:
+    """Get the stats of the workflow running in the current context, if any."""
+    return _current_stats.get()
+
+
+@contextmanager
+def collect_workflow_stats() -> Iterator[WorkflowStats]:
+    """Collect the stats of everything that runs in the current context.
+
+    Tasks created inside the block copy the context, so the LLM calls and table
+    reads and writes they make are counted as well.
+    """
+    stats = WorkflowStats()
+    token = _current_stats.set(stats)
+    start_time = time.time()
+    start_cpu = time.process_time()
+    start_rss = _peak_rss()
+    try:
+        yield stats
+    finally:
+        stats.overall = time.time() - start_time
+        stats.cpu_time = time.process_time() - start_cpu
+        stats.peak_rss_delta = _peak_rss() - start_rss
+        _current_stats.reset(token)
+
+
+def _peak_rss() -> float:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
@@ -4,7 +4,7 @@
 
 """A package containing all built-in workflow definitions."""
 
-from graphrag.index.typing import WorkflowFunction
+from graphrag.index.typing import WorkflowFunction, WorkflowTables
 
 from .create_base_text_units import (
     run_workflow as run_create_base_text_units,
@@ -12,60 +12,99 @@ from .create_base_text_units import (
 from .create_base_text_units import (
     workflow_name as create_base_text_units,
 )
+from .create_base_text_units import (
+    workflow_tables as create_base_text_units_tables,
+)
 from .create_communities import (
     run_workflow as run_create_communities,
 )
 from .create_communities import (
     workflow_name as create_communities,
 )
+from .create_communities import (
+    workflow_tables as create_communities_tables,
+)
 from .create_community_reports import (
     run_workflow as run_create_community_reports,
 )
 from .create_community_reports import (
     workflow_name as create_community_reports,
 )
+from .create_community_reports import (
+    workflow_tables as create_community_reports_tables,
+)
 from .create_community_reports_text import (
     run_workflow as run_create_community_reports_text,
 )
 from .create_community_reports_text import (
     workflow_name as create_community_reports_text,
 )
+from .create_community_reports_text import (
+    workflow_tables as create_community_reports_text_tables,
+)
 from .create_final_documents import (
     run_workflow as run_create_final_documents,
 )
 from .create_final_documents import (
     workflow_name as create_final_documents,
 )
+from .create_final_documents import (
+    workflow_tables as create_final_documents_tables,
+)
 from .create_final_text_units import (
     run_workflow as run_create_final_text_units,
 )
 from .create_final_text_units import (
     workflow_name as create_final_text_units,
 )
+from .create_final_text_units import (
+    workflow_tables as create_final_text_units_tables,
+)
 from .extract_covariates import (
     run_workflow as run_extract_covariates,
 )
 from .extract_covariates import (
     workflow_name as extract_covariates,
 )
+from .extract_covariates import (
+    workflow_tables as extract_covariates_tables,
+)
 from .extract_graph import (
     run_workflow as run_extract_graph,
 )
 from .extract_graph import (
     workflow_name as extract_graph,
 )
+from .extract_graph import (
+    workflow_tables as extract_graph_tables,
+)
 from .extract_graph_nlp import (
     run_workflow as run_extract_graph_nlp,
 )
 from .extract_graph_nlp import (
     workflow_name as extract_graph_nlp,
 )
+from .extract_graph_nlp import (
+    workflow_tables as extract_graph_nlp_tables,
+)
+from .extract_graph_streaming import (
+    run_workflow as run_extract_graph_streaming,
+)
+from .extract_graph_streaming import (
+    workflow_name as extract_graph_streaming,
+)
+from .extract_graph_streaming import (
+    workflow_tables as extract_graph_streaming_tables,
+)
 from .generate_text_embeddings import (
     run_workflow as run_generate_text_embeddings,
 )
 from .generate_text_embeddings import (
     workflow_name as generate_text_embeddings,
 )
+from .generate_text_embeddings import (
+    workflow_tables as generate_text_embeddings_tables,
+)
 
 all_workflows: dict[
     str,
@@ -80,6 +119,22 @@ all_workflows: dict[
     create_final_text_units: run_create_final_text_units,
     extract_graph_nlp: run_extract_graph_nlp,
     extract_graph: run_extract_graph,
+    extract_graph_streaming: run_extract_graph_streaming,
     generate_text_embeddings: run_generate_text_embeddings,
 }
 """This is a dictionary of all build-in workflows. To be replace with an injectable provider!"""
+
+all_workflow_tables: dict[str, WorkflowTables] = {
+    create_base_text_units: create_base_text_units_tables,
+    create_communities: create_communities_tables,
+    create_community_reports_text: create_community_reports_text_tables,
+    create_community_reports: create_community_reports_tables,
+    extract_covariates: extract_covariates_tables,
+    create_final_documents: create_final_documents_tables,
+    create_final_text_units: create_final_text_units_tables,
+    extract_graph_nlp: extract_graph_nlp_tables,
+    extract_graph: extract_graph_tables,
+    extract_graph_streaming: extract_graph_streaming_tables,
+    generate_text_embeddings: generate_text_embeddings_tables,
+}
+"""The tables read and written by each built-in workflow, used to run independent workflows concurrently."""
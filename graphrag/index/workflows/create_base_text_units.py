@@ -11,9 +11,14 @@ from graphrag.index.context import PipelineRunContext
 from graphrag.index.flows.create_base_text_units import (
     create_base_text_units,
 )
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.typing import WorkflowTables
 
 workflow_name = "create_base_text_units"
+workflow_tables = WorkflowTables(
+    inputs=["documents"],
+    outputs=["text_units"],
+    config_sections=["chunks"],
+)
 
 
 async def run_workflow(
@@ -22,7 +27,7 @@ async def run_workflow(
     callbacks: WorkflowCallbacks,
 ) -> pd.DataFrame | None:
     """All the steps to transform base text_units."""
-    documents = await load_table_from_storage("documents", context.storage)
+    documents = await context.tables.get("documents")
 
     chunks = config.chunks
 
@@ -36,6 +41,6 @@ async def run_workflow(
         strategy=chunks.strategy,
     )
 
-    await write_table_to_storage(output, "text_units", context.storage)
+    await context.tables.set("text_units", output)
 
     return output
@@ -11,9 +11,14 @@ from graphrag.index.context import PipelineRunContext
 from graphrag.index.flows.create_communities import (
     create_communities,
 )
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.typing import WorkflowTables
 
 workflow_name = "create_communities"
+workflow_tables = WorkflowTables(
+    inputs=["entities", "relationships"],
+    outputs=["communities"],
+    config_sections=["cluster_graph"],
+)
 
 
 async def run_workflow(
@@ -22,8 +27,8 @@ async def run_workflow(
     _callbacks: WorkflowCallbacks,
 ) -> pd.DataFrame | None:
     """All the steps to transform final communities."""
-    entities = await load_table_from_storage("entities", context.storage)
-    relationships = await load_table_from_storage("relationships", context.storage)
+    entities = await context.tables.get("entities")
+    relationships = await context.tables.get("relationships")
 
     max_cluster_size = config.cluster_graph.max_cluster_size
     use_lcc = config.cluster_graph.use_lcc
@@ -35,8 +40,13 @@ async def run_workflow(
         max_cluster_size=max_cluster_size,
         use_lcc=use_lcc,
         seed=seed,
+        graph=await context.graphs.load(relationships),
+        per_component=config.cluster_graph.per_component,
+        num_processes=config.cluster_graph.num_processes,
     )
+    # the last of the built-in workflows to use the graph
+    context.graphs.release(relationships)
 
-    await write_table_to_storage(output, "communities", context.storage)
+    await context.tables.set("communities", output)
 
     return output
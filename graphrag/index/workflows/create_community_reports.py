@@ -11,13 +11,14 @@ from graphrag.index.context import PipelineRunContext
 from graphrag.index.flows.create_community_reports import (
     create_community_reports,
 )
-from graphrag.utils.storage import (
-    load_table_from_storage,
-    storage_has_table,
-    write_table_to_storage,
-)
+from graphrag.index.typing import WorkflowTables
 
 workflow_name = "create_community_reports"
+workflow_tables = WorkflowTables(
+    inputs=["relationships", "entities", "communities", "covariates"],
+    outputs=["community_reports"],
+    config_sections=["community_reports", "extract_claims"],
+)
 
 
 async def run_workflow(
@@ -26,20 +27,18 @@ async def run_workflow(
     callbacks: WorkflowCallbacks,
 ) -> pd.DataFrame | None:
     """All the steps to transform community reports."""
-    edges = await load_table_from_storage("relationships", context.storage)
-    entities = await load_table_from_storage("entities", context.storage)
-    communities = await load_table_from_storage("communities", context.storage)
+    edges = await context.tables.get("relationships")
+    entities = await context.tables.get("entities")
+    communities = await context.tables.get("communities")
     claims = None
-    if config.extract_claims.enabled and await storage_has_table(
-        "covariates", context.storage
-    ):
-        claims = await load_table_from_storage("covariates", context.storage)
+    if config.extract_claims.enabled and await context.tables.has("covariates"):
+        claims = await context.tables.get("covariates")
 
     community_reports_llm_settings = config.get_language_model_config(
         config.community_reports.model_id
     )
     async_mode = community_reports_llm_settings.async_mode
-    num_threads = community_reports_llm_settings.parallelization_num_threads
+    num_threads = community_reports_llm_settings.num_threads()
     summarization_strategy = config.community_reports.resolved_strategy(
         config.root_dir, community_reports_llm_settings
     )
@@ -54,8 +53,9 @@ async def run_workflow(
         summarization_strategy=summarization_strategy,
         async_mode=async_mode,
         num_threads=num_threads,
+        longest_first=config.longest_first,
     )
 
-    await write_table_to_storage(output, "community_reports", context.storage)
+    await context.tables.set("community_reports", output)
 
     return output
@@ -11,9 +11,14 @@ from graphrag.index.context import PipelineRunContext
 from graphrag.index.flows.create_community_reports_text import (
     create_community_reports_text,
 )
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.typing import WorkflowTables
 
 workflow_name = "create_community_reports_text"
+workflow_tables = WorkflowTables(
+    inputs=["entities", "communities", "text_units"],
+    outputs=["community_reports"],
+    config_sections=["community_reports"],
+)
 
 
 async def run_workflow(
@@ -22,16 +27,16 @@ async def run_workflow(
     callbacks: WorkflowCallbacks,
 ) -> pd.DataFrame | None:
     """All the steps to transform community reports."""
-    entities = await load_table_from_storage("entities", context.storage)
-    communities = await load_table_from_storage("communities", context.storage)
+    entities = await context.tables.get("entities")
+    communities = await context.tables.get("communities")
 
-    text_units = await load_table_from_storage("text_units", context.storage)
+    text_units = await context.tables.get("text_units")
 
     community_reports_llm_settings = config.get_language_model_config(
         config.community_reports.model_id
     )
     async_mode = community_reports_llm_settings.async_mode
-    num_threads = community_reports_llm_settings.parallelization_num_threads
+    num_threads = community_reports_llm_settings.num_threads()
     summarization_strategy = config.community_reports.resolved_strategy(
         config.root_dir, community_reports_llm_settings
     )
@@ -45,8 +50,9 @@ async def run_workflow(
         summarization_strategy,
         async_mode=async_mode,
         num_threads=num_threads,
+        longest_first=config.longest_first,
     )
 
-    await write_table_to_storage(output, "community_reports", context.storage)
+    await context.tables.set("community_reports", output)
 
     return output
@@ -11,9 +11,14 @@ from graphrag.index.context import PipelineRunContext
 from graphrag.index.flows.create_final_documents import (
     create_final_documents,
 )
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.typing import WorkflowTables
 
 workflow_name = "create_final_documents"
+workflow_tables = WorkflowTables(
+    inputs=["documents", "text_units"],
+    outputs=["documents"],
+    config_sections=["input"],
+)
 
 
 async def run_workflow(
@@ -22,12 +27,12 @@ async def run_workflow(
     _callbacks: WorkflowCallbacks,
 ) -> pd.DataFrame | None:
     """All the steps to transform final documents."""
-    documents = await load_table_from_storage("documents", context.storage)
-    text_units = await load_table_from_storage("text_units", context.storage)
+    documents = await context.tables.get("documents")
+    text_units = await context.tables.get("text_units")
 
     input = config.input
     output = create_final_documents(documents, text_units, input.metadata)
 
-    await write_table_to_storage(output, "documents", context.storage)
+    await context.tables.set("documents", output)
 
     return output
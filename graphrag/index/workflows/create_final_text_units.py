@@ -11,13 +11,14 @@ from graphrag.index.context import PipelineRunContext
 from graphrag.index.flows.create_final_text_units import (
     create_final_text_units,
 )
-from graphrag.utils.storage import (
-    load_table_from_storage,
-    storage_has_table,
-    write_table_to_storage,
-)
+from graphrag.index.typing import WorkflowTables
 
 workflow_name = "create_final_text_units"
+workflow_tables = WorkflowTables(
+    inputs=["text_units", "entities", "relationships", "covariates"],
+    outputs=["text_units"],
+    config_sections=["extract_claims"],
+)
 
 
 async def run_workflow(
@@ -26,16 +27,12 @@ async def run_workflow(
     _callbacks: WorkflowCallbacks,
 ) -> pd.DataFrame | None:
     """All the steps to transform the text units."""
-    text_units = await load_table_from_storage("text_units", context.storage)
-    final_entities = await load_table_from_storage("entities", context.storage)
-    final_relationships = await load_table_from_storage(
-        "relationships", context.storage
-    )
+    text_units = await context.tables.get("text_units")
+    final_entities = await context.tables.get("entities")
+    final_relationships = await context.tables.get("relationships")
     final_covariates = None
-    if config.extract_claims.enabled and await storage_has_table(
-        "covariates", context.storage
-    ):
-        final_covariates = await load_table_from_storage("covariates", context.storage)
+    if config.extract_claims.enabled and await context.tables.has("covariates"):
+        final_covariates = await context.tables.get("covariates")
 
     output = create_final_text_units(
         text_units,
@@ -44,6 +41,6 @@ async def run_workflow(
         final_covariates,
     )
 
-    await write_table_to_storage(output, "text_units", context.storage)
+    await context.tables.set("text_units", output)
 
     return output
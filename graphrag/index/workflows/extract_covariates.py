@@ -11,9 +11,14 @@ from graphrag.index.context import PipelineRunContext
 from graphrag.index.flows.extract_covariates import (
     extract_covariates,
 )
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.typing import WorkflowTables
 
 workflow_name = "extract_covariates"
+workflow_tables = WorkflowTables(
+    inputs=["text_units"],
+    outputs=["covariates"],
+    config_sections=["extract_claims"],
+)
 
 
 async def run_workflow(
@@ -22,7 +27,7 @@ async def run_workflow(
     callbacks: WorkflowCallbacks,
 ) -> pd.DataFrame | None:
     """All the steps to extract and format covariates."""
-    text_units = await load_table_from_storage("text_units", context.storage)
+    text_units = await context.tables.get("text_units")
 
     extract_claims_llm_settings = config.get_language_model_config(
         config.extract_claims.model_id
@@ -32,7 +37,7 @@ async def run_workflow(
     )
 
     async_mode = extract_claims_llm_settings.async_mode
-    num_threads = extract_claims_llm_settings.parallelization_num_threads
+    num_threads = extract_claims_llm_settings.num_threads()
 
     output = await extract_covariates(
         text_units,
@@ -43,8 +48,9 @@ async def run_workflow(
         async_mode=async_mode,
         entity_types=None,
         num_threads=num_threads,
+        longest_first=config.longest_first,
     )
 
-    await write_table_to_storage(output, "covariates", context.storage)
+    await context.tables.set("covariates", output)
 
     return output
@@ -11,11 +11,21 @@ from graphrag.index.context import PipelineRunContext
 from graphrag.index.flows.extract_graph import (
     extract_graph,
 )
-from graphrag.index.operations.create_graph import create_graph
 from graphrag.index.operations.snapshot_graphml import snapshot_graphml
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.typing import WorkflowTables
 
 workflow_name = "extract_graph"
+workflow_tables = WorkflowTables(
+    inputs=["text_units"],
+    outputs=["entities", "relationships"],
+    config_sections=[
+        "extract_graph",
+        "summarize_descriptions",
+        "embed_graph",
+        "umap",
+        "snapshots",
+    ],
+)
 
 
 async def run_workflow(
@@ -24,7 +34,7 @@ async def run_workflow(
     callbacks: WorkflowCallbacks,
 ) -> pd.DataFrame | None:
     """All the steps to create the base entity graph."""
-    text_units = await load_table_from_storage("text_units", context.storage)
+    text_units = await context.tables.get("text_units")
 
     extract_graph_llm_settings = config.get_language_model_config(
         config.extract_graph.model_id
@@ -32,7 +42,7 @@ async def run_workflow(
     extraction_strategy = config.extract_graph.resolved_strategy(
         config.root_dir, extract_graph_llm_settings
     )
-    extraction_num_threads = extract_graph_llm_settings.parallelization_num_threads
+    extraction_num_threads = extract_graph_llm_settings.num_threads()
     extraction_async_mode = extract_graph_llm_settings.async_mode
     entity_types = config.extract_graph.entity_types
 
@@ -42,7 +52,8 @@ async def run_workflow(
     summarization_strategy = config.summarize_descriptions.resolved_strategy(
         config.root_dir, summarization_llm_settings
     )
-    summarization_num_threads = summarization_llm_settings.parallelization_num_threads
+    summarization_num_threads = summarization_llm_settings.num_threads()
+    summarization_async_mode = summarization_llm_settings.async_mode
 
     entities, relationships = await extract_graph(
         text_units=text_units,
@@ -54,18 +65,21 @@ async def run_workflow(
         entity_types=entity_types,
         summarization_strategy=summarization_strategy,
         summarization_num_threads=summarization_num_threads,
+        summarization_async_mode=summarization_async_mode,
+        longest_first=config.longest_first,
         embed_config=config.embed_graph,
         layout_enabled=config.umap.enabled,
+        graphs=context.graphs,
     )
 
-    await write_table_to_storage(entities, "entities", context.storage)
-    await write_table_to_storage(relationships, "relationships", context.storage)
+    await context.tables.set("entities", entities)
+    await context.tables.set("relationships", relationships)
+    await context.graphs.save(relationships)
 
     if config.snapshots.graphml:
         # todo: extract graphs at each level, and add in meta like descriptions
-        graph = create_graph(relationships)
         await snapshot_graphml(
-            graph,
+            context.graphs.get(relationships).to_networkx(),
             name="graph",
             storage=context.storage,
         )
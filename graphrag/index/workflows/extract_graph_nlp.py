@@ -11,11 +11,21 @@ from graphrag.index.context import PipelineRunContext
 from graphrag.index.flows.extract_graph_nlp import (
     extract_graph_nlp,
 )
-from graphrag.index.operations.create_graph import create_graph
 from graphrag.index.operations.snapshot_graphml import snapshot_graphml
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.typing import WorkflowTables
 
 workflow_name = "extract_graph_nlp"
+workflow_tables = WorkflowTables(
+    inputs=["text_units"],
+    outputs=["entities", "relationships"],
+    config_sections=[
+        "extract_graph_nlp",
+        "prune_graph",
+        "embed_graph",
+        "umap",
+        "snapshots",
+    ],
+)
 
 
 async def run_workflow(
@@ -24,7 +34,7 @@ async def run_workflow(
     callbacks: WorkflowCallbacks,
 ) -> pd.DataFrame | None:
     """All the steps to create the base entity graph."""
-    text_units = await load_table_from_storage("text_units", context.storage)
+    text_units = await context.tables.get("text_units")
 
     entities, relationships = extract_graph_nlp(
         text_units,
@@ -33,16 +43,17 @@ async def run_workflow(
         pruning_config=config.prune_graph,
         embed_config=config.embed_graph,
         layout_enabled=config.umap.enabled,
+        graphs=context.graphs,
     )
 
-    await write_table_to_storage(entities, "entities", context.storage)
-    await write_table_to_storage(relationships, "relationships", context.storage)
+    await context.tables.set("entities", entities)
+    await context.tables.set("relationships", relationships)
+    await context.graphs.save(relationships)
 
     if config.snapshots.graphml:
         # todo: extract graphs at each level, and add in meta like descriptions
-        graph = create_graph(relationships)
         await snapshot_graphml(
-            graph,
+            context.graphs.get(relationships).to_networkx(),
             name="graph",
             storage=context.storage,
         )
@@ -0,0 +1,96 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing run_workflow method definition."""
+
+import pandas as pd
+
+from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.context import PipelineRunContext
+from graphrag.index.flows.extract_graph_streaming import (
+    extract_graph_streaming,
+)
+from graphrag.index.input.factory import stream_input
+from graphrag.index.operations.snapshot_graphml import snapshot_graphml
+from graphrag.index.typing import WorkflowTables
+
+workflow_name = "extract_graph_streaming"
+workflow_tables = WorkflowTables(
+    inputs=["documents"],
+    outputs=["documents", "text_units", "entities", "relationships"],
+    config_sections=[
+        "input",
+        "chunks",
+        "streaming",
+        "extract_graph",
+        "summarize_descriptions",
+        "embed_graph",
+        "umap",
+        "snapshots",
+    ],
+)
+
+
+async def run_workflow(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+    callbacks: WorkflowCallbacks,
+) -> pd.DataFrame | None:
+    """All the steps to create the base entity graph, streaming the input documents in micro-batches."""
+    batches = stream_input(
+        config.input,
+        batch_documents=config.streaming.batch_documents,
+        batch_tokens=config.streaming.batch_tokens,
+        encoding_model=config.chunks.encoding_model,
+        root_dir=config.root_dir,
+    )
+
+    extract_graph_llm_settings = config.get_language_model_config(
+        config.extract_graph.model_id
+    )
+    extraction_strategy = config.extract_graph.resolved_strategy(
+        config.root_dir, extract_graph_llm_settings
+    )
+    summarization_llm_settings = config.get_language_model_config(
+        config.summarize_descriptions.model_id
+    )
+    summarization_strategy = config.summarize_descriptions.resolved_strategy(
+        config.root_dir, summarization_llm_settings
+    )
+
+    documents, text_units, entities, relationships = await extract_graph_streaming(
+        batches=batches,
+        storage=context.storage.child("streaming"),
+        callbacks=callbacks,
+        cache=context.cache,
+        chunks=config.chunks,
+        metadata=config.input.metadata,
+        extraction_strategy=extraction_strategy,
+        extraction_num_threads=extract_graph_llm_settings.num_threads(),
+        extraction_async_mode=extract_graph_llm_settings.async_mode,
+        entity_types=config.extract_graph.entity_types,
+        summarization_strategy=summarization_strategy,
+        summarization_num_threads=summarization_llm_settings.num_threads(),
+        summarization_async_mode=summarization_llm_settings.async_mode,
+        longest_first=config.longest_first,
+        embed_config=config.embed_graph,
+        layout_enabled=config.umap.enabled,
+        graphs=context.graphs,
+    )
+
+    context.stats.num_documents = documents.num_rows
+    await context.tables.set_spill("documents", documents)
+    await documents.clear()
+    await context.tables.set_spill("text_units", text_units)
+    await text_units.clear()
+    await context.tables.set("entities", entities)
+    await context.tables.set("relationships", relationships)
+    await context.graphs.save(relationships)
+
+    if config.snapshots.graphml:
+        await snapshot_graphml(
+            context.graphs.get(relationships).to_networkx(),
+            name="graph",
+            storage=context.storage,
+        )
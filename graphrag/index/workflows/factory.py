@@ -27,9 +27,15 @@ def _get_workflows_list(
     match method:
         case IndexingMethod.Standard:
             return [
-                "create_base_text_units",
-                "create_final_documents",
-                "extract_graph",
+                *(
+                    ["extract_graph_streaming"]
+                    if config.streaming.enabled and not config.update_index_output
+                    else [
+                        "create_base_text_units",
+                        "create_final_documents",
+                        "extract_graph",
+                    ]
+                ),
                 *(["extract_covariates"] if config.extract_claims.enabled else []),
                 "create_communities",
                 "create_final_text_units",
@@ -12,9 +12,21 @@ from graphrag.index.context import PipelineRunContext
 from graphrag.index.flows.generate_text_embeddings import (
     generate_text_embeddings,
 )
-from graphrag.utils.storage import load_table_from_storage
+from graphrag.index.typing import WorkflowTables
 
 workflow_name = "generate_text_embeddings"
+workflow_tables = WorkflowTables(
+    inputs=[
+        "documents",
+        "relationships",
+        "text_units",
+        "entities",
+        "community_reports",
+    ],
+    outputs=[],
+    config_sections=["embed_text", "vector_store", "snapshots"],
+    side_effects=["vector_store"],
+)
 
 
 async def run_workflow(
@@ -23,15 +35,11 @@ async def run_workflow(
     callbacks: WorkflowCallbacks,
 ) -> pd.DataFrame | None:
     """All the steps to transform community reports."""
-    final_documents = await load_table_from_storage("documents", context.storage)
-    final_relationships = await load_table_from_storage(
-        "relationships", context.storage
-    )
-    final_text_units = await load_table_from_storage("text_units", context.storage)
-    final_entities = await load_table_from_storage("entities", context.storage)
-    final_community_reports = await load_table_from_storage(
-        "community_reports", context.storage
-    )
+    final_documents = await context.tables.get("documents")
+    final_relationships = await context.tables.get("relationships")
+    final_text_units = await context.tables.get("text_units")
+    final_entities = await context.tables.get("entities")
+    final_community_reports = await context.tables.get("community_reports")
 
     embedded_fields = get_embedded_fields(config)
     text_embed = get_embedding_settings(config)
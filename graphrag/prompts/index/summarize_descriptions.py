@@ -17,3 +17,27 @@ Description List: {description_list}
 #######
 Output:
 """
+
+BATCH_SUMMARIZE_PROMPT = """
+You are a helpful assistant responsible for generating comprehensive summaries of the data provided below.
+Each item below has an id, one or two entities, and a list of descriptions, all related to the same entity or group of entities.
+For each item, please concatenate all of its descriptions into a single, comprehensive description. Make sure to include information collected from all the descriptions of the item, and nothing from the other items.
+If the provided descriptions are contradictory, please resolve the contradictions and provide a single, coherent summary.
+Make sure each summary is written in third person, and include the entity names so we have the full context.
+
+Return output as a well-formed JSON-formatted string with the following format:
+{{
+    "summaries": [
+        {{
+            "id": <id of the item>,
+            "description": <summary of the item>
+        }}
+    ]
+}}
+
+#######
+-Data-
+Items: {items}
+#######
+Output:
+"""
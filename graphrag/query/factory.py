@@ -168,6 +168,7 @@ def get_global_search_engine(
             "context_name": "Reports",
         },
         concurrent_coroutines=gs_config.concurrency,
+        async_mode=default_llm_settings.async_mode,
         response_type=response_type,
     )
 
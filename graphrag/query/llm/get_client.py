@@ -5,6 +5,8 @@
 
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 
+from graphrag.cache.embedding_cache import EmbeddingCache
+from graphrag.cache.factory import CacheFactory
 from graphrag.config.enums import AuthType, LLMType
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.query.llm.oai.chat_openai import ChatOpenAI
@@ -62,6 +64,13 @@ def get_text_embedder(config: GraphRagConfig) -> OpenAIEmbedding:
     else:
         audience = embeddings_llm_settings.audience
     print(f"creating embedding llm client with {llm_debug_info}")  # noqa T201
+    # share the per-text embedding cache written by the indexing pipeline
+    cache_config = config.cache.model_dump()
+    cache = CacheFactory().create_cache(
+        cache_type=cache_config["type"],
+        root_dir=config.root_dir,
+        kwargs=cache_config,
+    )
     return OpenAIEmbedding(
         api_key=embeddings_llm_settings.api_key,
         azure_ad_token_provider=(
@@ -77,4 +86,10 @@ def get_text_embedder(config: GraphRagConfig) -> OpenAIEmbedding:
         deployment_name=embeddings_llm_settings.deployment_name,
         api_version=embeddings_llm_settings.api_version,
         max_retries=embeddings_llm_settings.max_retries,
+        cache=EmbeddingCache(
+            cache,
+            embeddings_llm_settings.model,
+            deployment_name=embeddings_llm_settings.deployment_name,
+            api_base=embeddings_llm_settings.api_base,
+        ),
     )
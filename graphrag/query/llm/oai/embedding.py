@@ -19,6 +19,7 @@ from tenacity import (
 )
 
 import graphrag.config.defaults as defs
+from graphrag.cache.embedding_cache import EmbeddingCache
 from graphrag.logger.base import StatusLogger
 from graphrag.query.llm.base import BaseTextEmbedding
 from graphrag.query.llm.oai.base import OpenAILLMImpl
@@ -48,6 +49,7 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         request_timeout: float = 180.0,
         retry_error_types: tuple[type[BaseException]] = OPENAI_RETRY_ERROR_TYPES,  # type: ignore
         logger: StatusLogger | None = None,
+        cache: EmbeddingCache | None = None,
     ):
         OpenAILLMImpl.__init__(
             self=self,
@@ -68,6 +70,7 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         self.max_tokens = max_tokens
         self.token_encoder = tiktoken.get_encoding(self.encoding_name)
         self.retry_error_types = retry_error_types
+        self.cache = cache
 
     def embed(self, text: str, **kwargs: Any) -> list[float]:
         """
@@ -76,6 +79,10 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         For text longer than max_tokens, chunk texts into max_tokens, embed each chunk, then combine using weighted average.
         Please refer to: https://github.com/openai/openai-cookbook/blob/main/examples/Embedding_long_inputs.ipynb
         """
+        if self.cache is not None:
+            cached = self.cache.get_sync([text])[0]
+            if cached is not None:
+                return cached
         token_chunks = chunk_text(
             text=text, token_encoder=self.token_encoder, max_tokens=self.max_tokens
         )
@@ -96,6 +103,8 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
                 continue
         chunk_embeddings = np.average(chunk_embeddings, axis=0, weights=chunk_lens)
         chunk_embeddings = chunk_embeddings / np.linalg.norm(chunk_embeddings)
+        if self.cache is not None:
+            self.cache.set_sync([text], [chunk_embeddings])
         return chunk_embeddings.tolist()
 
     async def aembed(self, text: str, **kwargs: Any) -> list[float]:
@@ -104,6 +113,10 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
 
         For text longer than max_tokens, chunk texts into max_tokens, embed each chunk, then combine using weighted average.
         """
+        if self.cache is not None:
+            cached = (await self.cache.get([text]))[0]
+            if cached is not None:
+                return cached
         token_chunks = chunk_text(
             text=text, token_encoder=self.token_encoder, max_tokens=self.max_tokens
         )
@@ -117,6 +130,8 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         chunk_lens = [result[1] for result in embedding_results]
         chunk_embeddings = np.average(chunk_embeddings, axis=0, weights=chunk_lens)  # type: ignore
         chunk_embeddings = chunk_embeddings / np.linalg.norm(chunk_embeddings)
+        if self.cache is not None:
+            await self.cache.set([text], [chunk_embeddings])
         return chunk_embeddings.tolist()
 
     def _embed_with_retry(
@@ -15,6 +15,8 @@ import pandas as pd
 import tiktoken
 
 from graphrag.callbacks.global_search_callbacks import GlobalSearchLLMCallback
+from graphrag.config.enums import AsyncType
+from graphrag.index.utils.adaptive_limiter import create_concurrency_limiter
 from graphrag.prompts.query.global_search_knowledge_system_prompt import (
     GENERAL_KNOWLEDGE_INSTRUCTION,
 )
@@ -75,6 +77,7 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
         reduce_llm_params: dict[str, Any] = DEFAULT_REDUCE_LLM_PARAMS,
         context_builder_params: dict[str, Any] | None = None,
         concurrent_coroutines: int = 32,
+        async_mode: AsyncType = AsyncType.AsyncIO,
     ):
         super().__init__(
             llm=llm,
@@ -100,7 +103,7 @@ class GlobalSearch(BaseSearch[GlobalContextBuilder]):
             # remove response_format key if json_mode is False
             self.map_llm_params.pop("response_format", None)
 
-        self.semaphore = asyncio.Semaphore(concurrent_coroutines)
+        self.semaphore = create_concurrency_limiter(async_mode, concurrent_coroutines)
 
     async def astream_search(
         self,
@@ -145,6 +145,18 @@ class FilePipelineStorage(PipelineStorage):
         """Return the keys in the storage."""
         return [item.name for item in Path(self._root_dir).iterdir() if item.is_file()]
 
+    def size(self) -> int | None:
+        """Return the bytes of the files in the storage."""
+        return sum(
+            item.stat().st_size
+            for item in Path(self._root_dir).iterdir()
+            if item.is_file()
+        )
+
+    def path(self, key: str) -> Path | None:
+        """Return the path of the file stored under `key`, for writers that stream to disk."""
+        return join_path(self._root_dir, key)
+
 
 def join_path(file_path: str, file_name: str) -> Path:
     """Join a path and a file. Independent of the OS."""
@@ -80,3 +80,7 @@ class PipelineStorage(metaclass=ABCMeta):
     @abstractmethod
     def keys(self) -> list[str]:
         """List all keys in the storage."""
+
+    def size(self) -> int | None:
+        """Return the bytes stored under the keys in the storage, or None if the storage can not tell."""
+        return None
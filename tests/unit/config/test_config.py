@@ -181,3 +181,13 @@ def test_load_config_missing_env_vars() -> None:
     root_dir = (cwd / "fixtures" / "minimal_config_missing_env_var").resolve()
     with pytest.raises(KeyError):
         load_config(root_dir=root_dir)
+
+
+@mock.patch.dict(os.environ, {"CUSTOM_API_KEY": FAKE_API_KEY}, clear=True)
+def test_load_config_resolves_batch_dir_against_root_dir() -> None:
+    cwd = Path(__file__).parent
+    root_dir = (cwd / "fixtures" / "minimal_config").resolve()
+    actual = load_config(root_dir=root_dir)
+    assert actual.models[defs.DEFAULT_CHAT_MODEL_ID].batch_dir == str(
+        root_dir / defs.LLM_BATCH_DIR
+    )
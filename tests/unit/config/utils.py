@@ -13,6 +13,7 @@ from graphrag.config.models.drift_search_config import DRIFTSearchConfig
 from graphrag.config.models.embed_graph_config import EmbedGraphConfig
 from graphrag.config.models.extract_claims_config import ClaimExtractionConfig
 from graphrag.config.models.extract_graph_config import ExtractGraphConfig
+from graphrag.config.models.fault_tolerance_config import FaultToleranceConfig
 from graphrag.config.models.global_search_config import GlobalSearchConfig
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.config.models.input_config import InputConfig
@@ -21,6 +22,7 @@ from graphrag.config.models.local_search_config import LocalSearchConfig
 from graphrag.config.models.output_config import OutputConfig
 from graphrag.config.models.reporting_config import ReportingConfig
 from graphrag.config.models.snapshots_config import SnapshotsConfig
+from graphrag.config.models.streaming_config import StreamingConfig
 from graphrag.config.models.summarize_descriptions_config import (
     SummarizeDescriptionsConfig,
 )
@@ -83,6 +85,7 @@ DEFAULT_GRAPHRAG_CONFIG_SETTINGS = {
         "container_name": None,
         "storage_account_blob_url": None,
         "cosmosdb_account_url": None,
+        "memory_max_bytes": defs.CACHE_MEMORY_MAX_BYTES,
     },
     "input": {
         "type": defs.INPUT_TYPE,
@@ -125,6 +128,7 @@ DEFAULT_GRAPHRAG_CONFIG_SETTINGS = {
     "snapshots": {
         "embeddings": defs.SNAPSHOTS_EMBEDDINGS,
         "graphml": defs.SNAPSHOTS_GRAPHML,
+        "graph": defs.SNAPSHOTS_GRAPH,
     },
     "extract_graph": {
         "prompt": None,
@@ -160,6 +164,9 @@ DEFAULT_GRAPHRAG_CONFIG_SETTINGS = {
         "max_cluster_size": defs.MAX_CLUSTER_SIZE,
         "use_lcc": defs.USE_LCC,
         "seed": defs.CLUSTER_GRAPH_SEED,
+        "per_component": defs.CLUSTER_GRAPH_PER_COMPONENT,
+        "num_processes": defs.CLUSTER_GRAPH_NUM_PROCESSES,
+        "incremental": defs.CLUSTER_GRAPH_INCREMENTAL,
     },
     "umap": {"enabled": defs.UMAP_ENABLED},
     "local_search": {
@@ -227,6 +234,18 @@ DEFAULT_GRAPHRAG_CONFIG_SETTINGS = {
         "max_tokens": defs.BASIC_SEARCH_MAX_TOKENS,
         "llm_max_tokens": defs.BASIC_SEARCH_LLM_MAX_TOKENS,
     },
+    "concurrent_workflows": defs.CONCURRENT_WORKFLOWS,
+    "longest_first": defs.LONGEST_FIRST,
+    "streaming": {
+        "enabled": defs.STREAMING_ENABLED,
+        "batch_documents": defs.STREAMING_BATCH_DOCUMENTS,
+        "batch_tokens": defs.STREAMING_BATCH_TOKENS,
+    },
+    "fault_tolerance": {
+        "max_retries": defs.FAULT_TOLERANCE_MAX_RETRIES,
+        "retry_backoff": defs.FAULT_TOLERANCE_RETRY_BACKOFF,
+        "max_failure_rate": defs.FAULT_TOLERANCE_MAX_FAILURE_RATE,
+    },
 }
 
 
@@ -261,6 +280,7 @@ def assert_language_model_configs(
     assert actual.model_supports_json == expected.model_supports_json
     assert actual.tokens_per_minute == expected.tokens_per_minute
     assert actual.requests_per_minute == expected.requests_per_minute
+    assert actual.rate_limit_state_path == expected.rate_limit_state_path
     assert actual.max_retries == expected.max_retries
     assert actual.max_retry_wait == expected.max_retry_wait
     assert (
@@ -271,6 +291,11 @@ def assert_language_model_configs(
     assert actual.parallelization_stagger == expected.parallelization_stagger
     assert actual.parallelization_num_threads == expected.parallelization_num_threads
     assert actual.async_mode == expected.async_mode
+    assert actual.batch_backend == expected.batch_backend
+    assert actual.batch_dir == expected.batch_dir
+    assert actual.batch_max_size == expected.batch_max_size
+    assert actual.batch_flush_interval == expected.batch_flush_interval
+    assert actual.batch_poll_interval == expected.batch_poll_interval
     if actual.responses is not None:
         assert expected.responses is not None
         assert len(actual.responses) == len(expected.responses)
@@ -337,6 +362,7 @@ def assert_cache_configs(actual: CacheConfig, expected: CacheConfig) -> None:
     assert actual.container_name == expected.container_name
     assert actual.storage_account_blob_url == expected.storage_account_blob_url
     assert actual.cosmosdb_account_url == expected.cosmosdb_account_url
+    assert actual.memory_max_bytes == expected.memory_max_bytes
 
 
 def assert_input_configs(actual: InputConfig, expected: InputConfig) -> None:
@@ -391,6 +417,23 @@ def assert_snapshots_configs(
 ) -> None:
     assert actual.embeddings == expected.embeddings
     assert actual.graphml == expected.graphml
+    assert actual.graph == expected.graph
+
+
+def assert_streaming_configs(
+    actual: StreamingConfig, expected: StreamingConfig
+) -> None:
+    assert actual.enabled == expected.enabled
+    assert actual.batch_documents == expected.batch_documents
+    assert actual.batch_tokens == expected.batch_tokens
+
+
+def assert_fault_tolerance_configs(
+    actual: FaultToleranceConfig, expected: FaultToleranceConfig
+) -> None:
+    assert actual.max_retries == expected.max_retries
+    assert actual.retry_backoff == expected.retry_backoff
+    assert actual.max_failure_rate == expected.max_failure_rate
 
 
 def assert_extract_graph_configs(
@@ -399,6 +442,7 @@ def assert_extract_graph_configs(
     assert actual.prompt == expected.prompt
     assert actual.entity_types == expected.entity_types
     assert actual.max_gleanings == expected.max_gleanings
+    assert actual.max_pack_tokens == expected.max_pack_tokens
     assert actual.strategy == expected.strategy
     assert actual.encoding_model == expected.encoding_model
     assert actual.model_id == expected.model_id
@@ -408,7 +452,9 @@ def assert_summarize_descriptions_configs(
     actual: SummarizeDescriptionsConfig, expected: SummarizeDescriptionsConfig
 ) -> None:
     assert actual.prompt == expected.prompt
+    assert actual.batch_prompt == expected.batch_prompt
     assert actual.max_length == expected.max_length
+    assert actual.max_batch_tokens == expected.max_batch_tokens
     assert actual.strategy == expected.strategy
     assert actual.model_id == expected.model_id
 
@@ -441,6 +487,9 @@ def assert_cluster_graph_configs(
     assert actual.max_cluster_size == expected.max_cluster_size
     assert actual.use_lcc == expected.use_lcc
     assert actual.seed == expected.seed
+    assert actual.per_component == expected.per_component
+    assert actual.num_processes == expected.num_processes
+    assert actual.incremental == expected.incremental
 
 
 def assert_umap_configs(actual: UmapConfig, expected: UmapConfig) -> None:
@@ -581,3 +630,7 @@ def assert_graphrag_configs(actual: GraphRagConfig, expected: GraphRagConfig) ->
     assert_local_search_configs(actual.local_search, expected.local_search)
     assert_global_search_configs(actual.global_search, expected.global_search)
     assert_drift_search_configs(actual.drift_search, expected.drift_search)
+    assert actual.concurrent_workflows == expected.concurrent_workflows
+    assert actual.longest_first == expected.longest_first
+    assert_streaming_configs(actual.streaming, expected.streaming)
+    assert_fault_tolerance_configs(actual.fault_tolerance, expected.fault_tolerance)
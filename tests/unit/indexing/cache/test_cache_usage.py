@@ -0,0 +1,83 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+from pathlib import Path
+
+from graphrag.cache.json_pipeline_cache import JsonPipelineCache
+from graphrag.cache.memory_pipeline_cache import InMemoryCache
+from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.cache.usage import (
+    CacheUsageRecorder,
+    cache_stats,
+    prune_cache,
+    write_cache_usage,
+)
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+
+
+async def _run(
+    cache: PipelineCache,
+    keys: list[str],
+    namespace: str = "extract_graph",
+    resumed: bool = False,
+) -> None:
+    recorder = CacheUsageRecorder(cache)
+    recorder.carry_forward = resumed
+    child = recorder.child(namespace)
+    for key in keys:
+        if await child.get(key) is None:
+            await child.set(key, f"response for {key}")
+    await write_cache_usage(recorder)
+
+
+async def test_reports_stats_and_prunes_entries_of_older_runs():
+    cache = InMemoryCache()
+    await _run(cache, ["a", "b"])
+    await _run(cache, ["b", "c"])
+
+    stats = await cache_stats(cache)
+    assert stats["extract_graph"]["entries"] == 3
+    assert stats["extract_graph"]["hits"] == 1
+    assert stats["extract_graph"]["hit_rate"] == 0.5
+    assert stats["text_embedding"]["entries"] == 0
+
+    assert (await prune_cache(cache, keep_runs=1, dry_run=True))["extract_graph"] == 1
+    assert await cache.child("extract_graph").has("a")
+
+    pruned = await prune_cache(cache, keep_runs=1)
+    assert pruned["extract_graph"] == 1
+    assert pruned["cache_runs"] == 1
+    assert sorted(cache.child("extract_graph").keys()) == ["b", "c"]
+
+
+async def test_prune_keeps_embeddings_written_by_queries():
+    cache = InMemoryCache()
+    await _run(cache, ["a"])
+    await cache.child("embeddings").set("query text", [0.1, 0.2])
+
+    pruned = await prune_cache(cache, keep_runs=1)
+
+    assert "embeddings" not in pruned
+    assert await cache.child("embeddings").has("query text")
+
+
+async def test_prune_keeps_entries_of_workflows_skipped_on_resume():
+    cache = InMemoryCache()
+    await _run(cache, ["a", "b"])
+    # a resumed run skips graph extraction and only writes community reports
+    await _run(cache, ["r"], namespace="community_reporting", resumed=True)
+    await _run(cache, ["s"], namespace="community_reporting", resumed=True)
+
+    pruned = await prune_cache(cache, keep_runs=1)
+
+    assert pruned["extract_graph"] == 0
+    assert sorted(cache.child("extract_graph").keys()) == ["a", "b"]
+
+
+async def test_stats_use_stored_sizes(tmp_path: Path):
+    cache = JsonPipelineCache(FilePipelineStorage(str(tmp_path)))
+    await _run(cache, ["a", "b"])
+
+    stats = await cache_stats(cache)
+
+    files = (tmp_path / "extract_graph").iterdir()
+    assert stats["extract_graph"]["bytes"] == sum(file.stat().st_size for file in files)
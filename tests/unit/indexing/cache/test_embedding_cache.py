@@ -0,0 +1,76 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+from typing import Any
+
+import numpy as np
+
+from graphrag.cache.embedding_cache import EmbeddingCache
+from graphrag.cache.memory_pipeline_cache import InMemoryCache
+from graphrag.cache.pipeline_cache import PipelineCache
+
+
+async def test_keys_by_model_and_normalized_text():
+    cache = InMemoryCache()
+    embeddings = EmbeddingCache(cache, "model-a")
+
+    await embeddings.set(["some  text\n"], [np.array([0.5, 0.25])])
+
+    assert await embeddings.get(["some text", "other text"]) == [[0.5, 0.25], None]
+    assert await EmbeddingCache(cache, "model-b").get(["some text"]) == [None]
+
+
+async def test_keys_by_deployment_and_dimensions():
+    cache = InMemoryCache()
+    await EmbeddingCache(cache, "model", deployment_name="a").set(["text"], [[1.0]])
+
+    assert await EmbeddingCache(cache, "model", deployment_name="b").get(["text"]) == [
+        None
+    ]
+    assert await EmbeddingCache(
+        cache, "model", deployment_name="a", dimensions=256
+    ).get(["text"]) == [None]
+
+
+class _CountingCache(InMemoryCache):
+    def __init__(self):
+        super().__init__()
+        self.pending = 0
+        self.max_pending = 0
+
+    async def _count(self) -> None:
+        self.pending += 1
+        self.max_pending = max(self.max_pending, self.pending)
+        await asyncio.sleep(0)
+        self.pending -= 1
+
+    async def get(self, key: str) -> Any:
+        await self._count()
+        return await super().get(key)
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        await self._count()
+        await super().set(key, value, debug_data)
+
+    def child(self, name: str) -> PipelineCache:
+        return self
+
+
+async def test_lookups_and_writes_are_bounded_by_batch_size():
+    cache = _CountingCache()
+    embeddings = EmbeddingCache(cache, "model", batch_size=3)
+    texts = [f"text {index}" for index in range(10)]
+
+    await embeddings.set(texts, [[float(index)] for index in range(10)])
+    cached = await embeddings.get(texts)
+
+    assert cached == [[float(index)] for index in range(10)]
+    assert cache.max_pending == 3
+
+
+def test_sync_access_shares_entries():
+    embeddings = EmbeddingCache(InMemoryCache(), "model")
+
+    embeddings.set_sync(["query"], [[1.0, 0.0]])
+
+    assert embeddings.get_sync(["query"]) == [[1.0, 0.0]]
@@ -0,0 +1,68 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+from pathlib import Path
+
+from graphrag.cache.json_pipeline_cache import JsonPipelineCache
+from graphrag.cache.sqlite_pipeline_cache import (
+    DATABASE_FILENAME,
+    SqliteCacheDatabase,
+    create_sqlite_cache,
+)
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+
+
+async def test_get_set_delete_and_clear_children(tmp_path: Path):
+    cache = create_sqlite_cache(tmp_path)
+    child = cache.child("extract_graph")
+
+    await cache.set("key", {"answer": 1})
+    await child.set("key", "child value", {"input": "prompt"})
+
+    assert await cache.get("key") == {"answer": 1}
+    assert await child.get("key") == "child value"
+    assert await child.has("key")
+    assert await cache.get("missing") is None
+
+    await cache.delete("key")
+    assert not await cache.has("key")
+
+    await cache.set("key", "root value")
+    await child.clear()
+    assert await child.get("key") is None
+    assert await cache.get("key") == "root value"
+
+
+async def test_persists_batched_writes_and_imports_json_cache(tmp_path: Path):
+    json_cache = JsonPipelineCache(FilePipelineStorage(root_dir=str(tmp_path)))
+    await json_cache.set("old", "from json")
+    await json_cache.child("summarize_descriptions").set("old", "from json child")
+
+    cache = create_sqlite_cache(tmp_path)
+    assert await cache.get("old") == "from json"
+    assert await cache.child("summarize_descriptions").get("old") == "from json child"
+
+    await cache.set("new", "buffered")
+    cache._database.flush()  # noqa: SLF001
+
+    reopened = create_sqlite_cache(tmp_path)
+    assert await reopened.get("new") == "buffered"
+
+
+async def test_size_counts_stored_bytes_per_namespace(tmp_path: Path):
+    cache = create_sqlite_cache(tmp_path)
+    await cache.child("reports").set("a", "ü")
+    await cache.child("reports").child("nested").set("b", "value")
+
+    # stored as {"result": "ü"}, with the ü taking two bytes
+    assert cache.child("reports").size() == len('{"result": "ü"}'.encode())
+    assert cache.size() == 0
+
+
+async def test_imports_json_cache_in_batches(tmp_path: Path):
+    json_cache = JsonPipelineCache(FilePipelineStorage(root_dir=str(tmp_path / "json")))
+    for index in range(5):
+        await json_cache.child("extract_graph").set(f"key {index}", index)
+    database = SqliteCacheDatabase(tmp_path / DATABASE_FILENAME)
+
+    assert database.import_json_cache(tmp_path / "json", batch_size=2) == 5
+    assert sorted(database.keys("extract_graph/")) == [f"key {i}" for i in range(5)]
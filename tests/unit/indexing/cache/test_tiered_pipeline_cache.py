@@ -0,0 +1,38 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+from graphrag.cache.memory_pipeline_cache import InMemoryCache
+from graphrag.cache.tiered_pipeline_cache import TieredPipelineCache
+
+
+async def test_serves_from_memory_and_evicts_least_recently_used():
+    persistent = InMemoryCache()
+    cache = TieredPipelineCache(persistent, max_bytes=20)
+
+    await cache.set("a", "x" * 6)
+    await cache.set("b", "y" * 6)
+    assert await cache.get("a") == "x" * 6
+    # "b" is now the least recently used entry
+    await cache.set("c", "z" * 6)
+
+    assert cache.stats.evictions == 1
+    assert cache.stats.num_entries == 2
+    assert cache.stats.num_bytes <= 20
+    # evicted entries are still read back from the persistent cache
+    assert await cache.get("b") == "y" * 6
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+async def test_children_share_memory_under_their_own_namespace():
+    cache = TieredPipelineCache(InMemoryCache(), max_bytes=1000)
+    child = cache.child("extract_graph")
+
+    await child.set("key", "child value")
+    await cache.set("key", "root value")
+
+    assert await cache.child("extract_graph").get("key") == "child value"
+    assert cache.stats.hits == 1
+
+    await child.clear()
+    assert await child.get("key") is None
+    assert await cache.get("key") == "root value"
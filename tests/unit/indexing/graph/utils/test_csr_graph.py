@@ -0,0 +1,54 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from graphrag.index.utils.csr_graph import CSRGraph
+
+
+def _random_edges(seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    num_edges = 60
+    return pd.DataFrame({
+        "source": [f"N{i}" for i in rng.integers(0, 40, num_edges)],
+        "target": [f"N{i}" for i in rng.integers(0, 40, num_edges)],
+        "weight": rng.random(num_edges),
+    })
+
+
+def test_matches_networkx():
+    for seed in range(20):
+        edges = _random_edges(seed)
+        expected = nx.from_pandas_edgelist(edges, edge_attr=["weight"])
+
+        graph = CSRGraph.from_edges(edges, weight="weight")
+
+        actual = graph.to_networkx()
+        assert list(actual.nodes) == list(expected.nodes)
+        assert list(actual.edges(data=True)) == list(expected.edges(data=True))
+        assert dict(zip(graph.nodes, graph.degree(), strict=True)) == dict(
+            expected.degree
+        )
+
+
+def test_largest_connected_component():
+    for seed in range(20):
+        edges = _random_edges(seed)
+        expected = max(nx.connected_components(nx.from_pandas_edgelist(edges)), key=len)
+
+        lcc = CSRGraph.from_edges(edges).largest_connected_component()
+
+        assert set(lcc.nodes) == expected
+        assert nx.is_connected(lcc.to_networkx())
+
+
+def test_edge_combined_degree():
+    graph = CSRGraph.from_edges(
+        pd.DataFrame({"source": ["A", "A", "B"], "target": ["B", "C", "A"]})
+    )
+
+    combined = graph.edge_combined_degree(["A", "B", "X"], ["B", "C", "A"])
+
+    assert graph.num_edges == 2
+    assert combined.tolist() == [3, 2, 2]
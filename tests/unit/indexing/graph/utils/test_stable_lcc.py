@@ -4,7 +4,11 @@ import unittest
 
 import networkx as nx
 
-from graphrag.index.utils.stable_lcc import stable_largest_connected_component
+from graphrag.index.utils.stable_lcc import (
+    _stabilize_graph,
+    normalize_node_names,
+    stable_largest_connected_component,
+)
 
 
 class TestStableLCC(unittest.TestCase):
@@ -46,6 +50,23 @@ class TestStableLCC(unittest.TestCase):
             nx.generate_graphml(graph_out_2)
         )
 
+    def test_matches_networkx_normalization_and_sort(self):
+        graph = nx.Graph()
+        # names whose edge keys sort differently from their (source, target) pairs
+        graph.add_edge(" a ", "z", weight=1)
+        graph.add_edge(" a ", "a !", weight=2)
+        graph.add_edge("a !", "b &amp; c", weight=3)
+        graph.add_edge("b &amp; c", "é", weight=4)
+        graph.add_edge("x", "y", weight=5)
+        graph.add_node("lonely", node_name=0)
+
+        lcc = graph.subgraph([" a ", "z", "a !", "b &amp; c", "é"])
+        expected = _stabilize_graph(normalize_node_names(lcc))
+        actual = stable_largest_connected_component(graph)
+
+        assert list(actual.nodes(data=True)) == list(expected.nodes(data=True))
+        assert list(actual.edges(data=True)) == list(expected.edges(data=True))
+
     def _create_strongly_connected_graph(self, digraph=False):
         graph = nx.Graph() if not digraph else nx.DiGraph()
         graph.add_node("1", node_name=1)
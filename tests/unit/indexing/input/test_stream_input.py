@@ -0,0 +1,55 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+from pathlib import Path
+from unittest import mock
+
+from graphrag.config.models.input_config import InputConfig
+from graphrag.index.input.factory import stream_input
+
+
+async def test_stream_input_batches_documents(tmp_path: Path):
+    (tmp_path / "input").mkdir()
+    for index in range(5):
+        (tmp_path / "input" / f"doc{index}.txt").write_text(f"document {index}")
+
+    batches = [
+        batch
+        async for batch in stream_input(
+            InputConfig(base_dir="input"), batch_documents=2, root_dir=str(tmp_path)
+        )
+    ]
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    titles = [title for batch in batches for title in batch["title"]]
+    assert sorted(titles) == [f"doc{index}.txt" for index in range(5)]
+
+
+class _WordEncoding:
+    def encode(self, text: str) -> list[str]:
+        return text.split()
+
+
+async def test_stream_input_batches_tokens(tmp_path: Path):
+    (tmp_path / "input").mkdir()
+    for index, words in enumerate([2, 2, 5, 1, 1]):
+        (tmp_path / "input" / f"doc{index}.txt").write_text("word " * words)
+
+    with mock.patch(
+        "graphrag.index.input.factory.tiktoken.get_encoding",
+        return_value=_WordEncoding(),
+    ):
+        batches = [
+            batch
+            async for batch in stream_input(
+                InputConfig(base_dir="input"),
+                batch_documents=10,
+                batch_tokens=4,
+                root_dir=str(tmp_path),
+            )
+        ]
+
+    tokens = [[len(text.split()) for text in batch["text"]] for batch in batches]
+    # a document over the limit gets a batch of its own
+    assert [5] in tokens
+    assert all(sum(batch) <= 4 for batch in tokens if batch != [5])
+    assert sorted(count for batch in tokens for count in batch) == [1, 1, 2, 2, 5]
@@ -0,0 +1,133 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import json
+
+import pandas as pd
+
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.enums import BatchBackendType, LLMType
+from graphrag.config.models.language_model_config import LanguageModelConfig
+from graphrag.index.llm.batch import BatchError, BatchScheduler, FileBatchBackend
+from graphrag.index.run.derive_from_rows import derive_from_rows
+
+
+def _completion(content: str) -> dict:
+    return {
+        "id": "completion",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "model",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+    }
+
+
+async def _respond(directory, fail: set[str] | None = None) -> None:
+    """Answer the first job written to `directory`, echoing each prompt."""
+    while not (jobs := list(directory.glob("*.jsonl"))):
+        await asyncio.sleep(0.01)
+    _answer(jobs[0], fail)
+
+
+def _answer(job, fail: set[str] | None = None) -> None:
+    records = []
+    for line in job.read_text().splitlines():
+        request = json.loads(line)
+        prompt = request["body"]["messages"][-1]["content"]
+        if fail and prompt in fail:
+            records.append({"custom_id": request["custom_id"], "error": "invalid"})
+        else:
+            records.append({
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "body": _completion(prompt.upper())},
+            })
+    output = job.with_name(job.name.replace(".jsonl", ".output.jsonl"))
+    output.write_text("\n".join(json.dumps(record) for record in records))
+
+
+async def test_collects_requests_into_one_job(tmp_path):
+    scheduler = BatchScheduler(
+        FileBatchBackend(tmp_path), "model", flush_interval=0.05, poll_interval=0.01
+    )
+
+    def request(prompt: str):
+        return scheduler.create(
+            messages=[{"role": "user", "content": prompt}], temperature=None
+        )
+
+    *completions, _ = await asyncio.gather(
+        request("a"), request("b"), _respond(tmp_path)
+    )
+
+    assert [c.choices[0].message.content for c in completions] == ["A", "B"]
+    [job] = [path for path in tmp_path.glob("*.jsonl") if "output" not in path.name]
+    bodies = [json.loads(line)["body"] for line in job.read_text().splitlines()]
+    assert bodies[0] == {
+        "messages": [{"role": "user", "content": "a"}],
+        "model": "model",
+    }
+
+
+async def test_failed_requests_raise(tmp_path):
+    scheduler = BatchScheduler(
+        FileBatchBackend(tmp_path), "model", max_size=2, poll_interval=0.01
+    )
+
+    def request(prompt: str):
+        return scheduler.create(messages=[{"role": "user", "content": prompt}])
+
+    ok, failed, _ = await asyncio.gather(
+        request("a"), request("b"), _respond(tmp_path, {"b"}), return_exceptions=True
+    )
+
+    assert ok.choices[0].message.content == "A"  # type: ignore
+    assert isinstance(failed, BatchError)
+
+
+async def test_batch_mode_submits_all_rows_in_one_job(tmp_path):
+    config = LanguageModelConfig(
+        type=LLMType.OpenAIChat,
+        model="gpt-4-turbo-preview",
+        api_key="test",
+        batch_backend=BatchBackendType.file,
+        parallelization_num_threads=2,
+    )
+    scheduler = BatchScheduler(
+        FileBatchBackend(tmp_path),
+        "model",
+        max_size=config.batch_max_size,
+        flush_interval=0.05,
+        poll_interval=0.01,
+    )
+    rows = pd.DataFrame({"prompt": [f"row {i}" for i in range(10)]})
+
+    async def transform(row: pd.Series) -> str:
+        completion = await scheduler.create(
+            messages=[{"role": "user", "content": row["prompt"]}]
+        )
+        return completion.choices[0].message.content
+
+    run = asyncio.create_task(
+        derive_from_rows(
+            rows, transform, NoopWorkflowCallbacks(), num_threads=config.num_threads()
+        )
+    )
+    # answer every job, so a split run finishes and fails the job count below
+    while not run.done():
+        for job in tmp_path.glob("*.jsonl"):
+            if (
+                "output" not in job.name
+                and not job.with_suffix(".output.jsonl").exists()
+            ):
+                _answer(job)
+        await asyncio.sleep(0.01)
+
+    assert await run == [f"ROW {i}" for i in range(10)]
+    jobs = [path for path in tmp_path.glob("*.jsonl") if "output" not in path.name]
+    assert len(jobs) == 1
@@ -0,0 +1,60 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+
+from pydantic import BaseModel
+
+from graphrag.index.llm.load_llm import CoalescingCacheInteractor
+
+
+class Response(BaseModel):
+    content: str
+
+
+async def test_identical_requests_share_one_call():
+    interactor = CoalescingCacheInteractor()
+    calls = []
+
+    async def call(content: str) -> Response:
+        calls.append(content)
+        await asyncio.sleep(0.01)
+        return Response(content=content)
+
+    def request(content: str):
+        return interactor.get_or_insert(
+            lambda: call(content),
+            prefix="chat",
+            key_data={"messages": [content]},
+            name=None,
+            json_model=Response,
+        )
+
+    responses = await asyncio.gather(request("a"), request("a"), request("b"))
+
+    assert [r.content for r in responses] == ["a", "a", "b"]
+    assert calls == ["a", "b"]
+
+
+async def test_waiting_requests_retry_when_the_first_one_fails():
+    interactor = CoalescingCacheInteractor()
+    attempts = 0
+
+    async def call() -> Response:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.01)
+        if attempts == 1:
+            msg = "throttled"
+            raise ValueError(msg)
+        return Response(content="ok")
+
+    def request():
+        return interactor.get_or_insert(
+            call, prefix="chat", key_data={}, name=None, json_model=Response
+        )
+
+    results = await asyncio.gather(request(), request(), return_exceptions=True)
+
+    assert isinstance(results[0], ValueError)
+    assert results[1] == Response(content="ok")
+    assert attempts == 2
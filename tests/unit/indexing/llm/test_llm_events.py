@@ -0,0 +1,67 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+
+from fnllm.limiting import Manifest
+
+from graphrag.config.models.language_model_config import LanguageModelConfig
+from graphrag.index.llm.load_llm import GraphRagLLMEvents, _create_request_slots
+
+
+def _config(deployment: str) -> LanguageModelConfig:
+    return LanguageModelConfig(
+        type="openai_chat",
+        model="gpt-4o",
+        api_key="key",
+        deployment_name=deployment,
+        concurrent_requests=2,
+    )
+
+
+async def test_llms_of_one_deployment_share_request_slots():
+    in_flight = 0
+    peak = 0
+
+    async def request(events: GraphRagLLMEvents) -> None:
+        nonlocal in_flight, peak
+        manifest = Manifest(request_tokens=1)
+        try:
+            await events.on_limit_acquired(manifest)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+        finally:
+            await events.on_limit_released(manifest)
+
+    # two workflows loading their own LLM for the same deployment
+    extract = GraphRagLLMEvents(
+        lambda *_: None, request_slots=_create_request_slots(_config("shared"))
+    )
+    reports = GraphRagLLMEvents(
+        lambda *_: None, request_slots=_create_request_slots(_config("shared"))
+    )
+    await asyncio.gather(*[request(events) for events in [extract, reports] * 4])
+
+    assert peak == 2
+    assert _create_request_slots(_config("other")) is not _create_request_slots(
+        _config("shared")
+    )
+
+
+async def test_cancelled_waits_do_not_release_a_slot():
+    slots = asyncio.Semaphore(1)
+    events = GraphRagLLMEvents(lambda *_: None, request_slots=slots)
+    holder = Manifest(request_tokens=1)
+    await events.on_limit_acquired(holder)
+
+    waiter = Manifest(request_tokens=1)
+    task = asyncio.create_task(events.on_limit_acquired(waiter))
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await events.on_limit_released(waiter)
+
+    assert slots.locked()
+    await events.on_limit_released(holder)
+    assert not slots.locked()
@@ -0,0 +1,84 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pytest
+from openai import InternalServerError, RateLimitError
+
+from graphrag.index.benchmark import _report, generate_corpus
+from graphrag.index.llm.simulated_llm import (
+    ENTITY_PATTERN,
+    LLMSimulation,
+    SimulatedClient,
+    SimulatedRequest,
+)
+from graphrag.index.operations.extract_graph.graph_extractor import (
+    DEFAULT_COMPLETION_DELIMITER,
+)
+
+
+def _client(**simulation) -> SimulatedClient:
+    return SimulatedClient(
+        LLMSimulation(latency_median=0.001, latency_sigma=0.0, **simulation),
+        tag=lambda: "workflow",
+    )
+
+
+async def test_extracts_the_entities_of_the_text():
+    client = _client()
+    prompt = "-Real Data-\nText: PERSON_1 met ORGANIZATION_2. GEO_3 was far."
+
+    response = await client.chat.completions.create(
+        messages=[{"role": "user", "content": prompt}]
+    )
+
+    content = response.choices[0].message.content
+    assert content.endswith(DEFAULT_COMPLETION_DELIMITER)
+    assert content.count('"entity"') == 3
+    assert content.count('"relationship"') == 1
+    assert [(r.tag, r.status) for r in client.requests] == [("workflow", 200)]
+
+
+async def test_rejects_requests_over_the_quota():
+    client = _client(requests_per_minute=1)
+    messages = [{"role": "user", "content": "hello"}]
+
+    await client.chat.completions.create(messages=messages)
+    with pytest.raises(RateLimitError, match="retry after"):
+        await client.chat.completions.create(messages=messages)
+
+    assert [r.status for r in client.requests] == [200, 429]
+
+
+async def test_injects_server_errors():
+    client = _client(error_rate=1.0)
+
+    with pytest.raises(InternalServerError):
+        await client.embeddings.create(input=["hello"])
+
+    assert [r.status for r in client.requests] == [500]
+
+
+def test_generate_corpus(tmp_path):
+    generate_corpus(tmp_path, num_documents=3, words_per_document=50)
+
+    documents = sorted(tmp_path.iterdir())
+    assert len(documents) == 3
+    assert all(ENTITY_PATTERN.search(d.read_text()) for d in documents)
+
+
+def test_report():
+    requests = [
+        SimulatedRequest("w", "chat", 0.0, 1.0, 200, 100),
+        SimulatedRequest("w", "chat", 0.5, 2.0, 200, 100),
+        SimulatedRequest("w", "chat", 1.5, 1.5, 429, 100),
+    ]
+
+    report = _report("w", 2.0, requests, limit=2)
+
+    assert report.requests == 3
+    assert report.errors == 1
+    assert report.throughput == 1.0
+    assert report.tokens_per_second == 100.0
+    assert report.mean_in_flight == 1.25
+    assert report.peak_in_flight == 2
+    assert report.utilization == 0.625
@@ -0,0 +1,76 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+
+from graphrag.index.operations.extract_graph.extract_graph import _pack_text_units
+from graphrag.index.operations.extract_graph.graph_extractor import (
+    _attribute_records,
+)
+
+
+def test_pack_text_units():
+    text_units = pd.DataFrame({
+        "id": ["a", "b", "c", "d"],
+        "text": ["A", "B", "C", "D"],
+        "n_tokens": [40, 50, 30, 200],
+    })
+
+    packs = _pack_text_units(text_units, "text", "id", max_tokens=100)
+
+    assert [[d.id for d in docs] for docs in packs["documents"]] == [
+        ["a", "b"],
+        ["c"],
+        ["d"],
+    ]
+    assert packs["n_tokens"].tolist() == [90, 30, 200]
+
+
+def test_pack_text_units_disabled():
+    text_units = pd.DataFrame({
+        "id": ["a", "b"],
+        "text": ["A", "B"],
+        "n_tokens": [1, 1],
+    })
+
+    packs = _pack_text_units(text_units, "text", "id", max_tokens=0)
+
+    assert [[d.id for d in docs] for docs in packs["documents"]] == [["a"], ["b"]]
+
+
+def test_attribute_records():
+    result = """
+    ("entity"<|>ALICE<|>PERSON<|>Alice works at Contoso)
+    ##
+    ("entity"<|>CONTOSO<|>ORGANIZATION<|>Contoso is a company)
+    ##
+    ("entity"<|>BOB<|>PERSON<|>Bob lives in Paris)
+    ##
+    ("relationship"<|>ALICE<|>CONTOSO<|>Alice works at Contoso<|>1)
+    ##
+    ("relationship"<|>ALICE<|>BOB<|>Alice knows Bob<|>1)
+    ##
+    ("entity"<|>UNKNOWN<|>PERSON<|>Not in any text)
+    ##
+    ("entity"<|>ART<|>CONCEPT<|>Bob likes art)
+    """.strip()
+    texts = [
+        "Alice works at Contoso, after the party.",
+        "Bob lives in Paris. Contoso is nearby. He likes art.",
+    ]
+
+    records = [r.split("##") for r in _attribute_records(result, texts, "<|>", "##")]
+
+    # ART is not matched inside "party", and ALICE -> BOB spans both texts
+    assert [r.split("<|>")[1] for r in records[0]] == [
+        "ALICE",
+        "CONTOSO",
+        "ALICE",
+        "UNKNOWN",
+    ]
+    assert [r.split("<|>")[1] for r in records[1]] == [
+        "CONTOSO",
+        "BOB",
+        "UNKNOWN",
+        "ART",
+    ]
@@ -0,0 +1,34 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.index.llm.mock_llm import MockChatLLM
+from graphrag.index.operations.summarize_descriptions.description_summary_extractor import (
+    BatchSummaryResponse,
+    SummarizeExtractor,
+    SummaryModel,
+)
+
+
+async def test_summarize_batch():
+    llm = MockChatLLM([
+        BatchSummaryResponse(
+            summaries=[
+                SummaryModel(id=0, description="A summary"),
+                SummaryModel(id=2, description="A and B summary"),
+            ]
+        )
+    ])
+    extractor = SummarizeExtractor(llm)
+
+    results = await extractor.summarize_batch([
+        ("A", ["a1", "a2"]),
+        ("B", ["b1"]),
+        (("A", "B"), ["ab1", "ab2"]),
+    ])
+
+    assert [(r.id, r.description) for r in results] == [
+        ("A", "A summary"),
+        ("B", "b1"),
+        (("A", "B"), "A and B summary"),
+    ]
+    assert llm.response_index == 1
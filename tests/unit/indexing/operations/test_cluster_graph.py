@@ -0,0 +1,61 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import networkx as nx
+
+from graphrag.index.operations.cluster_graph import cluster_graph, recluster_graph
+
+
+def _graph() -> nx.Graph:
+    # two dense components and a few small ones
+    graph = nx.Graph()
+    for prefix in ["A", "B"]:
+        dense = nx.connected_caveman_graph(4, 5)
+        graph.add_edges_from(
+            (f"{prefix}{source}", f"{prefix}{target}") for source, target in dense.edges
+        )
+    graph.add_edges_from([("C1", "C2"), ("C2", "C3"), ("D1", "D2")])
+    return graph
+
+
+def test_per_component_stitches_components():
+    graph = _graph()
+    clusters = cluster_graph(
+        graph,
+        max_cluster_size=5,
+        use_lcc=False,
+        seed=7,
+        per_component=True,
+        num_processes=1,
+    )
+
+    level_0 = [set(nodes) for level, _, _, nodes in clusters if level == 0]
+    assert set().union(*level_0) == set(graph.nodes)
+    assert sum(len(nodes) for nodes in level_0) == graph.number_of_nodes()
+    # small components are single communities, numbered after the larger ones
+    assert level_0[-2:] == [{"C1", "C2", "C3"}, {"D1", "D2"}]
+    ids = [community for _, community, _, _ in clusters]
+    assert sorted(ids) == list(range(len(ids)))
+    assert all(
+        parent == -1 or parent in ids for level, _, parent, _ in clusters if level > 0
+    )
+
+
+def test_recluster_keeps_untouched_communities():
+    graph = _graph()
+    previous = cluster_graph(graph, max_cluster_size=5, use_lcc=False, seed=7)
+    # a new node joins the B component only
+    graph.add_edge("B0", "NEW")
+
+    clusters, changed = recluster_graph(
+        graph, previous, {"B0"}, max_cluster_size=5, use_lcc=False, seed=7
+    )
+
+    untouched = [cluster for cluster in previous if not cluster[3][0].startswith("B")]
+    assert all(cluster in clusters for cluster in untouched)
+    assert not changed & {community for _, community, _, _ in untouched}
+    level_0 = [node for level, _, _, nodes in clusters if level == 0 for node in nodes]
+    assert sorted(level_0) == sorted(graph.nodes)
+    new = next(c for level, c, _, nodes in clusters if level == 0 and "NEW" in nodes)
+    assert new in changed
+    ids = [community for _, community, _, _ in clusters]
+    assert len(ids) == len(set(ids))
@@ -0,0 +1,79 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import pandas as pd
+
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.index.run.checkpoints import (
+    count_resumable_workflows,
+    fingerprint_workflows,
+)
+from graphrag.index.workflows import all_workflow_tables
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import write_table_to_storage
+from tests.unit.config.utils import DEFAULT_MODEL_CONFIG
+
+WORKFLOWS = [
+    "create_base_text_units",
+    "create_final_documents",
+    "extract_graph",
+    "create_communities",
+    "create_final_text_units",
+    "create_community_reports",
+]
+
+
+async def _fingerprints(settings: dict) -> dict[str, str | None]:
+    config = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG, **settings})
+    fingerprints = await fingerprint_workflows(
+        WORKFLOWS,
+        all_workflow_tables,
+        config,
+        MemoryPipelineStorage(),
+        table_hashes={"documents": "abc"},
+    )
+    return dict(zip(WORKFLOWS, fingerprints, strict=True))
+
+
+async def test_config_change_invalidates_downstream_workflows():
+    before = await _fingerprints({})
+    after = await _fingerprints({"cluster_graph": {"seed": 42}})
+
+    for name in ["create_base_text_units", "extract_graph", "create_final_text_units"]:
+        assert before[name] == after[name]
+    for name in ["create_communities", "create_community_reports"]:
+        assert before[name] != after[name]
+
+
+async def test_model_operational_settings_are_ignored():
+    models = {
+        key: {**value, "concurrent_requests": 1, "api_key": "other"}
+        for key, value in DEFAULT_MODEL_CONFIG.items()
+    }
+    assert await _fingerprints({}) == await _fingerprints({"models": models})
+
+
+async def test_resume_skips_up_to_date_prefix():
+    fingerprints = list((await _fingerprints({})).values())
+    storage = MemoryPipelineStorage()
+    table = pd.DataFrame({"id": ["1"]})
+    for name in ["text_units", "documents", "entities", "relationships"]:
+        await write_table_to_storage(table, name, storage)
+
+    checkpoints = dict(zip(WORKFLOWS[:3], fingerprints[:3], strict=True))
+    # a stale checkpoint after the first out of date workflow is not trusted
+    checkpoints[WORKFLOWS[4]] = fingerprints[4]
+
+    assert (
+        await count_resumable_workflows(
+            WORKFLOWS, all_workflow_tables, fingerprints, checkpoints, storage
+        )
+        == 3
+    )
+
+    await storage.delete("relationships.parquet")
+    assert (
+        await count_resumable_workflows(
+            WORKFLOWS, all_workflow_tables, fingerprints, checkpoints, storage
+        )
+        == 2
+    )
@@ -0,0 +1,146 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+
+import pandas as pd
+import pytest
+
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.enums import AsyncType
+from graphrag.index.run.derive_from_rows import (
+    ParallelizationError,
+    derive_from_rows,
+)
+from graphrag.index.run.failed_rows import (
+    RowFailurePolicy,
+    collect_failed_rows,
+    load_failed_rows,
+    write_failed_rows,
+)
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+
+
+@pytest.mark.parametrize(
+    "async_type", [AsyncType.AsyncIO, AsyncType.Threaded, AsyncType.Adaptive]
+)
+async def test_keeps_row_order_and_bounds_in_flight(async_type: AsyncType):
+    input = pd.DataFrame({"value": range(50)})
+    running = 0
+    peak = 0
+
+    async def transform(row: pd.Series) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (row["value"] % 3))
+        running -= 1
+        return row["value"] * 2
+
+    results = await derive_from_rows(
+        input, transform, NoopWorkflowCallbacks(), num_threads=4, async_type=async_type
+    )
+
+    assert results == [value * 2 for value in range(50)]
+    assert peak <= 4
+
+
+async def test_streams_results_to_sink():
+    input = pd.DataFrame({"value": range(10)})
+    received: dict[int, int] = {}
+
+    async def transform(row: pd.Series) -> int:
+        await asyncio.sleep(0)
+        return row["value"] + 1
+
+    results = await derive_from_rows(
+        input,
+        transform,
+        NoopWorkflowCallbacks(),
+        sink=lambda position, result: received.__setitem__(position, result),
+    )
+
+    assert results == []
+    assert received == {value: value + 1 for value in range(10)}
+
+
+async def test_starts_most_expensive_rows_first():
+    input = pd.DataFrame({"value": range(6), "n_tokens": [5, 50, 10, 50, 1, 20]})
+    started = []
+
+    async def transform(row: pd.Series) -> int:
+        await asyncio.sleep(0)
+        started.append(row["value"])
+        return row["value"]
+
+    results = await derive_from_rows(
+        input, transform, NoopWorkflowCallbacks(), num_threads=1, cost_column="n_tokens"
+    )
+
+    assert started == [1, 3, 5, 2, 0, 4]
+    assert results == list(range(6))
+
+
+async def test_raises_after_all_rows_ran():
+    input = pd.DataFrame({"value": range(5)})
+    seen = []
+
+    async def transform(row: pd.Series) -> int:
+        await asyncio.sleep(0)
+        seen.append(row["value"])
+        if row["value"] == 2:
+            raise ValueError
+        return row["value"]
+
+    with pytest.raises(ParallelizationError):
+        await derive_from_rows(input, transform, NoopWorkflowCallbacks())
+
+    assert sorted(seen) == list(range(5))
+
+
+async def test_retries_and_tolerates_failed_rows():
+    input = pd.DataFrame({"value": range(10)})
+    attempts: dict[int, int] = {}
+
+    async def transform(row: pd.Series) -> int:
+        await asyncio.sleep(0)
+        attempts[row["value"]] = attempts.get(row["value"], 0) + 1
+        # row 3 recovers on its retry, row 5 always fails
+        if row["value"] == 5 or (row["value"] == 3 and attempts[3] == 1):
+            raise ValueError
+        return row["value"]
+
+    policy = RowFailurePolicy(max_retries=1, retry_backoff=0, max_failure_rate=0.1)
+    with collect_failed_rows(policy) as failures:
+        results = await derive_from_rows(input, transform, NoopWorkflowCallbacks())
+
+    assert results == [None if value == 5 else value for value in range(10)]
+    assert attempts[3] == 2
+    assert attempts[5] == 2
+    assert [failure.row_index for failure in failures] == ["5"]
+
+    storage = MemoryPipelineStorage()
+    await write_failed_rows({"extract_graph": failures}, storage)
+    assert await load_failed_rows(storage) == {"extract_graph": failures}
+
+
+def _square(row: pd.Series) -> int:
+    if row["value"] == 7:
+        raise ValueError
+    return row["value"] ** 2
+
+
+async def test_process_pool_keeps_row_order_and_reports_errors():
+    input = pd.DataFrame({"value": range(40)})
+    received: dict[int, int | None] = {}
+
+    with pytest.raises(ParallelizationError):
+        await derive_from_rows(
+            input,
+            _square,
+            NoopWorkflowCallbacks(),
+            num_threads=2,
+            async_type=AsyncType.Process,
+            sink=lambda position, result: received.__setitem__(position, result),
+        )
+
+    assert received == {value: None if value == 7 else value**2 for value in range(40)}
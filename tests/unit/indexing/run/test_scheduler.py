@@ -0,0 +1,129 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+
+import pytest
+
+from graphrag.index.run.scheduler import (
+    resolve_workflow_dependencies,
+    run_workflows_concurrently,
+)
+from graphrag.index.typing import WorkflowTables
+from graphrag.index.workflows import all_workflow_tables
+
+
+def test_standard_pipeline_dependencies():
+    names = [
+        "create_base_text_units",
+        "create_final_documents",
+        "extract_graph",
+        "extract_covariates",
+        "create_communities",
+        "create_final_text_units",
+        "create_community_reports",
+        "generate_text_embeddings",
+    ]
+    dependencies = resolve_workflow_dependencies(names, all_workflow_tables)
+    named = [{names[i] for i in deps} for deps in dependencies]
+
+    assert named[2] == {"create_base_text_units"}
+    # covariates only need text units, so they can overlap graph extraction
+    assert named[3] == {"create_base_text_units"}
+    assert named[4] == {"extract_graph"}
+    # final text units overwrite text_units, so they wait for every reader
+    assert named[5] == {
+        "create_base_text_units",
+        "create_final_documents",
+        "extract_graph",
+        "extract_covariates",
+    }
+    assert "create_final_text_units" not in named[6]
+    assert named[7] == {
+        "create_final_documents",
+        "extract_graph",
+        "create_final_text_units",
+        "create_community_reports",
+    }
+
+
+def test_undeclared_workflow_is_a_barrier():
+    names = ["extract_graph", "custom", "extract_covariates"]
+    dependencies = resolve_workflow_dependencies(names, all_workflow_tables)
+    assert dependencies == [set(), {0}, {1}]
+
+
+def test_side_effect_writers_are_serialized():
+    tables = {
+        "embed_entities": WorkflowTables(
+            inputs=["entities"], outputs=[], side_effects=["vector_store"]
+        ),
+        "embed_reports": WorkflowTables(
+            inputs=["community_reports"], outputs=[], side_effects=["vector_store"]
+        ),
+    }
+    dependencies = resolve_workflow_dependencies(
+        ["embed_entities", "embed_reports"], tables
+    )
+    assert dependencies == [set(), {0}]
+
+
+async def test_independent_workflows_overlap():
+    running: set[str] = set()
+    overlapped: set[str] = set()
+
+    async def run(name, fn):
+        running.add(name)
+        await asyncio.sleep(0.01)
+        if len(running) > 1:
+            overlapped.update(running)
+        running.discard(name)
+        return name
+
+    workflows = [
+        ("create_base_text_units", None),
+        ("extract_graph", None),
+        ("extract_covariates", None),
+        ("create_communities", None),
+    ]
+    completed = [
+        name
+        async for name, _ in run_workflows_concurrently(
+            workflows,  # type: ignore
+            all_workflow_tables,
+            run,
+        )
+    ]
+
+    assert completed[0] == "create_base_text_units"
+    assert completed[-1] == "create_communities"
+    assert "create_base_text_units" not in overlapped
+    assert "create_communities" not in overlapped
+    assert {"extract_graph", "extract_covariates"} <= overlapped
+
+
+async def test_failure_cancels_running_workflows():
+    cancelled = []
+
+    async def run(name, fn):
+        if name == "extract_graph":
+            msg = "boom"
+            raise ValueError(msg)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(name)
+            raise
+
+    async def consume():
+        workflows = [("extract_graph", None), ("extract_covariates", None)]
+        async for _ in run_workflows_concurrently(
+            workflows,  # type: ignore
+            all_workflow_tables,
+            run,
+        ):
+            pass
+
+    with pytest.raises(ValueError, match="boom"):
+        await consume()
+
+    assert cancelled == ["extract_covariates"]
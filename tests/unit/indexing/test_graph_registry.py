@@ -0,0 +1,80 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import networkx as nx
+import pandas as pd
+
+from graphrag.index.graph_registry import GraphRegistry
+from graphrag.index.operations.create_graph import create_graph
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+
+
+def _relationships() -> pd.DataFrame:
+    return pd.DataFrame({
+        "source": ["a", "b", "a", "d"],
+        "target": ["b", "c", "b", "é"],
+        "weight": [1.0, 2.0, 3.0, 4.0],
+    })
+
+
+def test_get_shares_graph_across_finalization():
+    registry = GraphRegistry()
+    extracted = _relationships()
+    # finalization drops duplicate pairs and adds columns
+    final = extracted.drop_duplicates(subset=["source", "target"]).assign(
+        combined_degree=0
+    )
+
+    graph = registry.get(extracted)
+
+    assert registry.get(final) is graph
+    assert registry.get(extracted.iloc[:2]) is not graph
+
+
+async def test_load_reads_saved_graph():
+    storage = MemoryPipelineStorage()
+    relationships = _relationships()
+    saved = GraphRegistry(storage).get(relationships)
+    await GraphRegistry(storage).save(relationships)
+
+    loaded = await GraphRegistry(storage).load(relationships)
+
+    assert loaded.nodes.tolist() == saved.nodes.tolist()
+    assert loaded.sources.tolist() == saved.sources.tolist()
+    assert loaded.targets.tolist() == saved.targets.tolist()
+    assert sorted(loaded.to_networkx().edges) == sorted(saved.to_networkx().edges)
+
+
+async def test_load_ignores_graph_of_other_relationships():
+    storage = MemoryPipelineStorage()
+    await GraphRegistry(storage).save(_relationships().iloc[:2])
+
+    graph = await GraphRegistry(storage).load(_relationships())
+
+    assert graph.num_nodes == 5
+
+
+def test_release_drops_graph():
+    registry = GraphRegistry()
+    relationships = _relationships()
+    graph = registry.get(relationships)
+
+    registry.release(relationships)
+
+    assert registry.get(relationships) is not graph
+
+
+def test_graphml_snapshot_matches_networkx_graph():
+    relationships = pd.read_parquet("tests/verbs/data/relationships.parquet")
+    # repeated and reversed pairs keep the first orientation and position
+    relationships = pd.concat([
+        relationships,
+        relationships.iloc[::7].rename(
+            columns={"source": "target", "target": "source"}
+        ),
+        relationships.iloc[::5],
+    ])
+
+    expected = nx.generate_graphml(create_graph(relationships))
+    actual = nx.generate_graphml(GraphRegistry().get(relationships).to_networkx())
+
+    assert "\n".join(actual) == "\n".join(expected)
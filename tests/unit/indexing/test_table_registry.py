@@ -0,0 +1,78 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+from io import BytesIO
+
+import pandas as pd
+
+from graphrag.index.table_registry import TableRegistry
+from graphrag.index.table_spill import TableSpill
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+
+
+def _table() -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": ["a", "b"],
+        "n_tokens": [1, 2],
+        "entity_ids": [["x", "y"], ["z"]],
+    })
+
+
+async def test_get_matches_parquet_round_trip():
+    registry = TableRegistry(MemoryPipelineStorage())
+    table = _table()
+    await registry.set("text_units", table)
+
+    actual = await registry.get("text_units")
+    expected = pd.read_parquet(BytesIO(table.to_parquet()))
+
+    assert actual.dtypes.equals(expected.dtypes)
+    assert type(actual["entity_ids"][0]) is type(expected["entity_ids"][0])
+    assert actual["entity_ids"].map(list).tolist() == [["x", "y"], ["z"]]
+
+
+async def test_registered_table_is_isolated_from_edits():
+    registry = TableRegistry(MemoryPipelineStorage())
+    table = _table()
+    await registry.set("text_units", table)
+    table.loc[0, "n_tokens"] = 100
+
+    first = await registry.get("text_units")
+    first.loc[1, "n_tokens"] = 200
+
+    assert (await registry.get("text_units"))["n_tokens"].tolist() == [1, 2]
+
+
+async def test_write_behind_reaches_storage_in_order():
+    storage = MemoryPipelineStorage()
+    registry = TableRegistry(storage, write_behind=True)
+    await registry.set("text_units", _table())
+    await registry.set("text_units", _table().head(1))
+    await registry.flush()
+
+    assert len(await load_table_from_storage("text_units", storage)) == 1
+
+
+async def test_falls_back_to_storage():
+    storage = MemoryPipelineStorage()
+    await write_table_to_storage(_table(), "entities", storage)
+    registry = TableRegistry(storage)
+
+    assert await registry.has("entities")
+    assert not await registry.has("relationships")
+    assert len(await registry.get("entities")) == 2
+
+
+async def test_set_spill_combines_parts_into_storage(tmp_path):
+    for storage in [MemoryPipelineStorage(), FilePipelineStorage(str(tmp_path))]:
+        spill = TableSpill(storage.child("streaming"), "text_units")
+        await spill.append(_table())
+        # a later batch without the list column
+        await spill.append(pd.DataFrame({"id": ["c"], "n_tokens": [3]}))
+        await TableRegistry(storage).set_spill("text_units", spill)
+
+        table = await load_table_from_storage("text_units", storage)
+
+        assert table["id"].tolist() == ["a", "b", "c"]
+        assert table["entity_ids"].isna().tolist() == [False, False, True]
@@ -0,0 +1,43 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+
+import pandas as pd
+
+from graphrag.index.table_registry import TableRegistry
+from graphrag.index.workflow_stats import (
+    collect_workflow_stats,
+    current_workflow_stats,
+)
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+
+
+async def test_counts_table_rows_in_child_tasks():
+    registry = TableRegistry(MemoryPipelineStorage())
+    await registry.set("entities", pd.DataFrame({"id": ["a", "b", "c"]}))
+
+    async def workflow():
+        entities = await registry.get("entities")
+        await registry.set("communities", entities.head(1))
+
+    with collect_workflow_stats() as stats:
+        await asyncio.gather(workflow())
+
+    assert stats.rows_in == 3
+    assert stats.rows_out == 1
+    assert stats.overall > 0
+    assert current_workflow_stats() is None
+
+
+async def test_concurrent_workflows_keep_separate_stats():
+    async def workflow(calls: int):
+        with collect_workflow_stats() as stats:
+            for _ in range(calls):
+                await asyncio.sleep(0)
+                current_workflow_stats().llm_calls += 1  # type: ignore
+        return stats
+
+    first, second = await asyncio.gather(workflow(2), workflow(5))
+
+    assert first.llm_calls == 2
+    assert second.llm_calls == 5
@@ -0,0 +1,104 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import networkx as nx
+import pandas as pd
+
+from graphrag.index.flows.create_communities import create_communities
+from graphrag.index.update.communities import (
+    _merge_regenerated_community_reports,
+    _recluster_and_merge_communities,
+)
+
+
+def _tables(edges: list[tuple[str, str]]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    relationships = pd.DataFrame(
+        [
+            (f"r-{source}-{target}", source, target, 1.0, [f"t-{source}"])
+            for source, target in edges
+        ],
+        columns=["id", "source", "target", "weight", "text_unit_ids"],
+    )
+    titles = sorted({node for edge in edges for node in edge})
+    entities = pd.DataFrame({"id": [f"e-{title}" for title in titles], "title": titles})
+    return entities, relationships
+
+
+def _edges() -> list[tuple[str, str]]:
+    edges = []
+    for prefix in ["A", "B"]:
+        dense = nx.connected_caveman_graph(4, 5)
+        edges += [
+            (f"{prefix}{source}", f"{prefix}{target}") for source, target in dense.edges
+        ]
+    return edges
+
+
+def _reports(communities: pd.DataFrame) -> pd.DataFrame:
+    reports = communities.loc[:, ["community", "parent", "level", "period", "size"]]
+    reports["id"] = "report-" + reports["community"].astype(str)
+    reports["human_readable_id"] = reports["community"]
+    reports["title"] = "Report " + reports["community"].astype(str)
+    for column in ["summary", "full_content", "rank_explanation", "full_content_json"]:
+        reports[column] = ""
+    reports["rank"] = 1.0
+    reports["findings"] = [[] for _ in range(len(reports))]
+    return reports
+
+
+def test_recluster_and_merge_keeps_untouched_communities():
+    entities, relationships = _tables(_edges())
+    old_communities = create_communities(
+        entities, relationships, max_cluster_size=5, use_lcc=False, seed=7
+    )
+    delta_entities, delta_relationships = _tables([("B0", "NEW")])
+    merged_entities = pd.concat(
+        [entities, delta_entities.loc[delta_entities["title"] == "NEW"]],
+        ignore_index=True,
+    )
+    merged_relationships = pd.concat(
+        [relationships, delta_relationships], ignore_index=True
+    )
+
+    merged, changed = _recluster_and_merge_communities(
+        old_communities,
+        merged_entities,
+        merged_relationships,
+        delta_entities.loc[delta_entities["title"] == "NEW"],
+        delta_relationships,
+        max_cluster_size=5,
+        use_lcc=False,
+        seed=7,
+    )
+
+    assert merged["community"].is_unique
+    assert changed <= set(merged["community"])
+    new = merged.loc[merged["entity_ids"].apply(lambda ids: "e-NEW" in ids)]
+    assert set(new["community"]) <= changed
+    # the communities of the A component keep their rows, ids included
+    a_ids = set(entities.loc[entities["title"].str.startswith("A"), "id"])
+    untouched = old_communities.loc[
+        old_communities["entity_ids"].apply(lambda ids: set(ids) <= a_ids)
+    ]
+    kept = merged.set_index("id").loc[untouched["id"]]
+    assert kept["community"].tolist() == untouched["community"].tolist()
+    assert not changed & set(untouched["community"])
+
+
+def test_merge_regenerated_community_reports():
+    entities, relationships = _tables(_edges())
+    communities = create_communities(
+        entities, relationships, max_cluster_size=5, use_lcc=False, seed=7
+    )
+    old_reports = _reports(communities)
+    # the first community was dropped, the second regenerated
+    remaining = communities.iloc[1:]
+    regenerated = _reports(remaining.iloc[:1])
+    regenerated["title"] = "Regenerated"
+
+    merged = _merge_regenerated_community_reports(old_reports, regenerated, remaining)
+
+    assert merged["community"].tolist() == sorted(remaining["community"])
+    titles = merged.set_index("community")["title"]
+    assert titles[remaining["community"].iloc[0]] == "Regenerated"
+    assert (titles.drop(remaining["community"].iloc[0]) != "Regenerated").all()
+    assert communities["community"].iloc[0] not in titles.index
@@ -0,0 +1,60 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+
+from graphrag.index.utils.adaptive_limiter import (
+    AdaptiveConcurrencyLimiter,
+    report_throttled,
+)
+
+
+async def _run(limiter: AdaptiveConcurrencyLimiter, num_calls: int, throttled=False):
+    running = 0
+    peak = 0
+
+    async def call():
+        nonlocal running, peak
+        async with limiter:
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            if throttled:
+                report_throttled()
+            running -= 1
+
+    await asyncio.gather(*[call() for _ in range(num_calls)])
+    return peak
+
+
+async def test_grows_while_healthy_up_to_max():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=16, initial_limit=2)
+
+    peak = await _run(limiter, 200)
+
+    assert limiter.limit == 16
+    assert peak == 16
+
+
+async def test_backs_off_when_throttled():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=16, initial_limit=16)
+
+    await _run(limiter, 4, throttled=True)
+
+    # calls started before the first decrease do not cut the limit again
+    assert limiter.limit == 8
+
+
+async def test_backs_off_on_rate_limit_errors():
+    class RateLimitError(Exception):
+        status_code = 429
+
+    limiter = AdaptiveConcurrencyLimiter(max_limit=16, initial_limit=8)
+
+    async def call():
+        async with limiter:
+            raise RateLimitError
+
+    results = await asyncio.gather(call(), return_exceptions=True)
+
+    assert isinstance(results[0], RateLimitError)
+    assert limiter.limit == 4
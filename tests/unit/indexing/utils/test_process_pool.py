@@ -0,0 +1,13 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import pandas as pd
+
+from graphrag.index.utils.process_pool import parallel_apply
+
+
+def test_parallel_apply_matches_series_apply():
+    values = pd.Series([f"text {i}" for i in range(100)], index=range(100, 200))
+
+    result = parallel_apply(values, str.upper, num_workers=2, batch_size=8)
+
+    pd.testing.assert_series_equal(result, values.apply(str.upper))
@@ -0,0 +1,56 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+import asyncio
+import sqlite3
+
+from graphrag.index.utils.rate_limiter import RateLimiter, get_rate_limiter
+
+
+def test_waits_once_a_budget_is_spent():
+    limiter = RateLimiter("deployment", requests_per_minute=2, tokens_per_minute=100)
+
+    assert limiter.try_acquire(60) == 0
+    # the tokens run out before the requests do
+    assert limiter.try_acquire(60) > 0
+    assert limiter.try_acquire(40) == 0
+    assert limiter.try_acquire(0) > 0
+
+
+def test_post_request_tokens_are_taken_as_debt():
+    limiter = RateLimiter("deployment", requests_per_minute=0, tokens_per_minute=60)
+
+    limiter.consume(90)
+
+    # 30 tokens owed, plus 10 more, refill at one token a second
+    assert 39 < limiter.try_acquire(10) <= 40
+
+
+def test_processes_share_budgets_through_a_state_file(tmp_path):
+    path = tmp_path / "rate_limits.db"
+    first = RateLimiter("deployment", 0, 100, state_path=path)
+    second = RateLimiter("deployment", 0, 100, state_path=path)
+
+    assert first.try_acquire(80) == 0
+    assert second.try_acquire(80) > 0
+
+
+def test_limiters_are_shared_by_deployment():
+    limiter = get_rate_limiter("shared-deployment", 10, 1000)
+
+    assert get_rate_limiter("shared-deployment", 20, 2000) is limiter
+    assert get_rate_limiter("other-deployment", 10, 1000) is not limiter
+
+
+async def test_shared_acquire_does_not_block_the_event_loop(tmp_path):
+    path = tmp_path / "rate_limits.db"
+    limiter = RateLimiter("deployment", 0, 100, state_path=path)
+    # another process holds the state file
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+
+    acquire = asyncio.create_task(limiter.acquire(10))
+    await asyncio.sleep(0.2)
+    assert not acquire.done()
+
+    other.execute("COMMIT")
+    await asyncio.wait_for(acquire, timeout=5)
@@ -0,0 +1,129 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.config.enums import LLMType
+from graphrag.index.flows.extract_graph_streaming import (
+    _merge_partial_entities,
+    _merge_partial_relationships,
+    extract_graph_streaming,
+)
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+
+from .test_extract_graph import (
+    MOCK_LLM_ENTITY_RESPONSES,
+    MOCK_LLM_SUMMARIZATION_RESPONSES,
+)
+from .util import DEFAULT_MODEL_CONFIG
+
+
+def test_merge_partial_entities_across_batches():
+    first = pd.DataFrame({
+        "title": ["A", "B"],
+        "type": ["PERSON", "PERSON"],
+        "description": [["a1"], ["b1"]],
+        "text_unit_ids": [["t1"], ["t1"]],
+    })
+    second = pd.DataFrame({
+        "title": ["A", "A"],
+        "type": ["PERSON", "COMPANY"],
+        "description": [["a2", "a3"], ["a4"]],
+        "text_unit_ids": [["t2"], ["t3"]],
+    })
+
+    merged = _merge_partial_entities([first, second])
+
+    assert merged[["title", "type"]].to_numpy().tolist() == [
+        ["A", "PERSON"],
+        ["B", "PERSON"],
+        ["A", "COMPANY"],
+    ]
+    assert merged["description"].tolist() == [["a1", "a2", "a3"], ["b1"], ["a4"]]
+    assert merged["text_unit_ids"].tolist() == [["t1", "t2"], ["t1"], ["t3"]]
+
+
+def test_merge_partial_relationships_sums_weights():
+    first = pd.DataFrame({
+        "source": ["A", "A"],
+        "target": ["B", "C"],
+        "description": [["ab1"], ["ac1"]],
+        "text_unit_ids": [["t1"], ["t1"]],
+        "weight": [1.0, 2.0],
+    })
+    second = pd.DataFrame({
+        "source": ["A", "B"],
+        "target": ["B", "A"],
+        "description": [["ab2"], ["ba1"]],
+        "text_unit_ids": [["t2"], ["t2"]],
+        "weight": [3.0, 4.0],
+    })
+
+    merged = _merge_partial_relationships([first, second])
+
+    # pairs are directed as extracted, so B->A stays apart from A->B
+    assert merged[["source", "target"]].to_numpy().tolist() == [
+        ["A", "B"],
+        ["A", "C"],
+        ["B", "A"],
+    ]
+    assert merged["description"].tolist() == [["ab1", "ab2"], ["ac1"], ["ba1"]]
+    assert merged["text_unit_ids"].tolist() == [["t1", "t2"], ["t1"], ["t2"]]
+    assert merged["weight"].tolist() == [4.0, 2.0, 4.0]
+
+
+async def test_extract_graph_streaming_merges_batches():
+    config = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
+    extract_llm_settings = config.get_language_model_config(
+        config.extract_graph.model_id
+    ).model_dump()
+    extract_llm_settings["type"] = LLMType.StaticResponse
+    extract_llm_settings["responses"] = MOCK_LLM_ENTITY_RESPONSES
+    summarize_llm_settings = config.get_language_model_config(
+        config.summarize_descriptions.model_id
+    ).model_dump()
+    summarize_llm_settings["type"] = LLMType.StaticResponse
+    summarize_llm_settings["responses"] = MOCK_LLM_SUMMARIZATION_RESPONSES
+    documents = pd.DataFrame({
+        "id": [f"doc{index}" for index in range(5)],
+        "title": [f"doc{index}.txt" for index in range(5)],
+        "text": [f"Company_A and Person_C, part {index}." for index in range(5)],
+    })
+
+    async def batches():  # noqa RUF029 async is required for interface
+        for start in range(0, len(documents), 2):
+            yield documents.iloc[start : start + 2].reset_index(drop=True)
+
+    (
+        final_documents,
+        text_units,
+        entities,
+        relationships,
+    ) = await extract_graph_streaming(
+        batches=batches(),
+        storage=MemoryPipelineStorage(),
+        callbacks=NoopWorkflowCallbacks(),
+        cache=None,  # type: ignore
+        chunks=config.chunks,
+        extraction_strategy={
+            "type": "graph_intelligence",
+            "llm": extract_llm_settings,
+        },
+        summarization_strategy={
+            "type": "graph_intelligence",
+            "llm": summarize_llm_settings,
+        },
+    )
+
+    assert final_documents.num_parts == 3
+    document_parts = [part async for part in final_documents.parts()]
+    human_readable_ids = pd.concat(document_parts)["human_readable_id"].tolist()
+    assert human_readable_ids == [1, 2, 3, 4, 5]
+    # every batch extracts the same graph, merged once across batches
+    assert sorted(entities["title"]) == ["COMPANY_A", "COMPANY_B", "PERSON_C"]
+    assert len(relationships) == 2
+    unit_ids = [unit_id async for part in text_units.parts() for unit_id in part["id"]]
+    for ids in [*entities["text_unit_ids"], *relationships["text_unit_ids"]]:
+        assert sorted(ids) == sorted(unit_ids)
@@ -18,7 +18,7 @@ from .util import (
 )
 
 
-async def test_generate_text_embeddings():
+async def test_generate_text_embeddings(tmp_path):
     context = await create_test_context(
         storage=[
             "documents",
@@ -29,7 +29,10 @@ async def test_generate_text_embeddings():
         ]
     )
 
-    config = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
+    # the default LanceDB store resolves against the root directory
+    config = create_graphrag_config(
+        {"models": DEFAULT_MODEL_CONFIG}, root_dir=str(tmp_path)
+    )
     llm_settings = config.get_language_model_config(
         config.embed_text.model_id
     ).model_dump()